@@ -0,0 +1,82 @@
+"""Event Broker Load Benchmark
+
+Votes on an event at a steady rate while thousands of local subscribers, some of them slow, read its updates through
+the event broker. Reports how many broadcasts the votes became, how long publishing took, and how many updates the
+fast and the slow subscribers received.
+
+Usage:
+    poetry run python benchmarks/bench_broker.py [--subscribers 5000] [--slow 0.1] [--rate 1000] [--seconds 3]
+"""
+import argparse
+import asyncio
+import datetime
+import statistics
+import time
+
+import orjson
+
+from pymeet.adapters.broker import EventBroker, Subscription
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.schemas import project_event
+
+
+async def consume(subscription: Subscription, delay: float) -> int:
+    """
+    Reads updates until the subscription closes, waiting a while after each one, and returns how many it read.
+    """
+    received = 0
+    async for _ in subscription:
+        received += 1
+        if delay:
+            await asyncio.sleep(delay)
+    return received
+
+
+async def run(subscribers: int, slow: float, rate: int, seconds: float, window: float):
+    broker = EventBroker(render=lambda event: orjson.dumps(project_event(event)), window=window)
+    users = [User(f"user{i}", f"user{i}@mail.com", "password") for i in range(rate)]
+    options = [MeetingEventOption(date=datetime.date(2023, 1, 1), hour=hour) for hour in range(24)]
+    event = MeetingEvent(name="All Hands", options=options, attendees=set(users))
+
+    slow_count = int(subscribers * slow)
+    consumers = [asyncio.create_task(consume(broker.subscribe(event.id), 1.0 if i < slow_count else 0))
+                 for i in range(subscribers)]
+
+    latencies = []
+    started = time.perf_counter()
+    for vote in range(int(rate * seconds)):
+        event.vote(users[vote % len(users)], options[vote % len(options)])
+        start = time.perf_counter()
+        broker.publish(event.id, event)
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(max(0.0, started + (vote + 1) / rate - time.perf_counter()))
+    elapsed = time.perf_counter() - started
+
+    broker.close(event.id, event)
+    received = await asyncio.gather(*consumers)
+
+    latencies.sort()
+    print(f"votes          {len(latencies)} in {elapsed:.2f} s")
+    print(f"broadcasts     {broker.broadcasts}")
+    print(f"publish us     p50 {statistics.median(latencies) * 1e6:.2f}  "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1e6:.2f}  max {latencies[-1] * 1e6:.2f}")
+    if slow_count < subscribers:
+        print(f"fast updates   {statistics.mean(received[slow_count:]):.1f} per subscriber")
+    if slow_count:
+        print(f"slow updates   {statistics.mean(received[:slow_count]):.1f} per subscriber")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--subscribers", type=int, default=5000)
+    parser.add_argument("--slow", type=float, default=0.1, help="Share of subscribers taking a second per update.")
+    parser.add_argument("--rate", type=int, default=1000, help="Votes per second.")
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--window", type=float, default=0.1)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.subscribers, args.slow, args.rate, args.seconds, args.window))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Import Time Benchmark
+
+Measures the cold start of a worker in fresh interpreters: importing `pymeet.main`, which builds nothing, then building
+the application with the factory uvicorn calls, next to a bare interpreter start. Each figure is the best and the
+median of a few runs. The breakdown lists the top-level packages the application imports beyond those a bare
+interpreter does, by cumulative import time as reported by `python -X importtime`: a package counts the packages it
+imports first.
+
+Usage:
+    poetry run python benchmarks/bench_import.py [--runs 10] [--breakdown 15]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SOURCES = Path(__file__).resolve().parent.parent / "src"
+
+STAGES = {
+    "interpreter": "pass",
+    "import pymeet.main": "import pymeet.main",
+    "create_app()": "import pymeet.main; pymeet.main.create_app()",
+}
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SOURCES), os.environ.get("PYTHONPATH")]))}
+
+
+def measure(code: str, runs: int) -> list[float]:
+    timings = []
+
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], env=_env(), check=True)
+        timings.append(time.perf_counter() - start)
+
+    return timings
+
+
+def breakdown(code: str) -> list[tuple[str, int]]:
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", code], env=_env(), check=True,
+                            capture_output=True, text=True)
+    packages = []
+
+    for line in result.stderr.splitlines()[1:]:
+        _, cumulative, name = line.split("|")
+        if "." not in name and not name.strip().startswith("_"):
+            packages.append((name.strip(), int(cumulative)))
+
+    return sorted(packages, key=lambda package: -package[1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=10, help="Interpreters started per stage.")
+    parser.add_argument("--breakdown", type=int, default=15, help="Packages listed, 0 skips the breakdown.")
+    args = parser.parse_args()
+
+    print(f"{'stage':<20} {'best ms':>9} {'median ms':>10}")
+    for stage, code in STAGES.items():
+        timings = measure(code, args.runs)
+        print(f"{stage:<20} {min(timings) * 1000:>9.1f} {statistics.median(timings) * 1000:>10.1f}")
+
+    if args.breakdown:
+        print(f"\n{'package':<30} {'import ms':>10}")
+        preloaded = {package for package, _ in breakdown(STAGES["interpreter"])}
+        packages = [(package, cumulative) for package, cumulative in breakdown(STAGES["create_app()"])
+                    if package not in preloaded]
+
+        for package, cumulative in packages[:args.breakdown]:
+            print(f"{package:<30} {cumulative / 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Vote Journal Benchmark
+
+Votes on events through the meeting event service with the event journal enabled, from many concurrent clients each
+waiting for its vote to be durable before the next one. Clients start on different events, as votes for the same event
+wait for each other to be durable. Reports the votes per second, the fsyncs per second and the vote latency at
+different commit windows, next to a single client whose every vote needs its own fsync.
+
+Usage:
+    poetry run python benchmarks/bench_journal.py [--clients 256] [--seconds 3] [--windows 0 0.001 0.002 0.005 0.01]
+"""
+import argparse
+import asyncio
+import datetime
+import statistics
+import tempfile
+import time
+
+from pymeet.adapters.journal import EventJournal
+from pymeet.adapters.repository import (AsyncUserRepositoryAdapter, InMemoryMeetingEventRepository,
+                                        InMemoryUserRepository)
+from pymeet.domain.models import User
+from pymeet.services.events import MeetingEventService
+
+DAY = datetime.date(2023, 1, 1)
+EVENTS = 64
+
+
+async def client(service: MeetingEventService, events: list[str], username: str, first: int, deadline: float,
+                 latencies: list[float]):
+    """
+    Votes back and forth between two options of every event from the first one until the deadline, one durable vote at
+    a time.
+    """
+    vote = first
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        await service.vote(event_id=events[vote % len(events)], voter=username, date=DAY,
+                           hour=9 + (vote // len(events)) % 2)
+        latencies.append(time.perf_counter() - start)
+        vote += 1
+
+
+async def run(clients: int, seconds: float, window: float):
+    users = InMemoryUserRepository([User(f"user{i}", f"user{i}@mail.com", "password") for i in range(clients)])
+    usernames = [user.username for user in users.find_all()]
+
+    with tempfile.TemporaryDirectory() as directory:
+        journal = EventJournal(directory, commit_window=window)
+        repository = InMemoryMeetingEventRepository()
+        journal.open(repository, users.find_by_username)
+        service = MeetingEventService(event_repository=repository,
+                                      user_repository=AsyncUserRepositoryAdapter(users),
+                                      journal=journal)
+        events = [(await service.create(name=f"event{i}", organizer=usernames[0], options=[(DAY, 9), (DAY, 10)],
+                                        attendees=usernames)).id for i in range(EVENTS)]
+        commits = journal.commits
+
+        latencies: list[float] = []
+        deadline = time.perf_counter() + seconds
+        await asyncio.gather(*(client(service, events, username, i % EVENTS, deadline, latencies)
+                               for i, username in enumerate(usernames)))
+        await journal.close()
+
+    latencies.sort()
+    return (len(latencies) / seconds, (journal.commits - commits) / seconds, statistics.median(latencies) * 1000,
+            latencies[int(len(latencies) * 0.99)] * 1000)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--clients", type=int, default=256)
+    parser.add_argument("--seconds", type=float, default=3)
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 0.001, 0.002, 0.005, 0.01],
+                        help="Commit windows, in seconds.")
+    args = parser.parse_args()
+
+    print(f"{'clients':>7} {'window ms':>9} {'votes/s':>9} {'fsyncs/s':>9} {'p50 ms':>7} {'p99 ms':>7}")
+    runs = [(1, 0)] + [(args.clients, window) for window in args.windows]
+    for clients, window in runs:
+        votes, fsyncs, p50, p99 = asyncio.run(run(clients, args.seconds, window))
+        print(f"{clients:>7} {window * 1000:>9g} {votes:>9.0f} {fsyncs:>9.0f} {p50:>7.2f} {p99:>7.2f}")
+
+
+if __name__ == "__main__":
+    main()
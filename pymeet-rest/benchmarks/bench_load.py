@@ -0,0 +1,312 @@
+"""HTTP Load Harness
+
+Starts one uvicorn worker serving pymeet.main:app in a subprocess, seeds it with generated users and events, and runs a
+mixed workload from concurrent clients for a while. Reports the throughput, the statuses and the p50, p95 and p99
+latency of each route, and writes them as a JSON report.
+
+Passwords are stored plain unless --bcrypt is given, so everything but hashing is measured. Users are seeded through
+the batch endpoint, so seeding a million of them takes a few minutes. The clients run in a single process, give them
+cores of their own or point --url to a server started elsewhere with the same --secret, otherwise they compete with the
+worker for the CPU.
+
+Usage:
+    poetry run python benchmarks/bench_load.py [--users 100000] [--events 1000] [--attendees 50] [--concurrency 64]
+        [--seconds 30] [--mix register=1,users=2,login=1,event=3,events=2,vote=6] [--report load-report.json]
+"""
+import argparse
+import asyncio
+import datetime
+import os
+import random
+import secrets
+import socket
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+
+import httpx
+import orjson
+
+from pymeet.services.tokens import TokenService
+
+PASSWORD = "load-password"
+USER_BATCH_SIZE = 5000
+OPTIONS = [{"date": (datetime.date(2030, 1, 1) + datetime.timedelta(days=day)).isoformat(), "hour": hour}
+           for day in range(2) for hour in (9, 14, 17)]
+SOURCES = Path(__file__).resolve().parents[1] / "src"
+
+
+def generate_users(count: int, prefix: str = "load") -> Iterator[dict]:
+    """
+    Generates users to register, numbered from 0.
+    """
+    for i in range(count):
+        yield {"username": f"{prefix}{i}", "email": f"{prefix}{i}@example.com", "password1": PASSWORD,
+               "password2": PASSWORD}
+
+
+def generate_events(count: int, users: int, attendees: int, rng: random.Random) -> Iterator[tuple[str, dict]]:
+    """
+    Generates events to create, each one organized by a random user and attended by other random users.
+    """
+    for i in range(count):
+        chosen = rng.sample(range(users), min(attendees, users))
+        yield f"load{chosen[0]}", {"name": f"Load Event {i}", "options": OPTIONS,
+                                   "attendees": [f"load{user}" for user in chosen[1:]]}
+
+
+@contextmanager
+def serve(app: str, secret: str, bcrypt: bool, journal: str | None) -> Iterator[str]:
+    """
+    Runs the application under uvicorn in a subprocess, yielding its base URL once it answers.
+    """
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+
+    env = {**os.environ,
+           "PYTHONPATH": os.pathsep.join(filter(None, [str(SOURCES), os.environ.get("PYTHONPATH")])),
+           "FASTAPI_DEBUG": "false",
+           "FASTAPI_USE_SQLITE": "false",
+           "FASTAPI_SECRET_KEY": secret,
+           "FASTAPI_PASSWORD_ENCODER": "bcrypt" if bcrypt else "plain",
+           "FASTAPI_HASHING_QUEUE_SIZE": str(4 * USER_BATCH_SIZE),
+           "FASTAPI_JOURNAL_DIRECTORY": journal or ""}
+    server = subprocess.Popen([sys.executable, "-m", "uvicorn", app, "--port", str(port), "--log-level", "warning",
+                               "--no-access-log"], env=env)
+    url = f"http://127.0.0.1:{port}"
+
+    try:
+        deadline = time.monotonic() + 60
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError(f"The server exited with {server.returncode}.")
+            try:
+                if httpx.get(f"{url}/api/v1/users/", params={"limit": 1}).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("The server did not start within a minute.")
+            time.sleep(0.1)
+
+        yield url
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+
+class Recorder:
+    """
+    Collects the latency and the status of every request, by route.
+    """
+
+    def __init__(self):
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.statuses: dict[str, Counter] = defaultdict(Counter)
+
+    def record(self, route: str, started: float, status: int | str):
+        self.latencies[route].append(time.perf_counter() - started)
+        self.statuses[route][str(status)] += 1
+
+    def report(self, seconds: float) -> dict:
+        routes = {}
+        for route in sorted(self.latencies):
+            latencies = sorted(self.latencies[route])
+            statuses = self.statuses[route]
+            routes[route] = {
+                "requests": len(latencies),
+                "throughput": len(latencies) / seconds,
+                "errors": sum(count for status, count in statuses.items() if not status.startswith(("2", "3"))),
+                "statuses": dict(statuses),
+                "latency_ms": {"mean": sum(latencies) / len(latencies) * 1000,
+                               **{f"p{q}": percentile(latencies, q) * 1000 for q in (50, 95, 99)},
+                               "max": latencies[-1] * 1000},
+            }
+        total = sum(route["requests"] for route in routes.values())
+        return {"seconds": seconds, "requests": total, "throughput": total / seconds, "routes": routes}
+
+
+def percentile(ordered: list[float], q: int) -> float:
+    """
+    Returns the q-th percentile of ordered values, by the nearest rank.
+    """
+    return ordered[max(0, -(-len(ordered) * q // 100) - 1)]
+
+
+class Workload:
+    """
+    The requests of the mixed workload, against the seeded users and events.
+    """
+
+    def __init__(self, client: httpx.AsyncClient, tokens: TokenService, users: int,
+                 events: list[tuple[str, list[str]]], rng: random.Random):
+        self.client = client
+        self.tokens = tokens
+        self.users = users
+        self.events = events
+        self.rng = rng
+        self.registered = 0
+        self._headers: dict[str, dict] = {}
+
+    def _auth(self, username: str) -> dict:
+        if username not in self._headers:
+            self._headers[username] = {"Authorization": f"Bearer {self.tokens.issue(username)[0]}"}
+        return self._headers[username]
+
+    def _user(self) -> str:
+        return f"load{self.rng.randrange(self.users)}"
+
+    async def register(self):
+        self.registered += 1
+        user = next(generate_users(1, prefix=f"new{self.registered}x"))
+        return "POST /users", await self.client.post("/api/v1/users/", content=orjson.dumps(user))
+
+    async def users_page(self):
+        return "GET /users", await self.client.get("/api/v1/users/", params={"after": self._user(), "limit": 50})
+
+    async def login(self):
+        credentials = {"username": self._user(), "password": PASSWORD}
+        return "POST /sessions", await self.client.post("/api/v1/sessions/", content=orjson.dumps(credentials))
+
+    async def event(self):
+        event_id, _ = self.rng.choice(self.events)
+        return "GET /events/{id}", await self.client.get(f"/api/v1/events/{event_id}")
+
+    async def attended_events(self):
+        _, attendees = self.rng.choice(self.events)
+        return "GET /events", await self.client.get("/api/v1/events/",
+                                                    params={"attendee": self.rng.choice(attendees)})
+
+    async def vote(self):
+        event_id, attendees = self.rng.choice(self.events)
+        return "POST /events/{id}/votes", await self.client.post(f"/api/v1/events/{event_id}/votes",
+                                                                 content=orjson.dumps(self.rng.choice(OPTIONS)),
+                                                                 headers=self._auth(self.rng.choice(attendees)))
+
+    OPERATIONS = {"register": register, "users": users_page, "login": login, "event": event,
+                  "events": attended_events, "vote": vote}
+
+
+async def seed(client: httpx.AsyncClient, tokens: TokenService, users: int, events: int, attendees: int,
+               rng: random.Random) -> list[tuple[str, list[str]]]:
+    """
+    Registers the users in batches and creates the events, returning the identifier and attendees of each event.
+    """
+    generated = list(generate_users(users))
+    batches = asyncio.Semaphore(4)
+
+    async def register(batch: list[dict]):
+        async with batches:
+            response = await client.post("/api/v1/users/batch", content=orjson.dumps({"users": batch}))
+            response.raise_for_status()
+
+    await asyncio.gather(*(register(generated[i:i + USER_BATCH_SIZE])
+                           for i in range(0, len(generated), USER_BATCH_SIZE)))
+
+    creations = asyncio.Semaphore(32)
+
+    async def create(organizer: str, event: dict) -> tuple[str, list[str]]:
+        async with creations:
+            response = await client.post("/api/v1/events/", content=orjson.dumps(event),
+                                         headers={"Authorization": f"Bearer {tokens.issue(organizer)[0]}"})
+            response.raise_for_status()
+            return response.json()["data"]["id"], [organizer, *event["attendees"]]
+
+    return await asyncio.gather(*(create(organizer, event)
+                                  for organizer, event in generate_events(events, users, attendees, rng)))
+
+
+async def run(url: str, secret: str, args: argparse.Namespace) -> dict:
+    rng = random.Random(args.seed)
+    tokens = TokenService(secret, ttl=24 * 3600)
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+
+    async with httpx.AsyncClient(base_url=url, limits=limits, timeout=60,
+                                 headers={"Content-Type": "application/json"}) as client:
+        started = time.perf_counter()
+        events = await seed(client, tokens, args.users, args.events, args.attendees, rng)
+        print(f"seeded {args.users} users and {args.events} events in {time.perf_counter() - started:.1f} s")
+
+        workload = Workload(client, tokens, args.users, events, rng)
+        operations = [Workload.OPERATIONS[name] for name in args.mix]
+        weights = list(args.mix.values())
+        recorder = Recorder()
+
+        async def client_loop(deadline: float):
+            while time.perf_counter() < deadline:
+                operation = rng.choices(operations, weights)[0]
+                started = time.perf_counter()
+                try:
+                    route, response = await operation(workload)
+                except httpx.TransportError as e:
+                    recorder.record(operation.__name__, started, type(e).__name__)
+                else:
+                    recorder.record(route, started, response.status_code)
+
+        await client_loop(time.perf_counter() + args.warmup)
+        recorder = Recorder()
+        started = time.perf_counter()
+        await asyncio.gather(*(client_loop(started + args.seconds) for _ in range(args.concurrency)))
+        return recorder.report(time.perf_counter() - started)
+
+
+def mix(value: str) -> dict[str, int]:
+    """
+    Parses a workload mix such as `vote=6,event=3`.
+    """
+    weights = {}
+    for item in value.split(","):
+        name, _, weight = item.partition("=")
+        if name not in Workload.OPERATIONS:
+            raise argparse.ArgumentTypeError(f"unknown operation {name}, "
+                                             f"expected one of {', '.join(Workload.OPERATIONS)}")
+        weights[name] = int(weight or 1)
+    return weights
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--app", default="pymeet.main:app", help="The application, as uvicorn expects it.")
+    parser.add_argument("--url", help="A running server to load instead of starting one.")
+    parser.add_argument("--secret", help="The FASTAPI_SECRET_KEY of the running server.")
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--events", type=int, default=1000)
+    parser.add_argument("--attendees", type=int, default=50, help="Attendees per event.")
+    parser.add_argument("--concurrency", type=int, default=64, help="Clients sending requests at once.")
+    parser.add_argument("--seconds", type=float, default=30)
+    parser.add_argument("--warmup", type=float, default=2, help="Seconds of a single client before measuring.")
+    parser.add_argument("--mix", type=mix, default="register=1,users=2,login=1,event=3,events=2,vote=6")
+    parser.add_argument("--bcrypt", action="store_true", help="Hash passwords with bcrypt instead of storing them.")
+    parser.add_argument("--journal", help="Directory to journal events to, events are only kept in memory otherwise.")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--report", default="load-report.json")
+    args = parser.parse_args()
+
+    if args.url:
+        if not args.secret:
+            parser.error("--url needs the --secret of the server, to sign the session tokens of the voters")
+        report = asyncio.run(run(args.url, args.secret, args))
+    else:
+        secret = secrets.token_urlsafe(32)
+        with serve(args.app, secret, args.bcrypt, args.journal) as url:
+            report = asyncio.run(run(url, secret, args))
+
+    report["config"] = {key: value for key, value in vars(args).items() if key not in ("report", "secret")}
+    Path(args.report).write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2))
+
+    print(f"{'route':<24} {'req/s':>9} {'errors':>7} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}")
+    for route, stats in report["routes"].items():
+        latency = stats["latency_ms"]
+        print(f"{route:<24} {stats['throughput']:>9.1f} {stats['errors']:>7} {latency['p50']:>8.2f} "
+              f"{latency['p95']:>8.2f} {latency['p99']:>8.2f}")
+    print(f"{'total':<24} {report['throughput']:>9.1f}")
+    print(f"report written to {args.report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Metrics Overhead Benchmark
+
+Measures what the in-process metrics add to each request: a histogram observation, a repository call through the
+timed proxy, and a request served by a bare ASGI app and by a FastAPI app, with and without the metrics middleware.
+Requests are sent straight to the ASGI callable, without a server, so the difference is the instrumentation alone.
+Each figure is the best of a few rounds, plain and instrumented rounds interleaved, to keep out the noise.
+
+Usage:
+    poetry run python benchmarks/bench_metrics.py [--requests 100000] [--rounds 5]
+"""
+import argparse
+import asyncio
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from pymeet.adapters.metrics import Histogram, Timed
+from pymeet.adapters.repository import InMemoryUserRepository
+from pymeet.app.middleware import MetricsMiddleware
+from pymeet.domain.models import User
+
+
+async def bare_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+def fastapi_app() -> FastAPI:
+    app = FastAPI(default_response_class=ORJSONResponse)
+
+    @app.get("/events/{event_id}")
+    async def get_event(event_id: str):
+        return ORJSONResponse({"id": event_id})
+
+    return app
+
+
+async def serve(app, requests: int) -> float:
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        pass
+
+    start = time.perf_counter()
+    for i in range(requests):
+        scope = {"type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+                 "path": f"/events/{i % 100}", "raw_path": b"", "root_path": "", "query_string": b"", "headers": [],
+                 "server": ("testserver", 80), "client": ("testclient", 50000)}
+        await app(scope, receive, send)
+    return (time.perf_counter() - start) / requests
+
+
+def calls(func, count: int) -> float:
+    start = time.perf_counter()
+    for _ in range(count):
+        func()
+    return (time.perf_counter() - start) / count
+
+
+def best(rounds: int, plain, instrumented) -> tuple[float, float]:
+    timings = [(plain(), instrumented()) for _ in range(rounds)]
+    return min(timing[0] for timing in timings), min(timing[1] for timing in timings)
+
+
+def row(name: str, plain: float, instrumented: float) -> None:
+    print(f"{name:<22} {plain * 1e6:>12.2f} {instrumented * 1e6:>16.2f} {(instrumented - plain) * 1e6:>14.2f}")
+
+
+def run(requests: int, rounds: int) -> None:
+    histogram = Histogram("bench_seconds", "Benchmark.", ("route", "method", "status"))
+    series = histogram.labels("/events/{event_id}", "GET", "200")
+
+    repository = InMemoryUserRepository([User(f"user{i}", f"user{i}@mail.com", "password") for i in range(1000)])
+    timed = Timed(repository, Histogram("repository_seconds", "Benchmark.", ("repository", "method")), name="users")
+
+    print(f"{'operation':<22} {'plain µs':>12} {'instrumented µs':>16} {'overhead µs':>14}")
+    row("observe", *best(rounds, lambda: 0.0, lambda: calls(lambda: series.observe(0.001), requests)))
+    row("labeled observe", *best(rounds, lambda: 0.0,
+                                 lambda: calls(lambda: histogram.observe(0.001, "/events/{event_id}", "GET", "200"),
+                                               requests)))
+    row("repository call", *best(rounds, lambda: calls(lambda: repository.find_by_username("user1"), requests),
+                                 lambda: calls(lambda: timed.find_by_username("user1"), requests)))
+
+    loop = asyncio.new_event_loop()
+    for name, build in (("bare ASGI request", lambda: bare_app), ("FastAPI request", fastapi_app)):
+        http_histogram = Histogram("http_seconds", "Benchmark.", ("route", "method", "status"))
+        plain, instrumented = build(), MetricsMiddleware(build(), http_histogram)
+        loop.run_until_complete(serve(plain, 1000))
+        loop.run_until_complete(serve(instrumented, 1000))
+        row(name, *best(rounds, lambda: loop.run_until_complete(serve(plain, requests)),
+                        lambda: loop.run_until_complete(serve(instrumented, requests))))
+    loop.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=100_000, help="Calls or requests measured per round.")
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    run(args.requests, args.rounds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""Domain Model Benchmark
+
+Compares the memory taken by 100k users, options and events, and the time to hash an event, between the domain
+models as they used to be, with the same attributes in an instance dictionary and an event hash built from its
+representation, and the slotted models.
+
+Usage:
+    poetry run python benchmarks/bench_models.py [--objects 100000] [--attendees 100]
+"""
+import argparse
+import datetime
+import time
+import tracemalloc
+import uuid
+from typing import Callable
+
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+
+
+class DictUser:
+    """
+    A user with an instance dictionary.
+    """
+
+    def __init__(self, username: str, email: str, password: str):
+        self.username = username
+        self.email = email
+        self.password = password
+
+    def __repr__(self) -> str:
+        return f"User({self.username}, {self.email})"
+
+    def __hash__(self):
+        return hash(self.username)
+
+
+class DictOption:
+    """
+    A meeting event option with an instance dictionary.
+    """
+
+    def __init__(self, date: datetime.date | None = None, hour: int = 0, votes: list | None = None):
+        self.date = date or datetime.date.today()
+        self.hour = hour
+        self.votes = set(votes or ())
+
+
+class DictVoteTally:
+    """
+    A bucket vote tally with an instance dictionary.
+    """
+
+    def __init__(self, options):
+        self._ballots = {}
+        self._ranking = {}
+        self._top_count = 0
+
+        for option in options:
+            self._ranking.setdefault(len(option.votes), {})[option] = None
+
+
+class DictEvent:
+    """
+    A meeting event with an instance dictionary and a hash built from its representation, keeping the votes in a
+    tally with instance dictionaries too.
+    """
+
+    def __init__(self, name: str, options: list, attendees: set | None = None):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.organizer = None
+        self.options = {option: option for option in options}
+        self.attendees = attendees or set()
+        self.voted_date = None
+        self.open_voting = True
+        self.availability = {}
+        self.duration = datetime.timedelta(hours=1)
+        self.tally = DictVoteTally(self.options)
+
+    def __repr__(self):
+        return f"Event({self.name}, {self.voted_date or 'TBD'}, {self.attendees})"
+
+    def __hash__(self):
+        return hash(self.__repr__())
+
+
+def memory(create: Callable[[int], object], objects: int) -> float:
+    """
+    Returns the memory taken by the objects, in MiB.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    created = [create(i) for i in range(objects)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del created
+    return (after - before) / 2 ** 20
+
+
+def hashing(event: object, repeat: int = 10_000) -> float:
+    """
+    Returns the time to hash an event, in microseconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        hash(event)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--objects", type=int, default=100_000)
+    parser.add_argument("--attendees", type=int, default=100)
+    args = parser.parse_args()
+
+    print(f"{'model':>8} {'before MiB':>12} {'after MiB':>12}")
+    for name, before, after in (
+            ("user", lambda i: DictUser(f"user{i}", f"user{i}@mail.com", "password"),
+             lambda i: User(f"user{i}", f"user{i}@mail.com", "password")),
+            ("option", lambda i: DictOption(datetime.date(2023, 1, 1), i % 24),
+             lambda i: MeetingEventOption(datetime.date(2023, 1, 1), i % 24)),
+            ("event", lambda i: DictEvent(f"event{i}", []),
+             lambda i: MeetingEvent(f"event{i}", []))):
+        print(f"{name:>8} {memory(before, args.objects):>12.2f} {memory(after, args.objects):>12.2f}")
+
+    users = [User(f"user{i}", f"user{i}@mail.com", "password") for i in range(args.attendees)]
+    print(f"\nhash of an event with {args.attendees} attendees")
+    print(f"{'before':>8} {hashing(DictEvent('event', [], set(users))):>10.3f} us")
+    print(f"{'after':>8} {hashing(MeetingEvent('event', [], set(users))):>10.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Registration Benchmark
+
+Measures how long RegisterService.register takes as the user store grows, with password hashing stubbed out so only
+the uniqueness checks and the persistence are measured.
+
+Usage:
+    poetry run python benchmarks/bench_register.py [--backend memory|sql] [--sizes 1000 10000 100000 1000000]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from pymeet.adapters.orm import create_sqlite_engine, users
+from pymeet.adapters.repository import AsyncUserRepositoryAdapter, InMemoryUserRepository, UserRepository
+from pymeet.adapters.sql_repository import SqlAlchemyUserRepository
+from pymeet.domain.models import User
+from pymeet.services.password_encoder import PlainPasswordEncoder, PooledPasswordEncoder
+from pymeet.services.register import RegisterService
+
+
+def seed_memory(size: int, _directory: Path) -> UserRepository:
+    """
+    Creates an in-memory repository holding `size` users.
+    """
+    repository = InMemoryUserRepository()
+    for i in range(size):
+        repository.save(User(username=f"seed{i}", email=f"seed{i}@mail.com", password="password"))
+    return repository
+
+
+def seed_sql(size: int, directory: Path) -> UserRepository:
+    """
+    Creates a SQLite repository holding `size` users.
+    """
+    engine = create_sqlite_engine(f"sqlite:///{directory / f'bench-{size}.db'}")
+    with engine.begin() as connection:
+        connection.execute(users.insert(), [{"username": f"seed{i}",
+                                             "email": f"seed{i}@mail.com",
+                                             "normalized_email": f"seed{i}@mail.com",
+                                             "password": "password"} for i in range(size)])
+    return SqlAlchemyUserRepository(engine)
+
+
+SEEDERS = {"memory": seed_memory, "sql": seed_sql}
+
+
+async def measure(repository: UserRepository, samples: int) -> float:
+    """
+    Returns the mean registration time, in microseconds, against the given repository.
+    """
+    service = RegisterService(user_repository=AsyncUserRepositoryAdapter(repository),
+                              password_encoder=PooledPasswordEncoder(PlainPasswordEncoder()))
+
+    start = time.perf_counter()
+    for i in range(samples):
+        await service.register(username=f"new{i}", email=f"new{i}@mail.com", password="password")
+    elapsed = time.perf_counter() - start
+
+    return elapsed / samples * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--backend", choices=SEEDERS, default="memory")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--samples", type=int, default=1_000)
+    args = parser.parse_args()
+
+    print(f"{'users':>10} {'us/register':>12}")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in args.sizes:
+            repository = SEEDERS[args.backend](size, Path(directory))
+            print(f"{size:>10} {asyncio.run(measure(repository, args.samples)):>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Option Suggestion Benchmark
+
+Times suggesting the best options of an event from the availability of its attendees, with NumPy and with the Python
+fallback, to check suggestions stay interactive for large events over long horizons.
+
+Usage:
+    poetry run python benchmarks/bench_suggestions.py [--attendees 1000] [--days 90] [--windows 20] [--repeat 5]
+"""
+import argparse
+import datetime
+import random
+import time
+
+from pymeet.domain import availability
+from pymeet.domain.availability import suggest_options
+
+START = datetime.datetime(2023, 1, 1)
+
+
+def windows_of(randomness: random.Random, days: int, windows: int) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    """
+    Returns random availability windows within the horizon, from half an hour to a working day long.
+    """
+    starts = (START + datetime.timedelta(minutes=randomness.randrange(days * 24 * 60)) for _ in range(windows))
+    return [(start, start + datetime.timedelta(minutes=randomness.randrange(30, 8 * 60))) for start in starts]
+
+
+def measure(attendees: list, days: int, repeat: int) -> float:
+    """
+    Returns the best time to suggest ten options, in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        suggest_options(attendees, START, days * 24, 10)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attendees", type=int, default=1000)
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--windows", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    randomness = random.Random(0)
+    attendees = [windows_of(randomness, args.days, args.windows) for _ in range(args.attendees)]
+
+    print(f"{'path':>8} {'ms':>10}")
+    print(f"{'numpy':>8} {measure(attendees, args.days, args.repeat):>10.2f}")
+    availability.np = None
+    print(f"{'python':>8} {measure(attendees, args.days, args.repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
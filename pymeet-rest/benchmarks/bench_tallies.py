@@ -0,0 +1,105 @@
+"""Vote Tally Benchmark
+
+Casts one vote per attendee on an event and compares, for each way of keeping votes, the memory the votes take, the
+time per vote and the time to tally them and close the voting:
+
+    list     the original model, a list of voters per option and a scan of every option to close, which cannot
+             reject duplicate votes nor change a vote.
+    bucket   BucketVoteTally, a set of voters per option ranked by vote count.
+    packed   PackedVoteTally, a NumPy vector with the option each attendee picked.
+
+Usage:
+    poetry run python benchmarks/bench_tallies.py [--attendees 10000] [--options 500]
+"""
+import argparse
+import datetime
+import random
+import time
+import tracemalloc
+
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.tallies import BucketVoteTally, PackedVoteTally
+
+
+def cast_into_lists(users: list[User], options: list[MeetingEventOption], picks: list[int]):
+    """
+    Keeps the votes the way the original model did, a list of voters per option, checking attendees and options as
+    the event does but letting the same voter vote several times.
+    """
+    attendees = set(users)
+    votes = {option: [] for option in options}
+
+    def vote():
+        for user, pick in zip(users, picks):
+            if user not in attendees or options[pick] not in votes:
+                raise ValueError(f"{user} cannot vote for {options[pick]}.")
+            votes[options[pick]].append(user)
+
+    def close():
+        return max(votes, key=lambda option: len(votes[option]))
+
+    return vote, close
+
+
+def cast_into_tally(tally):
+    """
+    Keeps the votes with a vote tally of a meeting event.
+    """
+
+    def cast(users: list[User], options: list[MeetingEventOption], picks: list[int]):
+        event = MeetingEvent(name="All Hands", options=options, attendees=set(users), tally=tally)
+
+        def vote():
+            for user, pick in zip(users, picks):
+                event.vote(user, options[pick])
+
+        return vote, event.close_voting
+
+    return cast
+
+
+def measure(cast, attendees: int, options: int) -> tuple[float, float, float]:
+    """
+    Returns the memory taken by the votes in KiB, the time per vote in microseconds and the time to close in
+    milliseconds. Memory is traced on a separate run, as tracing slows every allocation down.
+    """
+    users = [User(username=f"user{i}", email=f"user{i}@mail.com", password="password") for i in range(attendees)]
+    picks = [random.Random(i).randrange(options) for i in range(attendees)]
+
+    def options_():
+        return [MeetingEventOption(date=datetime.date(2023, 1, 1) + datetime.timedelta(days=i // 24), hour=i % 24)
+                for i in range(options)]
+
+    tracemalloc.start()
+    vote, _ = cast(users, options_(), picks)
+    before, _ = tracemalloc.get_traced_memory()
+    vote()
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    vote, close = cast(users, options_(), picks)
+    start = time.perf_counter()
+    vote()
+    voted = time.perf_counter()
+    close()
+    closed = time.perf_counter()
+
+    return (after - before) / 1024, (voted - start) / attendees * 1e6, (closed - voted) * 1e3
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--attendees", type=int, default=10_000)
+    parser.add_argument("--options", type=int, default=500)
+    args = parser.parse_args()
+
+    print(f"{'votes':>8} {'KiB':>10} {'us/vote':>10} {'close ms':>10}")
+    for name, cast in (("list", cast_into_lists),
+                       ("bucket", cast_into_tally(BucketVoteTally)),
+                       ("packed", cast_into_tally(PackedVoteTally))):
+        memory, per_vote, close = measure(cast, args.attendees, args.options)
+        print(f"{name:>8} {memory:>10.1f} {per_vote:>10.3f} {close:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Concurrent Voting Benchmark
+
+Votes concurrently on a growing number of events through the meeting event service, journaling every vote to a
+temporary directory, so each change holds the lock of its event until it is durable. Compares a single lock for every
+event with striped locks, reporting the votes per second and fsyncs of each: with striped locks the votes for events
+on different stripes share the fsyncs, so the throughput grows with the events voted at once.
+
+Usage:
+    poetry run python benchmarks/bench_voting.py [--voters 50] [--commit-ms 1] [--stripes 64]
+"""
+import argparse
+import asyncio
+import datetime
+import tempfile
+import time
+
+from pymeet.adapters.journal import EventJournal
+from pymeet.adapters.repository import (AsyncUserRepositoryAdapter, InMemoryMeetingEventRepository,
+                                        InMemoryUserRepository)
+from pymeet.domain.models import User
+from pymeet.services.events import MeetingEventService
+from pymeet.services.locks import StripedLock
+
+DAY = datetime.date(2023, 1, 1)
+
+
+async def throughput(stripes: int, events: int, voters: int, users: InMemoryUserRepository,
+                     commit_window: float) -> tuple[float, int]:
+    with tempfile.TemporaryDirectory() as directory:
+        repository = InMemoryMeetingEventRepository()
+        journal = EventJournal(directory, commit_window=commit_window)
+        journal.open(repository, users.find_by_username)
+        service = MeetingEventService(event_repository=repository,
+                                      user_repository=AsyncUserRepositoryAdapter(users),
+                                      locks=StripedLock(stripes),
+                                      journal=journal)
+        usernames = [f"user{i}" for i in range(voters)]
+        created = [await service.create(name=f"event{i}", organizer=usernames[0], options=[(DAY, 9), (DAY, 10)],
+                                        attendees=usernames) for i in range(events)]
+        commits = journal.commits
+
+        start = time.perf_counter()
+        await asyncio.gather(*(service.vote(event_id=event.id, voter=username, date=DAY, hour=9 + i % 2)
+                               for event in created for i, username in enumerate(usernames)))
+        elapsed = time.perf_counter() - start
+
+        await journal.close()
+        assert all(service.get(event.id).tally.participation() == voters for event in created)
+        return events * voters / elapsed, journal.commits - commits
+
+
+async def run(voters: int, stripes: int, commit_window: float):
+    users = InMemoryUserRepository([User(f"user{i}", f"user{i}@mail.com", "password") for i in range(voters)])
+
+    print(f"{'events':>6} {'1 lock votes/s':>16} {'fsyncs':>7} {f'{stripes} stripes votes/s':>22} {'fsyncs':>7} "
+          f"{'speedup':>8}")
+    for events in (1, 2, 4, 8, 16):
+        single, single_commits = await throughput(1, events, voters, users, commit_window)
+        striped, striped_commits = await throughput(stripes, events, voters, users, commit_window)
+        print(f"{events:>6} {single:>16.0f} {single_commits:>7} {striped:>22.0f} {striped_commits:>7} "
+              f"{striped / single:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--voters", type=int, default=50, help="Votes per event.")
+    parser.add_argument("--commit-ms", type=float, default=1, help="Commit window of the journal, in milliseconds.")
+    parser.add_argument("--stripes", type=int, default=64)
+    args = parser.parse_args()
+
+    asyncio.run(run(args.voters, args.stripes, args.commit_ms / 1000))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Benchmark Comparison
+
+Compares a run of the micro-benchmarks with a baseline, both saved by pytest-benchmark as JSON, and fails when the
+median of a benchmark is slower than the baseline one beyond the tolerance of its group.
+
+Timings only compare on the same machine, so the baseline is not committed: store one with `make bench-baseline`
+before changing anything. The median is compared rather than the mean, which a few slow rounds skew, and benchmarks
+taking a few microseconds are noisier than the others, so their groups get a wider tolerance.
+
+Usage:
+    poetry run python benchmarks/compare.py benchmarks/baseline.json .benchmarks/latest.json [--tolerance 20]
+"""
+import argparse
+import json
+import sys
+
+DEFAULT_TOLERANCE = 20.0
+
+# Groups whose benchmarks take a few microseconds or less, where rounds vary by 20 to 30% from one run to another.
+GROUP_TOLERANCES = {
+    "close_voting": 50.0,
+    "find_by": 50.0,
+    "observe": 50.0,
+    "request": 40.0,
+    "to_camel": 40.0,
+    "vote": 50.0,
+}
+
+
+def medians(path: str) -> dict[str, tuple[str, float]]:
+    """
+    Reads the group and the median of every benchmark of a run, by name.
+    """
+    with open(path, encoding="utf-8") as file:
+        run = json.load(file)
+
+    return {benchmark["fullname"]: (benchmark["group"] or "", benchmark["stats"]["median"])
+            for benchmark in run["benchmarks"]}
+
+
+def compare(baseline: dict[str, tuple[str, float]], current: dict[str, tuple[str, float]],
+            tolerance: float) -> list[str]:
+    """
+    Prints each benchmark median next to its baseline one and returns the benchmarks slower than their tolerance.
+    """
+    regressions = []
+
+    for name, (group, median) in sorted(current.items()):
+        if name not in baseline:
+            print(f"{'new':>10}  {median * 1e6:12.2f} us  {name}")
+            continue
+
+        allowed = GROUP_TOLERANCES.get(group, tolerance)
+        change = (median / baseline[name][1] - 1) * 100
+        slower = change > allowed
+
+        if slower:
+            regressions.append(name)
+
+        print(f"{change:+9.1f}%  {median * 1e6:12.2f} us  {name}{f'  SLOWER than {allowed:.0f}%' if slower else ''}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("baseline", help="The baseline run, as saved by --benchmark-json.")
+    parser.add_argument("current", help="The run to compare, as saved by --benchmark-json.")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Percent a median may grow for groups without a tolerance of their own.")
+    args = parser.parse_args()
+
+    regressions = compare(medians(args.baseline), medians(args.current), args.tolerance)
+
+    if regressions:
+        print(f"{len(regressions)} benchmarks are slower than the baseline beyond their tolerance.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
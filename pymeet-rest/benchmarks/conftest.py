@@ -0,0 +1,18 @@
+"""
+Benchmark Fixtures
+
+The micro-benchmarks are not part of the test suite, run them with `make bench`.
+"""
+import asyncio
+
+import pytest
+
+
+@pytest.fixture(name="run")
+def fixture_run():
+    """
+    Runs coroutines to completion on an event loop shared by the rounds of a benchmark.
+    """
+    loop = asyncio.new_event_loop()
+    yield loop.run_until_complete
+    loop.close()
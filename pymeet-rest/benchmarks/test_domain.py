@@ -0,0 +1,56 @@
+"""
+Domain Benchmarks
+"""
+import datetime
+from itertools import count
+
+import pytest
+
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.tallies import BucketVoteTally, PackedVoteTally
+
+SIZES = [(10, 5), (1_000, 20), (100_000, 50)]
+
+
+def _event(attendees: int, options: int, tally) -> MeetingEvent:
+    users = [User(f"user{i}", f"user{i}@mail.com", "password") for i in range(attendees)]
+    return MeetingEvent(name="Event",
+                        options=[MeetingEventOption(date=datetime.date(2023, 1, 1 + i // 24), hour=i % 24)
+                                 for i in range(options)],
+                        attendees=set(users),
+                        tally=tally)
+
+
+@pytest.mark.benchmark(group="vote")
+@pytest.mark.parametrize("tally", [BucketVoteTally, PackedVoteTally], ids=["bucket", "packed"])
+@pytest.mark.parametrize("attendees, options", SIZES)
+def test_vote(benchmark, attendees, options, tally):
+    """
+    Votes cycling through the attendees, each one moving to the next option on every turn.
+    """
+    event = _event(attendees, options, tally)
+    users = sorted(event.attendees, key=lambda user: user.username)
+    choices = list(event.options)
+    turns = count()
+
+    def vote():
+        turn = next(turns)
+        event.vote(users[turn % attendees], choices[(turn // attendees) % options])
+
+    benchmark(vote)
+
+
+@pytest.mark.benchmark(group="close_voting")
+@pytest.mark.parametrize("tally", [BucketVoteTally, PackedVoteTally], ids=["bucket", "packed"])
+@pytest.mark.parametrize("attendees, options", SIZES)
+def test_close_voting(benchmark, attendees, options, tally):
+    """
+    Closes the voting of an event every attendee voted in.
+    """
+    event = _event(attendees, options, tally)
+    choices = list(event.options)
+
+    for i, user in enumerate(sorted(event.attendees, key=lambda user: user.username)):
+        event.vote(user, choices[i % options])
+
+    assert benchmark(event.close_voting) is not None
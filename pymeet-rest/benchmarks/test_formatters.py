@@ -0,0 +1,46 @@
+"""
+Formatter and Serialization Benchmarks
+"""
+import pytest
+from fastapi.responses import ORJSONResponse
+
+from pymeet.app.formatters import to_camel
+from pymeet.domain.models import User
+from pymeet.domain.schemas import BaseUser, UserResponse, project_user
+
+
+@pytest.mark.benchmark(group="to_camel")
+@pytest.mark.parametrize("name", ["username", "expires_at", "max-queue_size__in_bytes"])
+def test_to_camel(benchmark, name):
+    """
+    Translates attribute names to camel case.
+    """
+    benchmark(to_camel, name)
+
+
+@pytest.fixture(name="users", params=[1, 100, 1000])
+def fixture_users(request) -> list[User]:
+    """
+    Create pages of users of each size.
+    """
+    return [User(f"user{i}", f"user{i}@mail.com", "password") for i in range(request.param)]
+
+
+@pytest.mark.benchmark(group="user_response")
+def test_user_response_validated(benchmark, users):
+    """
+    Renders a page of users validating it as a UserResponse.
+    """
+    def render():
+        return UserResponse(data=[BaseUser(username=user.username, email=user.email) for user in users]).json(
+            by_alias=True)
+
+    benchmark(render)
+
+
+@pytest.mark.benchmark(group="user_response")
+def test_user_response_projected(benchmark, users):
+    """
+    Renders a page of users projected into the UserResponse shape, as the endpoints do.
+    """
+    benchmark(lambda: ORJSONResponse({"data": [project_user(user) for user in users]}).body)
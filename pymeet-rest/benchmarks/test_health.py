@@ -0,0 +1,44 @@
+"""
+Health Endpoint Benchmarks
+"""
+import pytest
+from anyio import CapacityLimiter
+from fastapi import FastAPI
+
+from pymeet.entrypoints import base
+from pymeet.services.password_encoder import PlainPasswordEncoder, PooledPasswordEncoder
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+async def _limiter() -> CapacityLimiter:
+    return CapacityLimiter(15)
+
+
+@pytest.fixture(name="app")
+def fixture_app(run) -> FastAPI:
+    """
+    Create an application serving the base endpoints, with the pools its lifespan would create.
+    """
+    app = FastAPI()
+    app.include_router(base.router)
+    app.state.password_encoder = PooledPasswordEncoder(PlainPasswordEncoder())
+    app.state.database_limiter = run(_limiter())
+    return app
+
+
+@pytest.mark.benchmark(group="probes")
+@pytest.mark.parametrize("path", ["/healthz", "/readyz"])
+def test_probe(benchmark, run, app, path):
+    """
+    Serves a liveness or readiness probe, straight through the ASGI callable.
+    """
+    scope = {"type": "http", "method": "GET", "path": path, "root_path": "", "query_string": b"", "headers": []}
+
+    benchmark(lambda: run(app(dict(scope), _receive, _send)))
@@ -0,0 +1,38 @@
+"""
+Import Time Benchmarks
+"""
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+SOURCES = Path(__file__).resolve().parent.parent / "src"
+LIFESPAN_MODULES = ("concurrent.futures.process", "multiprocessing", "sqlalchemy")
+
+
+def _env() -> dict[str, str]:
+    return {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [str(SOURCES), os.environ.get("PYTHONPATH")]))}
+
+
+@pytest.mark.benchmark(group="cold_start")
+@pytest.mark.parametrize("code", ["import pymeet.main", "import pymeet.main; pymeet.main.create_app()"],
+                         ids=["import", "create_app"])
+def test_cold_start(benchmark, code):
+    """
+    Starts a fresh interpreter importing the main module, and building the application as `uvicorn --factory` does.
+    """
+    benchmark.pedantic(subprocess.run, args=([sys.executable, "-c", code],), kwargs={"env": _env(), "check": True},
+                       rounds=5, iterations=1)
+
+
+def test_create_app_leaves_the_lifespan_modules_unimported():
+    """
+    Builds the application in a fresh interpreter, which only imports the hashing pool and the database once started.
+    """
+    code = (f"import sys, pymeet.main; pymeet.main.create_app(); "
+            f"print(*[module for module in {LIFESPAN_MODULES!r} if module in sys.modules])")
+    result = subprocess.run([sys.executable, "-c", code], env=_env(), check=True, capture_output=True, text=True)
+
+    assert result.stdout.split() == []
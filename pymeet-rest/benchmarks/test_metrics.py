@@ -0,0 +1,49 @@
+"""
+Metrics Benchmarks
+"""
+import pytest
+
+from pymeet.adapters.metrics import Histogram
+from pymeet.app.middleware import MetricsMiddleware, ProfilingMiddleware
+from pymeet.services.tokens import TokenService
+
+SCOPE = {"type": "http", "method": "GET", "path": "/events/1", "headers": []}
+
+
+async def _app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": []})
+    await send({"type": "http.response.body", "body": b"{}"})
+
+
+async def _receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def _send(message):
+    pass
+
+
+@pytest.mark.benchmark(group="observe")
+def test_observe(benchmark):
+    """
+    Observes a value in a labeled histogram series.
+    """
+    histogram = Histogram("latency_seconds", "Latency.", ("route", "method", "status"))
+    benchmark(histogram.observe, 0.001, "/events/{event_id}", "GET", "200")
+
+
+@pytest.mark.benchmark(group="request")
+@pytest.mark.parametrize("middleware", [None, "metrics", "profiling"])
+def test_request(benchmark, run, tmp_path, middleware):
+    """
+    Serves a request from a bare ASGI app, alone, with the metrics middleware, or with the profiling middleware
+    installed and the request not profiled.
+    """
+    app = _app
+
+    if middleware == "metrics":
+        app = MetricsMiddleware(_app, Histogram("latency_seconds", "Latency.", ("route", "method", "status")))
+    elif middleware == "profiling":
+        app = ProfilingMiddleware(_app, tmp_path, token_service=TokenService("secret"), sample_rate=0.0)
+
+    benchmark(lambda: run(app(dict(SCOPE), _receive, _send)))
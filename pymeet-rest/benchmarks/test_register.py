@@ -0,0 +1,47 @@
+"""
+Registration Benchmarks
+"""
+from itertools import count
+
+import pytest
+
+from pymeet.adapters.repository import AsyncUserRepositoryAdapter, InMemoryUserRepository
+from pymeet.domain.models import User
+from pymeet.services.password_encoder import BcryptPasswordEncoder, PlainPasswordEncoder, PooledPasswordEncoder
+from pymeet.services.register import RegisterService
+
+
+def _service(encoder) -> RegisterService:
+    repository = InMemoryUserRepository([User(f"seed{i}", f"seed{i}@mail.com", "password") for i in range(10_000)])
+    return RegisterService(user_repository=AsyncUserRepositoryAdapter(repository),
+                           password_encoder=PooledPasswordEncoder(encoder))
+
+
+@pytest.mark.benchmark(group="register")
+def test_register_plain(benchmark, run):
+    """
+    Registers users with hashing stubbed out, measuring the uniqueness checks and the persistence.
+    """
+    service = _service(PlainPasswordEncoder())
+    users = count()
+
+    def register():
+        i = next(users)
+        run(service.register(username=f"new{i}", email=f"new{i}@mail.com", password="password"))
+
+    benchmark(register)
+
+
+@pytest.mark.benchmark(group="register")
+def test_register_bcrypt(benchmark, run):
+    """
+    Registers users hashing their passwords with bcrypt at the lowest cost the application calibrates to.
+    """
+    service = _service(BcryptPasswordEncoder(rounds=10))
+    users = count()
+
+    def register():
+        i = next(users)
+        run(service.register(username=f"new{i}", email=f"new{i}@mail.com", password="password"))
+
+    benchmark.pedantic(register, rounds=10, warmup_rounds=1)
@@ -0,0 +1,28 @@
+"""
+Repository Benchmarks
+"""
+import pytest
+
+from pymeet.adapters.repository import InMemoryUserRepository
+from pymeet.domain.models import User
+
+SIZES = [1_000, 10_000, 100_000]
+
+
+@pytest.fixture(name="users", scope="module", params=SIZES)
+def fixture_users(request) -> InMemoryUserRepository:
+    """
+    Create an in-memory user repository of each size.
+    """
+    return InMemoryUserRepository([User(f"user{i}", f"user{i}@mail.com", "password") for i in range(request.param)])
+
+
+@pytest.mark.benchmark(group="find_by")
+@pytest.mark.parametrize("attributes", [{"username": "user500"},
+                                        {"email": "USER500@mail.com"},
+                                        {"password": "missing"}], ids=["username", "email", "scan"])
+def test_find_by(benchmark, users, attributes):
+    """
+    Finds a user by an indexed attribute, or by scanning every user.
+    """
+    benchmark(users.find_by, **attributes)
@@ -0,0 +1,182 @@
+"""Broker
+
+An in-process publish and subscribe broker, fanning out the latest state of a topic to its subscribers.
+"""
+import asyncio
+from typing import Any, AsyncIterator, Callable
+
+
+class Subscription:
+    """
+    Receives the messages of a topic, keeping only the latest one not yet received.
+
+    Offering a message never waits: a subscriber slower than the publishers skips to the latest message instead of
+    queueing every one of them.
+
+    Attributes:
+        topic (str): The topic subscribed to.
+    """
+
+    def __init__(self, topic: str):
+        self.topic = topic
+        self._message: bytes | None = None
+        self._closed = False
+        self._ready = asyncio.Event()
+
+    def offer(self, message: bytes) -> None:
+        """
+        Replaces the pending message.
+
+        Args:
+            message (bytes): The new message.
+        """
+        self._message = message
+        self._ready.set()
+
+    def close(self) -> None:
+        """
+        Ends the subscription, once the pending message is received.
+        """
+        self._closed = True
+        self._ready.set()
+
+    async def get(self) -> bytes | None:
+        """
+        Waits for the next message.
+
+        Returns:
+            bytes | None: The latest message, or None once the subscription is closed.
+        """
+        while self._message is None:
+            if self._closed:
+                return None
+
+            self._ready.clear()
+            await self._ready.wait()
+
+        message, self._message = self._message, None
+        return message
+
+    def __aiter__(self) -> AsyncIterator[bytes]:
+        return self
+
+    async def __anext__(self) -> bytes:
+        message = await self.get()
+
+        if message is None:
+            raise StopAsyncIteration
+
+        return message
+
+
+class EventBroker:
+    """
+    Publishes the latest state of each topic to its subscribers, coalescing the publications within a window.
+
+    The first publication to a topic schedules a broadcast after the window, and later publications within the
+    window only replace the state to broadcast. A broadcast renders the state once and offers the same bytes to
+    every subscriber, so publishing costs the same whatever the number of subscribers. It must be used from the
+    event loop.
+
+    Attributes:
+        window (float): Seconds publications are coalesced for.
+        published (int): Publications to topics with subscribers.
+        broadcasts (int): Broadcasts sent.
+    """
+
+    def __init__(self, render: Callable[[Any], bytes], window: float = 0.1):
+        self.window = window
+        self.published = 0
+        self.broadcasts = 0
+        self._render = render
+        self._subscribers: dict[str, set[Subscription]] = {}
+        self._pending: dict[str, Any] = {}
+
+    def subscribers(self, topic: str) -> int:
+        """
+        Counts the subscribers of a topic.
+
+        Args:
+            topic (str): The topic.
+
+        Returns:
+            int: How many subscriptions to the topic are open.
+        """
+        return len(self._subscribers.get(topic, ()))
+
+    def subscribe(self, topic: str) -> Subscription:
+        """
+        Subscribes to a topic.
+
+        Args:
+            topic (str): The topic.
+
+        Returns:
+            Subscription: The new subscription, which must be unsubscribed when no longer read.
+        """
+        subscription = Subscription(topic)
+        self._subscribers.setdefault(topic, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """
+        Stops offering messages to a subscription.
+
+        Args:
+            subscription (Subscription): The subscription.
+        """
+        subscribers = self._subscribers.get(subscription.topic)
+
+        if subscribers is not None:
+            subscribers.discard(subscription)
+
+            if not subscribers:
+                del self._subscribers[subscription.topic]
+                self._pending.pop(subscription.topic, None)
+
+    def publish(self, topic: str, state: Any) -> None:
+        """
+        Publishes the state of a topic, broadcasting it once the window is over. Topics without subscribers are
+        skipped.
+
+        Args:
+            topic (str): The topic.
+            state (Any): The latest state of the topic.
+        """
+        if topic not in self._subscribers:
+            return
+
+        self.published += 1
+
+        if topic not in self._pending:
+            asyncio.get_running_loop().call_later(self.window, self._broadcast, topic)
+
+        self._pending[topic] = state
+
+    def close(self, topic: str, state: Any) -> None:
+        """
+        Broadcasts the final state of a topic at once and closes its subscriptions.
+
+        Args:
+            topic (str): The topic.
+            state (Any): The final state of the topic.
+        """
+        self._pending.pop(topic, None)
+        subscribers = self._subscribers.pop(topic, set())
+
+        if subscribers:
+            self._offer(subscribers, state)
+
+        for subscription in subscribers:
+            subscription.close()
+
+    def _broadcast(self, topic: str) -> None:
+        if topic in self._pending:
+            self._offer(self._subscribers[topic], self._pending.pop(topic))
+
+    def _offer(self, subscribers: set[Subscription], state: Any) -> None:
+        message = self._render(state)
+        self.broadcasts += 1
+
+        for subscription in subscribers:
+            subscription.offer(message)
@@ -0,0 +1,192 @@
+"""Indexes
+
+In-memory secondary indexes shared by the in-memory repositories.
+"""
+from bisect import bisect_left, bisect_right, insort
+from itertools import islice
+from typing import Any, Iterator
+
+
+class SortedIndex:
+    """
+    A sorted collection of unique keys supporting ordered scans from any key.
+
+    Keys are kept in a list of bounded, sorted chunks, so insertions and deletions only shift one chunk instead of
+    the whole collection, while locating a key is still a binary search.
+
+    Attributes:
+        load (int): Chunk size at which chunks are split in two.
+    """
+
+    def __init__(self, keys=(), load: int = 1000):
+        self.load = load
+        self._chunks: list[list] = []
+        self._maxes: list = []
+        self._size = 0
+
+        for key in sorted(keys):
+            self.add(key)
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __contains__(self, key) -> bool:
+        i = bisect_left(self._maxes, key)
+        if i == len(self._maxes):
+            return False
+        chunk = self._chunks[i]
+        j = bisect_left(chunk, key)
+        return j < len(chunk) and chunk[j] == key
+
+    def __iter__(self) -> Iterator:
+        return self.iter_from()
+
+    def add(self, key: Any) -> None:
+        """
+        Adds a key to the index.
+
+        Args:
+            key (Any): The key to add.
+        """
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._size += 1
+            return
+
+        i = min(bisect_left(self._maxes, key), len(self._maxes) - 1)
+        chunk = self._chunks[i]
+        insort(chunk, key)
+        self._maxes[i] = chunk[-1]
+        self._size += 1
+
+        if len(chunk) > 2 * self.load:
+            self._chunks[i:i + 1] = [chunk[:self.load], chunk[self.load:]]
+            self._maxes[i:i + 1] = [chunk[self.load - 1], chunk[-1]]
+
+    def remove(self, key: Any) -> None:
+        """
+        Removes a key from the index.
+
+        Args:
+            key (Any): The key to remove.
+
+        Raises:
+            KeyError: If the key is not in the index.
+        """
+        i = bisect_left(self._maxes, key)
+        chunk = self._chunks[i] if i < len(self._chunks) else []
+        j = bisect_left(chunk, key)
+
+        if j == len(chunk) or chunk[j] != key:
+            raise KeyError(key)
+
+        del chunk[j]
+        self._size -= 1
+
+        if chunk:
+            self._maxes[i] = chunk[-1]
+        else:
+            del self._chunks[i]
+            del self._maxes[i]
+
+    def iter_from(self, key: Any = None, inclusive: bool = True) -> Iterator:
+        """
+        Iterates the keys in order, starting at the given key.
+
+        Args:
+            key (Any): Where to start, None starts at the smallest key.
+            inclusive (bool): Whether a key equal to the starting one is included.
+
+        Returns:
+            Iterator: The keys from the given one onwards. The index must not change while it is consumed.
+        """
+        if key is None:
+            i, j = 0, 0
+        else:
+            search = bisect_left if inclusive else bisect_right
+            i = search(self._maxes, key)
+            j = search(self._chunks[i], key) if i < len(self._chunks) else 0
+
+        for c in range(i, len(self._chunks)):
+            yield from islice(self._chunks[c], j, None)
+            j = 0
+
+
+class IntervalIndex:
+    """
+    A collection of keyed intervals supporting overlap queries.
+
+    Intervals are kept sorted by start together with the longest interval ever added, so every interval overlapping a
+    range starts at most that long before the range: a query scans O(log n + k) intervals when lengths are bounded.
+    The longest length never shrinks on removal, which only widens the scan.
+    """
+
+    def __init__(self):
+        self._starts = SortedIndex()
+        self._max_length = None
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def iter_from(self, key: Any = None, inclusive: bool = True) -> Iterator[tuple[Any, Any, Any]]:
+        """
+        Iterates the intervals ordered by start, then by end and key, starting at the given one.
+
+        Args:
+            key (Any): Where to start, a tuple of start, end and key or a prefix of it, None starts at the first one.
+            inclusive (bool): Whether an interval equal to the starting one is included.
+
+        Returns:
+            Iterator[tuple[Any, Any, Any]]: The start, end and key of each interval from the given one onwards.
+        """
+        return self._starts.iter_from(key, inclusive)
+
+    def add(self, start: Any, end: Any, key: Any) -> None:
+        """
+        Adds an interval.
+
+        Args:
+            start (Any): Start of the interval, inclusive.
+            end (Any): End of the interval, exclusive.
+            key (Any): What the interval belongs to, unique for the same start and end.
+        """
+        self._starts.add((start, end, key))
+
+        if self._max_length is None or end - start > self._max_length:
+            self._max_length = end - start
+
+    def remove(self, start: Any, end: Any, key: Any) -> None:
+        """
+        Removes an interval.
+
+        Args:
+            start (Any): Start of the interval, inclusive.
+            end (Any): End of the interval, exclusive.
+            key (Any): What the interval belongs to.
+
+        Raises:
+            KeyError: If the interval is not in the index.
+        """
+        self._starts.remove((start, end, key))
+
+    def overlapping(self, start: Any, end: Any) -> Iterator[tuple[Any, Any, Any]]:
+        """
+        Iterates the intervals overlapping a range, ordered by start.
+
+        Args:
+            start (Any): Start of the range, inclusive.
+            end (Any): End of the range, exclusive.
+
+        Returns:
+            Iterator[tuple[Any, Any, Any]]: The start, end and key of each overlapping interval.
+        """
+        if self._max_length is None:
+            return
+
+        for interval in self._starts.iter_from((start - self._max_length,)):
+            if interval[0] >= end:
+                return
+
+            if interval[1] > start:
+                yield interval
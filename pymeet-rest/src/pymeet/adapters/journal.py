@@ -0,0 +1,416 @@
+"""Journal
+
+An append-only journal of the changes to meeting events, committing concurrent changes with a single fsync.
+"""
+import asyncio
+import datetime
+import logging
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+import orjson
+from anyio import to_thread
+
+from pymeet.adapters.repository import MeetingEventRepository
+from pymeet.domain.errors import IllegalAvailabilityError, IllegalVoteError
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.tallies import PACKED_VOTES_AVAILABLE, BucketVoteTally, PackedVoteTally
+
+log = logging.getLogger(__name__)
+
+SEGMENT_PREFIX = "journal-"
+SNAPSHOT_PREFIX = "snapshot-"
+SUFFIX = ".jsonl"
+BAD_RECORD_ERRORS = (KeyError, IndexError, TypeError, ValueError, IllegalAvailabilityError, IllegalVoteError)
+
+
+def event_record(event: MeetingEvent) -> dict:
+    """
+    Records the whole state of an event, its votes included.
+
+    Args:
+        event (MeetingEvent): The event.
+
+    Returns:
+        dict: An `event` record, which replayed rebuilds the event.
+    """
+    return {
+        "op": "event",
+        "id": event.id,
+        "name": event.name,
+        "organizer": event.organizer.username if event.organizer else None,
+        "attendees": [attendee.username for attendee in event.attendees],
+        "options": [(option.date, option.hour) for option in event.options],
+        "duration": event.duration.total_seconds(),
+        "packed": isinstance(event.tally, PackedVoteTally),
+        "availability": {attendee.username: windows for attendee, windows in event.availability.items()},
+        "ballots": [(voter.username, option.date, option.hour) for voter, option in event.tally.ballots()],
+        "votedDate": event.voted_date,
+        "openVoting": event.open_voting,
+        "version": event.version,
+    }
+
+
+def _option(date: str, hour: int) -> MeetingEventOption:
+    return MeetingEventOption(date=datetime.date.fromisoformat(date), hour=hour)
+
+
+def _windows(windows: list) -> list[tuple[datetime.datetime, datetime.datetime]]:
+    return [(datetime.datetime.fromisoformat(start), datetime.datetime.fromisoformat(end)) for start, end in windows]
+
+
+def apply_record(events: dict[str, MeetingEvent], record: dict, find_user: Callable[[str], User]) -> None:
+    """
+    Applies a journal record to the events it was written for.
+
+    A change is recorded with the version of the event it was made to, and a record for another version is skipped, so
+    a change a snapshot already holds is not applied twice.
+
+    Args:
+        events (dict[str, MeetingEvent]): The events by identifier, updated in place.
+        record (dict): The record.
+        find_user (Callable[[str], User]): Finds a user by username.
+
+    Raises:
+        KeyError: If the record misses a field or is for an event which does not exist.
+        ValueError: If the record has an unknown operation or a malformed value.
+        IllegalVoteError: If the vote or option is not allowed by the event.
+        IllegalAvailabilityError: If the availability is not allowed by the event.
+    """
+    op = record["op"]
+
+    if op == "event":
+        packed = record["packed"] and PACKED_VOTES_AVAILABLE
+        event = MeetingEvent(name=record["name"],
+                             options=[_option(date, hour) for date, hour in record["options"]],
+                             attendees={find_user(username) for username in record["attendees"]},
+                             organizer=find_user(record["organizer"]) if record["organizer"] else None,
+                             event_id=record["id"],
+                             tally=PackedVoteTally if packed else BucketVoteTally,
+                             duration=datetime.timedelta(seconds=record["duration"]),
+                             version=record.get("version", 0))
+
+        for username, windows in record["availability"].items():
+            event.availability[find_user(username)] = _windows(windows)
+
+        for username, date, hour in record["ballots"]:
+            event.tally.vote(find_user(username), event.options[_option(date, hour)])
+
+        voted_date = record["votedDate"]
+        event.voted_date = datetime.datetime.fromisoformat(voted_date) if voted_date else None
+        event.open_voting = record["openVoting"]
+        events[event.id] = event
+        return
+
+    event = events[record["id"]]
+
+    if record.get("version", event.version) != event.version:
+        return
+
+    if op == "vote":
+        event.vote(find_user(record["voter"]), _option(*record["option"]))
+    elif op == "options":
+        for option in [_option(date, hour) for date, hour in record["options"]]:
+            event.add_option(option)
+    elif op == "availability":
+        event.set_availability(find_user(record["attendee"]), _windows(record["windows"]))
+    elif op == "close":
+        event.close_voting()
+    else:
+        raise ValueError(f"Unknown journal record {op}.")
+
+    event.version += 1
+
+
+class EventJournal:
+    """
+    Journals the changes to meeting events as JSON lines appended to segment files within a directory.
+
+    Appending a record only buffers it, with the function applying its change, and returns a future. The first record
+    of a batch starts a commit after the commit window, which writes every record buffered meanwhile and syncs them
+    with a single fsync, so the fsync rate no longer bounds the changes per second: concurrent changes wait at most the
+    window plus one write for each other. Records appended while a batch is written join the next one. It must be used
+    from the event loop.
+
+    Changes are applied once their batch is durable, right before their futures are done, so the events never hold a
+    change the journal could lose, even when the caller stopped waiting. A batch is durable and applied as a whole or
+    not at all: when writing it fails, the segment is truncated back to where the batch started and each of its records
+    fails with the error, unapplied. Should the truncation fail too, what the segment holds is unknown, so every record
+    fails from then on.
+
+    Once snapshot_every records were committed since the last snapshot, the journal switches to a new segment and a
+    worker thread writes a snapshot of the events stored when the previous segment ended, while later batches are
+    committed to the new one. Events are changed in place, so the snapshot may already hold some changes of the new
+    segment: each event is written between two changes, with its version, and replaying skips the records of the
+    versions it holds. Replaying reads the latest snapshot and the segments after it, and older files are deleted once
+    the snapshot is durable. Records which cannot be applied, like a vote for an option or an
+    event which does not exist, are logged and skipped.
+
+    Attributes:
+        directory (Path): Where segments and snapshots are written.
+        commit_window (float): Seconds records wait for other records before they are committed together.
+        snapshot_every (int): Records committed between snapshots.
+        appended (int): Records appended.
+        commits (int): Batches committed, one fsync each.
+        snapshots (int): Snapshots written.
+        skipped (int): Records skipped while replaying because they could not be applied.
+    """
+
+    def __init__(self, directory: str | os.PathLike, commit_window: float = 0.002, snapshot_every: int = 100_000):
+        self.directory = Path(directory)
+        self.commit_window = commit_window
+        self.snapshot_every = snapshot_every
+        self.appended = 0
+        self.commits = 0
+        self.snapshots = 0
+        self.skipped = 0
+        self._segment = 0
+        self._file = None
+        self._state: Callable[[], Iterable[MeetingEvent]] = tuple
+        self._since_snapshot = 0
+        self._pending: list[tuple[bytes, Callable[[], None] | None, asyncio.Future]] = []
+        self._error: OSError | None = None
+        self._committer: asyncio.Task | None = None
+        self._snapshotter: asyncio.Task | None = None
+        self._applying = threading.Lock()
+
+    def _files(self, prefix: str) -> list[tuple[int, Path]]:
+        return sorted((int(path.name[len(prefix):-len(SUFFIX)]), path)
+                      for path in self.directory.glob(f"{prefix}*{SUFFIX}"))
+
+    def replay(self, find_user: Callable[[str], User]) -> list[MeetingEvent]:
+        """
+        Rebuilds the events from the latest snapshot and the segments written after it.
+
+        A record cut short by a crash was never committed, so it is skipped, as is any record which cannot be applied.
+
+        Args:
+            find_user (Callable[[str], User]): Finds a user by username.
+
+        Returns:
+            list[MeetingEvent]: The journaled events.
+        """
+        snapshots = self._files(SNAPSHOT_PREFIX)
+        start, snapshot = snapshots[-1] if snapshots else (0, None)
+        events: dict[str, MeetingEvent] = {}
+
+        for record in self._read(snapshot):
+            self._apply(events, record, find_user, snapshot)
+
+        for segment, path in self._files(SEGMENT_PREFIX):
+            if segment >= start:
+                for record in self._read(path):
+                    self._apply(events, record, find_user, path)
+                    self._since_snapshot += 1
+
+        return list(events.values())
+
+    def _apply(self, events: dict[str, MeetingEvent], record: dict, find_user: Callable[[str], User],
+               path: Path | None) -> None:
+        try:
+            apply_record(events, record, find_user)
+        except BAD_RECORD_ERRORS as e:
+            self.skipped += 1
+            log.warning("Journal %s has a record which cannot be applied, it is skipped: %s %r", path, record, e)
+
+    @staticmethod
+    def _read(path: Path | None) -> Iterator[dict]:
+        if path is None:
+            return
+
+        with path.open("rb") as file:
+            for line in file:
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    log.warning("Journal %s ends with a partial record, it is skipped.", path)
+                    return
+
+    def open(self, repository: MeetingEventRepository, find_user: Callable[[str], User | None]) -> None:
+        """
+        Replays the journal into a repository and starts a new segment for the changes to come.
+
+        Snapshots are taken from the events of that repository. Attendees who are no longer registered are kept by
+        username alone.
+
+        Args:
+            repository (MeetingEventRepository): The repository to load the events into.
+            find_user (Callable[[str], User | None]): Finds a registered user by username.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        users: dict[str, User] = {}
+
+        def cached_user(username: str) -> User:
+            if username not in users:
+                users[username] = find_user(username) or User(username=username, email="", password="")
+            return users[username]
+
+        events = self.replay(cached_user)
+
+        for event in events:
+            repository.save(event)
+
+        self._state = repository.find_all
+        files = self._files(SEGMENT_PREFIX) + self._files(SNAPSHOT_PREFIX)
+        self._segment = max((number for number, _ in files), default=-1) + 1
+        self._file = self._open_segment(self._segment)
+
+        log.info("Journal replayed %d events, %d records after the last snapshot, %d records skipped.", len(events),
+                 self._since_snapshot, self.skipped)
+
+    def _open_segment(self, segment: int):
+        # Unbuffered, so nothing of a batch which failed lingers to be written with the next one.
+        return (self.directory / f"{SEGMENT_PREFIX}{segment}{SUFFIX}").open("ab", buffering=0)
+
+    def append(self, record: dict, apply: Callable[[], None] | None = None) -> asyncio.Future:
+        """
+        Appends a record to the journal.
+
+        Args:
+            record (dict): The record, which must be serializable to JSON.
+            apply (Callable[[], None] | None): Applies the change of the record, called from the event loop once the
+                record is durable.
+
+        Returns:
+            asyncio.Future: Done once the record is durable and its change applied, or failed with the OSError which
+                prevented it or with the error applying the change raised.
+        """
+        future = asyncio.get_running_loop().create_future()
+
+        if self._error is not None:
+            future.set_exception(self._error)
+            return future
+
+        self._pending.append((orjson.dumps(record) + b"\n", apply, future))
+        self.appended += 1
+
+        if self._committer is None:
+            self._committer = asyncio.create_task(self._commit())
+
+        return future
+
+    async def _commit(self) -> None:
+        try:
+            await asyncio.sleep(self.commit_window)
+
+            while self._pending:
+                batch, self._pending = self._pending, []
+
+                try:
+                    if self._error is not None:
+                        raise self._error
+
+                    await to_thread.run_sync(self._write, self._file, b"".join(line for line, _, _ in batch))
+                except OSError as e:
+                    log.exception("Journal commit failed, its changes are not applied.")
+                    for _, _, waiter in batch:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                    continue
+
+                self.commits += 1
+                self._since_snapshot += len(batch)
+
+                with self._applying:
+                    for _, apply, waiter in batch:
+                        try:
+                            if apply is not None:
+                                apply()
+                        except Exception as e:
+                            if not waiter.done():
+                                waiter.set_exception(e)
+                        else:
+                            if not waiter.done():
+                                waiter.set_result(None)
+
+                if self._since_snapshot >= self.snapshot_every and self._snapshotter is None:
+                    self._rotate()
+        finally:
+            self._committer = None
+
+    def _write(self, file, data: bytes) -> None:
+        size = os.fstat(file.fileno()).st_size
+
+        try:
+            self._sync(file, data)
+        except OSError:
+            try:
+                os.ftruncate(file.fileno(), size)
+                os.fsync(file.fileno())
+            except OSError as e:
+                log.exception("Journal could not remove a failed commit from %s, it fails every record.", file.name)
+                self._error = e
+            raise
+
+    @staticmethod
+    def _sync(file, data: bytes) -> None:
+        view = memoryview(data)
+
+        while view:
+            view = view[file.write(view):]
+
+        file.flush()
+        os.fsync(file.fileno())
+
+    def _rotate(self) -> None:
+        # Every committed change was applied and the pending records go to the new segment, so the events stored now
+        # hold at least the records of the segments before it.
+        events = list(self._state())
+        previous = self._file
+        self._segment += 1
+        self._file = self._open_segment(self._segment)
+        self._since_snapshot = 0
+        self._snapshotter = asyncio.create_task(self._snapshot(previous, events, self._segment))
+
+    async def _snapshot(self, previous, events: list[MeetingEvent], segment: int) -> None:
+        try:
+            await to_thread.run_sync(self._write_snapshot, previous, events, segment)
+        except OSError:
+            log.exception("Journal snapshot failed, replaying will read the segments it covers.")
+        else:
+            self.snapshots += 1
+        finally:
+            self._snapshotter = None
+
+    def _write_snapshot(self, previous, events: list[MeetingEvent], segment: int) -> None:
+        previous.close()
+        path = self.directory / f"{SNAPSHOT_PREFIX}{segment}{SUFFIX}"
+        partial = path.with_suffix(".partial")
+
+        with partial.open("wb") as file:
+            self._sync(file, b"".join(self._record(event) for event in events))
+
+        os.replace(partial, path)
+        self._sync_directory()
+
+        for number, old in self._files(SEGMENT_PREFIX) + self._files(SNAPSHOT_PREFIX):
+            if number < segment:
+                old.unlink()
+
+    def _record(self, event: MeetingEvent) -> bytes:
+        # The loop changes events in place meanwhile, so each one is read between two changes.
+        with self._applying:
+            return orjson.dumps(event_record(event)) + b"\n"
+
+    def _sync_directory(self) -> None:
+        descriptor = os.open(self.directory, os.O_RDONLY)
+        try:
+            os.fsync(descriptor)
+        finally:
+            os.close(descriptor)
+
+    async def close(self) -> None:
+        """
+        Commits the records still buffered, waits for the snapshot being written and closes the current segment.
+        """
+        if self._committer is not None:
+            await self._committer
+
+        if self._snapshotter is not None:
+            await self._snapshotter
+
+        if self._file is not None:
+            self._file.close()
+            self._file = None
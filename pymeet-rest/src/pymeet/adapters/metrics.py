@@ -0,0 +1,323 @@
+"""Metrics
+
+In-process metrics rendered in the Prometheus text format, cheap enough to be recorded on every request.
+
+Histograms keep a fixed array of bucket counts per label set, found with a bisect, so an observation is a dictionary
+lookup and a few integer increments. Gauges are read from callbacks when the metrics are rendered, so the values they
+report cost nothing between scrapes.
+"""
+import time
+from bisect import bisect_left
+from typing import Callable, Generic, Iterator, Sized, TypeVar, cast
+
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+DEFAULT_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0,
+                   10.0)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+
+    if extra:
+        pairs.append(extra)
+
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class HistogramSeries:
+    """
+    The observations of a histogram for one set of label values.
+
+    Attributes:
+        buckets (list[int]): Observations per bucket, not cumulative, the last one above every bound.
+        sum (float): Sum of the observed values.
+        count (int): Number of observations.
+    """
+
+    __slots__ = ("_bounds", "buckets", "sum", "count")
+
+    def __init__(self, bounds: tuple[float, ...]):
+        self._bounds = bounds
+        self.buckets = [0] * (len(bounds) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """
+        Records a value.
+
+        Args:
+            value (float): The value, usually seconds.
+        """
+        self.buckets[bisect_left(self._bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+class Histogram:
+    """
+    Counts observations in buckets, one series per set of label values.
+
+    Attributes:
+        name (str): The metric name.
+        documentation (str): The help text.
+        label_names (tuple[str, ...]): The names of the labels, in the order their values are given.
+        bounds (tuple[float, ...]): The upper bound of each bucket, sorted.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                 buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self.bounds = tuple(sorted(buckets))
+        self._series: dict[tuple[str, ...], HistogramSeries] = {}
+
+    def labels(self, *values: str) -> HistogramSeries:
+        """
+        Gets the series of a set of label values, created on first use.
+
+        Args:
+            *values (str): The label values, in the order of the label names.
+
+        Returns:
+            HistogramSeries: The series, which can be kept to skip the lookup.
+        """
+        series = self._series.get(values)
+
+        if series is None:
+            series = self._series.setdefault(values, HistogramSeries(self.bounds))
+
+        return series
+
+    def observe(self, value: float, *values: str) -> None:
+        """
+        Records a value in the series of a set of label values.
+
+        Args:
+            value (float): The value, usually seconds.
+            *values (str): The label values, in the order of the label names.
+        """
+        series = self._series.get(values)
+
+        if series is None:
+            series = self._series.setdefault(values, HistogramSeries(self.bounds))
+
+        series.observe(value)
+
+    def samples(self) -> Iterator[str]:
+        """
+        Renders every series as cumulative buckets followed by their sum and count.
+
+        Returns:
+            Iterator[str]: The sample lines.
+        """
+        for values, series in sorted(self._series.items()):
+            cumulative = 0
+
+            for bound, count in zip(self.bounds + (float("inf"),), series.buckets):
+                cumulative += count
+                le = _labels(self.label_names, values, f'le="{_number(bound)}"')
+                yield f"{self.name}_bucket{le} {cumulative}"
+
+            labels = _labels(self.label_names, values)
+            yield f"{self.name}_sum{labels} {_number(series.sum)}"
+            yield f"{self.name}_count{labels} {series.count}"
+
+
+class Gauge:
+    """
+    Reports values read from callbacks when rendered, one callback per set of label values.
+
+    Attributes:
+        name (str): The metric name.
+        documentation (str): The help text.
+        label_names (tuple[str, ...]): The names of the labels, in the order their values are given.
+    """
+
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._functions: dict[tuple[str, ...], Callable[[], float]] = {}
+
+    def set_function(self, function: Callable[[], float], *values: str) -> None:
+        """
+        Reads the value of a set of label values from a callback, replacing the previous one.
+
+        Args:
+            function (Callable[[], float]): Returns the current value. It runs on the event loop, so it must be cheap.
+            *values (str): The label values, in the order of the label names.
+        """
+        self._functions[values] = function
+
+    def samples(self) -> Iterator[str]:
+        """
+        Renders the current value of every set of label values.
+
+        Returns:
+            Iterator[str]: The sample lines.
+        """
+        for values, function in sorted(self._functions.items(), key=lambda item: item[0]):
+            yield f"{self.name}{_labels(self.label_names, values)} {_number(function())}"
+
+
+T = TypeVar("T")
+M = TypeVar("M", Histogram, Gauge)
+
+
+class MetricsRegistry:
+    """
+    Holds the metrics of a process and renders them in the Prometheus text format.
+
+    Metrics are registered once by name, registering the same name again returns the existing metric.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, Histogram | Gauge] = {}
+
+    def _register(self, metric: M) -> M:
+        registered = self._metrics.setdefault(metric.name, metric)
+
+        if not isinstance(registered, type(metric)) or registered.label_names != metric.label_names:
+            raise ValueError(f"Metric {metric.name} is already registered with another type or labels.")
+
+        return registered
+
+    def histogram(self, name: str, documentation: str, label_names: tuple[str, ...] = (),
+                  buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> Histogram:
+        """
+        Registers a histogram.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            label_names (tuple[str, ...]): The names of the labels.
+            buckets (tuple[float, ...]): The upper bound of each bucket.
+
+        Returns:
+            Histogram: The histogram registered with that name.
+
+        Raises:
+            ValueError: If a different metric is registered with that name.
+        """
+        return self._register(Histogram(name, documentation, label_names, buckets))
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        """
+        Registers a gauge.
+
+        Args:
+            name (str): The metric name.
+            documentation (str): The help text.
+            label_names (tuple[str, ...]): The names of the labels.
+
+        Returns:
+            Gauge: The gauge registered with that name.
+
+        Raises:
+            ValueError: If a different metric is registered with that name.
+        """
+        return self._register(Gauge(name, documentation, label_names))
+
+    def render(self) -> str:
+        """
+        Renders every metric.
+
+        Returns:
+            str: The metrics in the Prometheus text format.
+        """
+        lines = []
+
+        for name, metric in sorted(self._metrics.items()):
+            lines.append(f"# HELP {name} {_escape(metric.documentation)}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            lines.extend(metric.samples())
+
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+REQUEST_LATENCY = REGISTRY.histogram("pymeet_http_request_duration_seconds",
+                                     "Time to serve HTTP requests, by route template, method and status.",
+                                     ("route", "method", "status"))
+
+PASSWORD_ENCODER_LATENCY = REGISTRY.histogram("pymeet_password_encoder_seconds",
+                                              "Time from submitting a password to its encoding or verification, "
+                                              "queueing included.",
+                                              ("operation",))
+
+REPOSITORY_LATENCY = REGISTRY.histogram("pymeet_repository_operation_seconds",
+                                        "Time spent in repository operations.",
+                                        ("repository", "method"))
+
+
+class Timed(Generic[T]):
+    """
+    Proxies an object, timing every call to its public methods in a histogram labeled by name and method.
+
+    Attributes are looked up once, then the timed method is cached on the proxy, so a call costs two clock reads and
+    an observation. Use timed to get the proxy typed as the object it proxies.
+
+    Attributes:
+        target (T): The proxied object.
+    """
+
+    def __init__(self, target: T, histogram: Histogram = REPOSITORY_LATENCY, name: str = ""):
+        self.target = target
+        self._histogram = histogram
+        self._name = name or type(target).__name__
+
+    def __getattr__(self, attribute: str):
+        value = getattr(self.target, attribute)
+
+        if attribute.startswith("_") or not callable(value):
+            return value
+
+        series = self._histogram.labels(self._name, attribute)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+
+            try:
+                return value(*args, **kwargs)
+            finally:
+                series.observe(time.perf_counter() - start)
+
+        setattr(self, attribute, timed)
+        return timed
+
+    def __len__(self) -> int:
+        return len(cast(Sized, self.target))
+
+
+def timed(target: T, histogram: Histogram = REPOSITORY_LATENCY, name: str = "") -> T:
+    """
+    Times every call to the public methods of an object.
+
+    Args:
+        target (T): The object.
+        histogram (Histogram): The histogram observing the calls, labeled by name and method.
+        name (str): The name label, the class name of the object by default.
+
+    Returns:
+        T: A Timed proxy of the object, which has the same methods, typed as the object.
+    """
+    return cast(T, Timed(target, histogram, name))
@@ -0,0 +1,62 @@
+"""ORM
+
+This module maps the domain objects to relational tables and builds the database engine.
+"""
+import sqlite3
+
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import QueuePool
+
+metadata = MetaData()
+
+users = Table(
+    "users",
+    metadata,
+    Column("id", Integer, primary_key=True, autoincrement=True),
+    Column("username", String(150), nullable=False, unique=True, index=True),
+    Column("email", String(320), nullable=False),
+    Column("normalized_email", String(320), nullable=False, unique=True, index=True),
+    Column("password", String(255), nullable=False),
+)
+
+
+def _set_sqlite_pragmas(dbapi_connection: sqlite3.Connection, _connection_record) -> None:
+    """
+    Tunes every new SQLite connection.
+
+    WAL lets readers proceed while a writer commits, and NORMAL synchronous mode only syncs on checkpoints, which is
+    still safe against corruption in WAL mode.
+    """
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA busy_timeout=5000")
+    cursor.close()
+
+
+def create_sqlite_engine(url: str, pool_size: int = 5, max_overflow: int = 10, pool_timeout: float = 30) -> Engine:
+    """
+    Creates a SQLite engine backed by a connection pool and creates the tables if needed.
+
+    Args:
+        url (str): The database URL, e.g. sqlite:///pymeet.db
+        pool_size (int): The number of connections kept open.
+        max_overflow (int): The number of connections opened beyond the pool size under load.
+        pool_timeout (float): Seconds to wait for a connection before giving up.
+
+    Returns:
+        Engine: The database engine.
+    """
+    engine = create_engine(
+        url,
+        poolclass=QueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        connect_args={"check_same_thread": False},
+        future=True,
+    )
+    event.listen(engine, "connect", _set_sqlite_pragmas)
+    metadata.create_all(engine)
+    return engine
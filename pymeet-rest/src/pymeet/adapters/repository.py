@@ -3,15 +3,43 @@
 This module abstracts the Persistence layer with a Repository pattern.
 """
 import abc
+import datetime
+import threading
 from abc import ABC
-from typing import TypeVar
+from functools import partial
+from itertools import islice, takewhile
+from typing import Callable, Generic, Iterable, TypeVar
 
-from pymeet.domain.models import User
+from anyio import CapacityLimiter, to_thread
+
+from pymeet.adapters.indexes import IntervalIndex, SortedIndex
+from pymeet.domain.models import MeetingEvent, User
 
 T = TypeVar("T")
 
 
-class ReadOnlyRepository(abc.ABC):
+class DuplicateEntityError(Exception):
+    """
+    Exception raised when saving an entity would break a uniqueness constraint.
+    """
+    pass
+
+
+class EntityNotFoundError(Exception):
+    """
+    Exception raised when updating an entity which is not in the repository.
+    """
+    pass
+
+
+class StaleEntityError(Exception):
+    """
+    Exception raised when updating an entity which was changed since it was read.
+    """
+    pass
+
+
+class ReadOnlyRepository(abc.ABC, Generic[T]):
     """
     Abstract base class for read-only repository implementations.
     """
@@ -41,14 +69,29 @@ class ReadOnlyRepository(abc.ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def find_page(self, after: str | None = None, limit: int = 100) -> list[T]:
+        """
+        Finds a page of entities ordered by their key, using keyset pagination.
+
+        Args:
+            after (str | None): Key of the last entity of the previous page, None for the first page.
+            limit (int): The maximum number of entities to return.
+
+        Returns:
+            list[T] : Up to `limit` entities whose key comes after `after`.
+
+        """
+        raise NotImplementedError
+
 
-class WriteOnlyRepository(abc.ABC):
+class WriteOnlyRepository(abc.ABC, Generic[T]):
     """
     Abstract base class for write-only repository implementations.
     """
 
     @abc.abstractmethod
-    def save(self, entity) -> None:
+    def save(self, entity: T) -> None:
         """
         Saves an entity to the repository.
 
@@ -58,7 +101,20 @@ class WriteOnlyRepository(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def delete(self, entity) -> None:
+    def update(self, entity: T) -> None:
+        """
+        Replaces a stored entity with the given one.
+
+        Args:
+            entity (T): The entity to update.
+
+        Raises:
+            EntityNotFoundError: If the entity is not in the repository.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def delete(self, entity: T) -> None:
         """
         Deletes an entity from the repository.
 
@@ -68,18 +124,23 @@ class WriteOnlyRepository(abc.ABC):
         raise NotImplementedError
 
 
-class Repository(ReadOnlyRepository, WriteOnlyRepository, ABC):
+class Repository(ReadOnlyRepository[T], WriteOnlyRepository[T], ABC):
     """
     Abstract base class for repository implementations.
     """
     pass
 
 
-class UserRepository(Repository, ABC):
+class UserRepository(Repository[User], ABC):
     """
     Abstract base class for user repository implementations.
+
+    Attributes:
+        blocking (bool): Whether operations perform blocking I/O and must be kept off the event loop.
     """
 
+    blocking: bool = True
+
     @abc.abstractmethod
     def find_by_username(self, username: str) -> User | None:
         """
@@ -94,14 +155,84 @@ class UserRepository(Repository, ABC):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def find_by_email(self, email: str) -> User | None:
+        """
+        Finds a user by its email, ignoring case.
 
-class ListUserRepository(UserRepository):
+        Args:
+            email (str): The email of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_taken(self, usernames: Iterable[str], emails: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        Finds which of the given usernames and emails are already in use, in a single lookup.
+
+        Args:
+            usernames (Iterable[str]): The usernames to check.
+            emails (Iterable[str]): The emails to check.
+
+        Returns:
+            tuple[set[str], set[str]]: The usernames in use and the normalized emails in use.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def save_all(self, users: list[User]) -> None:
+        """
+        Saves several users at once, either all of them or none.
+
+        Args:
+            users (list[User]): The users to save.
+
+        Raises:
+            DuplicateEntityError: If any username or email is already in use.
+        """
+        raise NotImplementedError
+
+
+def normalize_email(email: str) -> str:
     """
-    A list user repository implementations.
+    Normalizes an email so that lookups are case-insensitive.
+
+    Args:
+        email (str): The email to normalize.
+
+    Returns:
+        str: The normalized email.
     """
+    return email.strip().lower()
+
 
-    def __init__(self):
-        self._users = []
+class InMemoryUserRepository(UserRepository):
+    """
+    An in-memory user repository implementation.
+
+    Users are kept in insertion order and indexed by username and by normalized email, so uniqueness checks and
+    lookups are constant time regardless of how many users are stored. Writes hold a lock, so uniqueness checks and
+    index updates stay consistent when the repository is shared by several threads.
+    """
+
+    blocking = False
+
+    def __init__(self, users: list[User] | None = None):
+        self._lock = threading.RLock()
+        self._by_username: dict[str, User] = {}
+        self._by_email: dict[str, User] = {}
+        self._usernames = SortedIndex()
+
+        for user in users or []:
+            self.save(user)
+
+    def __len__(self) -> int:
+        return len(self._by_username)
 
     def find_all(self) -> list[User]:
         """
@@ -111,12 +242,15 @@ class ListUserRepository(UserRepository):
             list[User] : A list of users.
 
         """
-        return self._users
+        return list(self._by_username.values())
 
     def find_by(self, **kwargs) -> User | None:
         """
         Finds a user by its attributes.
 
+        Lookups including the username or the email are resolved through an index, any other combination of
+        attributes falls back to a scan.
+
         Args:
             **kwargs: The attributes of a user.
 
@@ -124,8 +258,38 @@ class ListUserRepository(UserRepository):
             User : A user if exists, otherwise None.
 
         """
-        properties = kwargs.keys()
-        return next((x for x in self._users if all(getattr(x, p) == kwargs[p] for p in properties)), None)
+        candidates: Iterable[User | None]
+
+        if "username" in kwargs:
+            candidates = [self._by_username.get(kwargs["username"])]
+        elif "email" in kwargs:
+            candidates = [self._by_email.get(normalize_email(kwargs["email"]))]
+        else:
+            candidates = self._by_username.values()
+
+        return next((x for x in candidates if x is not None and self._matches(x, kwargs)), None)
+
+    def find_page(self, after: str | None = None, limit: int = 100) -> list[User]:
+        """
+        Finds a page of users ordered by username.
+
+        Args:
+            after (str | None): Username of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            list[User] : Up to `limit` users whose username comes after `after`.
+
+        """
+        usernames = islice(self._usernames.iter_from(after, inclusive=False), limit)
+        return [self._by_username[username] for username in usernames]
+
+    @staticmethod
+    def _matches(user: User, attributes: dict) -> bool:
+        return all(
+            normalize_email(user.email) == normalize_email(value) if name == "email" else getattr(user, name) == value
+            for name, value in attributes.items()
+        )
 
     def save(self, user: User) -> None:
         """
@@ -133,8 +297,65 @@ class ListUserRepository(UserRepository):
 
         Args:
             user (User): The user to save.
+
+        Raises:
+            DuplicateEntityError: If the username or the email is already in use.
+        """
+        email = normalize_email(user.email)
+
+        with self._lock:
+            if user.username in self._by_username or email in self._by_email:
+                raise DuplicateEntityError(f"User {user.username} <{user.email}> already exists.")
+
+            self._by_username[user.username] = user
+            self._by_email[email] = user
+            self._usernames.add(user.username)
+
+    def save_all(self, users: list[User]) -> None:
+        """
+        Saves several users at once, either all of them or none.
+
+        Args:
+            users (list[User]): The users to save.
+
+        Raises:
+            DuplicateEntityError: If any username or email is already in use.
         """
-        self._users.append(user)
+        usernames = {user.username for user in users}
+        emails = {normalize_email(user.email) for user in users}
+
+        with self._lock:
+            if len(usernames) < len(users) or len(emails) < len(users) or any(self.find_taken(usernames, emails)):
+                raise DuplicateEntityError("Some users already exist.")
+
+            for user in users:
+                self.save(user)
+
+    def update(self, user: User) -> None:
+        """
+        Replaces the stored user having the same username.
+
+        Args:
+            user (User): The user to update.
+
+        Raises:
+            EntityNotFoundError: If there is no user with that username.
+            DuplicateEntityError: If the new email is used by another user.
+        """
+        with self._lock:
+            stored = self._by_username.get(user.username)
+
+            if stored is None:
+                raise EntityNotFoundError(f"User {user.username} does not exist.")
+
+            old_email, new_email = normalize_email(stored.email), normalize_email(user.email)
+
+            if new_email != old_email and new_email in self._by_email:
+                raise DuplicateEntityError(f"Email {user.email} already in use.")
+
+            del self._by_email[old_email]
+            self._by_username[user.username] = user
+            self._by_email[new_email] = user
 
     def delete(self, user: User) -> None:
         """
@@ -143,7 +364,10 @@ class ListUserRepository(UserRepository):
         Args:
             user (User): The user to delete.
         """
-        self._users.remove(user)
+        with self._lock:
+            stored = self._by_username.pop(user.username)
+            del self._by_email[normalize_email(stored.email)]
+            self._usernames.remove(user.username)
 
     def find_by_username(self, username: str) -> User | None:
         """
@@ -156,4 +380,642 @@ class ListUserRepository(UserRepository):
             User : A user if exists, otherwise None.
 
         """
-        return self.find_by(username=username)
+        return self._by_username.get(username)
+
+    def find_by_email(self, email: str) -> User | None:
+        """
+        Finds a user by its email, ignoring case.
+
+        Args:
+            email (str): The email of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        return self._by_email.get(normalize_email(email))
+
+    def find_taken(self, usernames: Iterable[str], emails: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        Finds which of the given usernames and emails are already in use.
+
+        Args:
+            usernames (Iterable[str]): The usernames to check.
+            emails (Iterable[str]): The emails to check.
+
+        Returns:
+            tuple[set[str], set[str]]: The usernames in use and the normalized emails in use.
+
+        """
+        return ({username for username in usernames if username in self._by_username},
+                {email for email in map(normalize_email, emails) if email in self._by_email})
+
+
+class MeetingEventRepository(Repository[MeetingEvent], ABC):
+    """
+    Abstract base class for meeting event repository implementations.
+
+    Events are versioned: updating an event checks its version is still the stored one, raising StaleEntityError
+    otherwise, and increments it. A persistent implementation makes the check part of its write, for instance with
+    an `UPDATE ... WHERE id = :id AND version = :version` affecting no rows, so concurrent writers cannot overwrite each
+    other's changes.
+    """
+
+    @abc.abstractmethod
+    def find_by_id(self, event_id: str) -> MeetingEvent | None:
+        """
+        Finds an event by its identifier.
+
+        Args:
+            event_id (str): The identifier of an event.
+
+        Returns:
+            MeetingEvent : An event if exists, otherwise None.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def update(self, event: MeetingEvent, reindex: bool = True) -> None:
+        """
+        Replaces the stored event having the same identifier and version and increments its version.
+
+        Args:
+            event (MeetingEvent): The event to update.
+            reindex (bool): Whether its attendees or voted date may have changed, so its indexes are refreshed.
+
+        Raises:
+            EntityNotFoundError: If there is no event with that identifier.
+            StaleEntityError: If the stored event has another version.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_by_attendee(self, username: str, after: str | None = None, limit: int | None = None) -> list[MeetingEvent]:
+        """
+        Finds a page of the events a user attends, ordered by identifier.
+
+        Args:
+            username (str): The username of the attendee.
+            after (str | None): Identifier of the last event of the previous page, None for the first page.
+            limit (int | None): The maximum number of events to return, None for every event.
+
+        Returns:
+            list[MeetingEvent] : The events attended by the user.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_by_voted_date(self,
+                           start: datetime.datetime,
+                           end: datetime.datetime,
+                           attendee: str | None = None,
+                           after: str | None = None,
+                           limit: int | None = None) -> list[MeetingEvent]:
+        """
+        Finds a page of the events whose voted date falls in a range, ordered by voted date and then by identifier.
+
+        Args:
+            start (datetime.datetime): Start of the range, inclusive.
+            end (datetime.datetime): End of the range, exclusive.
+            attendee (str | None): Only events attended by this username.
+            after (str | None): Identifier of the last event of the previous page, None for the first page.
+            limit (int | None): The maximum number of events to return, None for every event.
+
+        Returns:
+            list[MeetingEvent] : The events ordered by voted date.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_overlapping(self, username: str, start: datetime.datetime, end: datetime.datetime) -> list[MeetingEvent]:
+        """
+        Finds the events with a voted date a user attends which overlap a range.
+
+        Args:
+            username (str): The username of the attendee.
+            start (datetime.datetime): Start of the range, inclusive.
+            end (datetime.datetime): End of the range, exclusive.
+
+        Returns:
+            list[MeetingEvent] : The overlapping events ordered by voted date.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def find_conflicts(self, username: str) -> list[tuple[MeetingEvent, list[MeetingEvent]]]:
+        """
+        Finds the events with a voted date a user attends which overlap other ones they attend.
+
+        Args:
+            username (str): The username of the attendee.
+
+        Returns:
+            list[tuple[MeetingEvent, list[MeetingEvent]]] : Each conflicting event, ordered by voted date, with the
+                events it overlaps.
+
+        """
+        raise NotImplementedError
+
+
+class InMemoryMeetingEventRepository(MeetingEventRepository):
+    """
+    An in-memory meeting event repository implementation.
+
+    Besides the events by identifier, it keeps a sorted index of the events of each attendee and a sorted index of
+    voted dates, so both queries cost O(log n + k) for a page of k events. Events are mutable, so the indexes are
+    refreshed whenever an event is saved, or updated with reindex, which costs O(attendees): updates which leave the
+    attendees and the voted date as they were, like votes, skip it and cost O(1).
+
+    Each attendee also has an interval index of their events with a voted date, their schedule, and the conflicts
+    between those events. Conflicts are found against the schedules as events get a voted date, so reading the
+    conflicts of a user never scans their events, and the events of an attendee within a range of voted dates are read
+    from their schedule.
+
+    Writes and the queries reading the indexes hold a lock, so the repository can be shared by the event loop and
+    worker threads.
+    """
+
+    def __init__(self, events: list[MeetingEvent] | None = None):
+        self._lock = threading.RLock()
+        self._by_id: dict[str, MeetingEvent] = {}
+        self._ids = SortedIndex()
+        self._by_attendee: dict[str, SortedIndex] = {}
+        self._by_voted_date = SortedIndex()
+        self._versions: dict[str, int] = {}
+        self._schedules: dict[str, IntervalIndex] = {}
+        self._conflicts: dict[str, dict[str, set[str]]] = {}
+        self._indexed: dict[str, tuple[frozenset[str], datetime.datetime | None, datetime.datetime | None]] = {}
+
+        for event in events or []:
+            self.save(event)
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def _index(self, event: MeetingEvent) -> None:
+        self._unindex(event.id)
+
+        attendees = frozenset(attendee.username for attendee in event.attendees)
+        voted_date, end_date = event.voted_date, event.end_date
+
+        for username in attendees:
+            self._by_attendee.setdefault(username, SortedIndex()).add(event.id)
+
+        if voted_date is not None and end_date is not None:
+            self._by_voted_date.add((voted_date, event.id))
+
+            for username in attendees:
+                self._schedule(username, event.id, voted_date, end_date)
+
+        self._indexed[event.id] = (attendees, voted_date, end_date)
+
+    def _schedule(self, username: str, event_id: str, start: datetime.datetime, end: datetime.datetime) -> None:
+        schedule = self._schedules.setdefault(username, IntervalIndex())
+        overlapping = [other_id for _, _, other_id in schedule.overlapping(start, end)]
+
+        if overlapping:
+            conflicts = self._conflicts.setdefault(username, {})
+            conflicts.setdefault(event_id, set()).update(overlapping)
+
+            for other_id in overlapping:
+                conflicts.setdefault(other_id, set()).add(event_id)
+
+        schedule.add(start, end, event_id)
+
+    def _unschedule(self, username: str, event_id: str, start: datetime.datetime, end: datetime.datetime) -> None:
+        schedule = self._schedules[username]
+        schedule.remove(start, end, event_id)
+
+        if not schedule:
+            del self._schedules[username]
+
+        conflicts = self._conflicts.get(username, {})
+
+        for other_id in conflicts.pop(event_id, ()):
+            conflicts[other_id].discard(event_id)
+
+            if not conflicts[other_id]:
+                del conflicts[other_id]
+
+        if not conflicts:
+            self._conflicts.pop(username, None)
+
+    def _unindex(self, event_id: str) -> None:
+        attendees, voted_date, end_date = self._indexed.pop(event_id, (frozenset(), None, None))
+
+        for username in attendees:
+            events = self._by_attendee[username]
+            events.remove(event_id)
+
+            if not events:
+                del self._by_attendee[username]
+
+        if voted_date is not None and end_date is not None:
+            self._by_voted_date.remove((voted_date, event_id))
+
+            for username in attendees:
+                self._unschedule(username, event_id, voted_date, end_date)
+
+    def find_all(self) -> list[MeetingEvent]:
+        """
+        Finds all events.
+
+        Returns:
+            list[MeetingEvent] : A list of events.
+
+        """
+        with self._lock:
+            return list(self._by_id.values())
+
+    def find_by(self, **kwargs) -> MeetingEvent | None:
+        """
+        Finds an event by its attributes.
+
+        Args:
+            **kwargs: The attributes of an event.
+
+        Returns:
+            MeetingEvent : An event if exists, otherwise None.
+
+        """
+        with self._lock:
+            candidates = [self._by_id.get(kwargs["id"])] if "id" in kwargs else self._by_id.values()
+            properties = kwargs.keys()
+            return next((x for x in candidates
+                         if x is not None and all(getattr(x, p) == kwargs[p] for p in properties)), None)
+
+    def find_page(self, after: str | None = None, limit: int = 100) -> list[MeetingEvent]:
+        """
+        Finds a page of events ordered by identifier.
+
+        Args:
+            after (str | None): Identifier of the last event of the previous page, None for the first page.
+            limit (int): The maximum number of events to return.
+
+        Returns:
+            list[MeetingEvent] : Up to `limit` events whose identifier comes after `after`.
+
+        """
+        with self._lock:
+            return [self._by_id[event_id] for event_id in islice(self._ids.iter_from(after, inclusive=False), limit)]
+
+    def find_by_id(self, event_id: str) -> MeetingEvent | None:
+        """
+        Finds an event by its identifier.
+
+        Args:
+            event_id (str): The identifier of an event.
+
+        Returns:
+            MeetingEvent : An event if exists, otherwise None.
+
+        """
+        return self._by_id.get(event_id)
+
+    def find_by_attendee(self, username: str, after: str | None = None, limit: int | None = None) -> list[MeetingEvent]:
+        """
+        Finds a page of the events a user attends, ordered by identifier.
+
+        Args:
+            username (str): The username of the attendee.
+            after (str | None): Identifier of the last event of the previous page, None for the first page.
+            limit (int | None): The maximum number of events to return, None for every event.
+
+        Returns:
+            list[MeetingEvent] : The events attended by the user.
+
+        """
+        with self._lock:
+            events = self._by_attendee.get(username)
+
+            if events is None:
+                return []
+
+            return [self._by_id[event_id] for event_id in islice(events.iter_from(after, inclusive=False), limit)]
+
+    def find_by_voted_date(self,
+                           start: datetime.datetime,
+                           end: datetime.datetime,
+                           attendee: str | None = None,
+                           after: str | None = None,
+                           limit: int | None = None) -> list[MeetingEvent]:
+        """
+        Finds a page of the events whose voted date falls in a range, ordered by voted date and then by identifier.
+
+        The events of an attendee are read from their schedule, so the cost only depends on the events in the page.
+
+        Args:
+            start (datetime.datetime): Start of the range, inclusive.
+            end (datetime.datetime): End of the range, exclusive.
+            attendee (str | None): Only events attended by this username.
+            after (str | None): Identifier of the last event of the previous page, None for the first page.
+            limit (int | None): The maximum number of events to return, None for every event.
+
+        Returns:
+            list[MeetingEvent] : The events ordered by voted date.
+
+        """
+        with self._lock:
+            _, voted_date, end_date = self._indexed.get(after or "", (frozenset(), None, None))
+            resume = voted_date is not None and voted_date >= start
+            index: SortedIndex | IntervalIndex | None = self._by_voted_date
+
+            if attendee is None:
+                first: tuple = (voted_date, after) if resume else (start,)
+            else:
+                index = self._schedules.get(attendee)
+                first = (voted_date, end_date, after) if resume else (start,)
+
+            if index is None:
+                return []
+
+            keys = takewhile(lambda key: key[0] < end, index.iter_from(first, inclusive=not resume))
+            return [self._by_id[key[-1]] for key in islice(keys, limit)]
+
+    def find_overlapping(self, username: str, start: datetime.datetime, end: datetime.datetime) -> list[MeetingEvent]:
+        """
+        Finds the events with a voted date a user attends which overlap a range.
+
+        Args:
+            username (str): The username of the attendee.
+            start (datetime.datetime): Start of the range, inclusive.
+            end (datetime.datetime): End of the range, exclusive.
+
+        Returns:
+            list[MeetingEvent] : The overlapping events ordered by voted date.
+
+        """
+        with self._lock:
+            schedule = self._schedules.get(username)
+            return [self._by_id[event_id] for _, _, event_id in schedule.overlapping(start, end)] if schedule else []
+
+    def find_conflicts(self, username: str) -> list[tuple[MeetingEvent, list[MeetingEvent]]]:
+        """
+        Finds the events with a voted date a user attends which overlap other ones they attend.
+
+        Args:
+            username (str): The username of the attendee.
+
+        Returns:
+            list[tuple[MeetingEvent, list[MeetingEvent]]] : Each conflicting event, ordered by voted date, with the
+                events it overlaps.
+
+        """
+        def by_voted_date(event: MeetingEvent):
+            return event.voted_date, event.id
+
+        with self._lock:
+            conflicts = [(self._by_id[event_id],
+                          sorted((self._by_id[other_id] for other_id in others), key=by_voted_date))
+                         for event_id, others in self._conflicts.get(username, {}).items()]
+            return sorted(conflicts, key=lambda conflict: by_voted_date(conflict[0]))
+
+    def save(self, event: MeetingEvent) -> None:
+        """
+        Saves an event to the repository.
+
+        Args:
+            event (MeetingEvent): The event to save.
+
+        Raises:
+            DuplicateEntityError: If there is already an event with that identifier.
+        """
+        with self._lock:
+            if event.id in self._by_id:
+                raise DuplicateEntityError(f"Event {event.id} already exists.")
+
+            self._by_id[event.id] = event
+            self._versions[event.id] = event.version
+            self._ids.add(event.id)
+            self._index(event)
+
+    def update(self, event: MeetingEvent, reindex: bool = True) -> None:
+        """
+        Replaces the stored event having the same identifier and version and increments its version.
+
+        Args:
+            event (MeetingEvent): The event to update.
+            reindex (bool): Whether its attendees or voted date may have changed, so its indexes are refreshed.
+
+        Raises:
+            EntityNotFoundError: If there is no event with that identifier.
+            StaleEntityError: If the stored event has another version.
+        """
+        with self._lock:
+            if event.id not in self._by_id:
+                raise EntityNotFoundError(f"Event {event.id} does not exist.")
+
+            if self._versions[event.id] != event.version:
+                raise StaleEntityError(f"Event {event.id} changed since version {event.version}.")
+
+            event.version += 1
+            self._versions[event.id] = event.version
+            self._by_id[event.id] = event
+
+            if reindex:
+                self._index(event)
+
+    def delete(self, event: MeetingEvent) -> None:
+        """
+        Deletes an event from the repository.
+
+        Args:
+            event (MeetingEvent): The event to delete.
+        """
+        with self._lock:
+            del self._by_id[event.id]
+            del self._versions[event.id]
+            self._ids.remove(event.id)
+            self._unindex(event.id)
+
+
+class AsyncUserRepository(abc.ABC):
+    """
+    Abstract base class for user repository implementations which can be awaited from the event loop.
+    """
+
+    @abc.abstractmethod
+    async def find_all(self) -> list[User]:
+        """
+        Finds all users.
+
+        Returns:
+            list[User] : A list of users.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_by(self, **kwargs) -> User | None:
+        """
+        Finds a user by its attributes.
+
+        Args:
+            **kwargs: The attributes of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_page(self, after: str | None = None, limit: int = 100) -> list[User]:
+        """
+        Finds a page of users ordered by username.
+
+        Args:
+            after (str | None): Username of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            list[User] : Up to `limit` users whose username comes after `after`.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_by_username(self, username: str) -> User | None:
+        """
+        Finds a user by its username.
+
+        Args:
+            username (str): The username of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_by_email(self, email: str) -> User | None:
+        """
+        Finds a user by its email, ignoring case.
+
+        Args:
+            email (str): The email of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def find_taken(self, usernames: Iterable[str], emails: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        Finds which of the given usernames and emails are already in use, in a single lookup.
+
+        Args:
+            usernames (Iterable[str]): The usernames to check.
+            emails (Iterable[str]): The emails to check.
+
+        Returns:
+            tuple[set[str], set[str]]: The usernames in use and the normalized emails in use.
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def save_all(self, users: list[User]) -> None:
+        """
+        Saves several users at once, either all of them or none.
+
+        Args:
+            users (list[User]): The users to save.
+
+        Raises:
+            DuplicateEntityError: If any username or email is already in use.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def save(self, user: User) -> None:
+        """
+        Saves a user to the repository.
+
+        Args:
+            user (User): The user to save.
+
+        Raises:
+            DuplicateEntityError: If the username or the email is already in use.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def update(self, user: User) -> None:
+        """
+        Replaces the stored user having the same username.
+
+        Args:
+            user (User): The user to update.
+
+        Raises:
+            EntityNotFoundError: If there is no user with that username.
+            DuplicateEntityError: If the new email is used by another user.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def delete(self, user: User) -> None:
+        """
+        Deletes a user from the repository.
+
+        Args:
+            user (User): The user to delete.
+        """
+        raise NotImplementedError
+
+
+class AsyncUserRepositoryAdapter(AsyncUserRepository):
+    """
+    Exposes a user repository to the event loop.
+
+    Non-blocking repositories, such as the in-memory store, are called inline. Blocking ones run in a worker thread
+    bounded by the given limiter, so a request only holds a thread while it waits on the database.
+    """
+
+    def __init__(self, repository: UserRepository, limiter: CapacityLimiter | None = None):
+        self.repository = repository
+        self.limiter = limiter
+
+    async def _call(self, func: Callable, *args, **kwargs):
+        if not self.repository.blocking:
+            return func(*args, **kwargs)
+
+        return await to_thread.run_sync(partial(func, *args, **kwargs), limiter=self.limiter)
+
+    async def find_all(self) -> list[User]:
+        return await self._call(self.repository.find_all)
+
+    async def find_by(self, **kwargs) -> User | None:
+        return await self._call(self.repository.find_by, **kwargs)
+
+    async def find_page(self, after: str | None = None, limit: int = 100) -> list[User]:
+        return await self._call(self.repository.find_page, after, limit)
+
+    async def find_by_username(self, username: str) -> User | None:
+        return await self._call(self.repository.find_by_username, username)
+
+    async def find_by_email(self, email: str) -> User | None:
+        return await self._call(self.repository.find_by_email, email)
+
+    async def find_taken(self, usernames: Iterable[str], emails: Iterable[str]) -> tuple[set[str], set[str]]:
+        return await self._call(self.repository.find_taken, usernames, emails)
+
+    async def save_all(self, users: list[User]) -> None:
+        await self._call(self.repository.save_all, users)
+
+    async def save(self, user: User) -> None:
+        await self._call(self.repository.save, user)
+
+    async def update(self, user: User) -> None:
+        await self._call(self.repository.update, user)
+
+    async def delete(self, user: User) -> None:
+        await self._call(self.repository.delete, user)
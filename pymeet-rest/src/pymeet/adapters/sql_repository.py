@@ -0,0 +1,224 @@
+"""SQL Repository
+
+This module implements the repositories on top of a relational database through SQLAlchemy Core.
+"""
+from typing import Iterable
+
+from sqlalchemy import bindparam, delete, insert, or_, select, update
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.exc import IntegrityError
+
+from pymeet.adapters.orm import users
+from pymeet.adapters.repository import DuplicateEntityError, EntityNotFoundError, UserRepository, normalize_email
+from pymeet.domain.models import User
+
+# Statements are built once so SQLAlchemy compiles them a single time and the driver can reuse its prepared
+# statement cache on every call.
+_FIND_ALL = select(users).order_by(users.c.id)
+_FIND_FIRST_PAGE = select(users).order_by(users.c.username).limit(bindparam("limit"))
+_FIND_PAGE = (select(users)
+              .where(users.c.username > bindparam("after"))
+              .order_by(users.c.username)
+              .limit(bindparam("limit")))
+_FIND_BY_USERNAME = select(users).where(users.c.username == bindparam("username"))
+_FIND_BY_EMAIL = select(users).where(users.c.normalized_email == bindparam("normalized_email"))
+_FIND_TAKEN = select(users.c.username, users.c.normalized_email).where(
+    or_(users.c.username.in_(bindparam("usernames", expanding=True)),
+        users.c.normalized_email.in_(bindparam("emails", expanding=True))))
+_INSERT = insert(users)
+_UPDATE = update(users).where(users.c.username == bindparam("target_username"))
+_DELETE = delete(users).where(users.c.username == bindparam("username"))
+
+
+def _to_user(row: Row) -> User:
+    return User(username=row.username, email=row.email, password=row.password)
+
+
+class SqlAlchemyUserRepository(UserRepository):
+    """
+    A user repository backed by a SQL database.
+    """
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def find_all(self) -> list[User]:
+        """
+        Finds all users.
+
+        Returns:
+            list[User] : A list of users.
+
+        """
+        with self.engine.connect() as connection:
+            return [_to_user(row) for row in connection.execute(_FIND_ALL)]
+
+    def find_by(self, **kwargs) -> User | None:
+        """
+        Finds a user by its attributes.
+
+        Args:
+            **kwargs: The attributes of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        statement = select(users)
+
+        for name, value in kwargs.items():
+            if name == "email":
+                statement = statement.where(users.c.normalized_email == normalize_email(value))
+            else:
+                statement = statement.where(users.c[name] == value)
+
+        with self.engine.connect() as connection:
+            row = connection.execute(statement.limit(1)).first()
+
+        return _to_user(row) if row else None
+
+    def find_page(self, after: str | None = None, limit: int = 100) -> list[User]:
+        """
+        Finds a page of users ordered by username, seeking through the username index.
+
+        Args:
+            after (str | None): Username of the last user of the previous page, None for the first page.
+            limit (int): The maximum number of users to return.
+
+        Returns:
+            list[User] : Up to `limit` users whose username comes after `after`.
+
+        """
+        with self.engine.connect() as connection:
+            if after is None:
+                rows = connection.execute(_FIND_FIRST_PAGE, {"limit": limit})
+            else:
+                rows = connection.execute(_FIND_PAGE, {"after": after, "limit": limit})
+
+            return [_to_user(row) for row in rows]
+
+    def find_taken(self, usernames: Iterable[str], emails: Iterable[str]) -> tuple[set[str], set[str]]:
+        """
+        Finds which of the given usernames and emails are already in use, in a single query.
+
+        Args:
+            usernames (Iterable[str]): The usernames to check.
+            emails (Iterable[str]): The emails to check.
+
+        Returns:
+            tuple[set[str], set[str]]: The usernames in use and the normalized emails in use.
+
+        """
+        usernames, emails = set(usernames), {normalize_email(email) for email in emails}
+
+        with self.engine.connect() as connection:
+            rows = connection.execute(_FIND_TAKEN, {"usernames": list(usernames), "emails": list(emails)}).all()
+
+        return ({row.username for row in rows} & usernames,
+                {row.normalized_email for row in rows} & emails)
+
+    def save_all(self, users: list[User]) -> None:
+        """
+        Saves several users in a single transaction, either all of them or none.
+
+        Args:
+            users (list[User]): The users to save.
+
+        Raises:
+            DuplicateEntityError: If any username or email is already in use.
+        """
+        if not users:
+            return
+
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(_INSERT, [{"username": user.username,
+                                              "email": user.email,
+                                              "normalized_email": normalize_email(user.email),
+                                              "password": user.password} for user in users])
+        except IntegrityError as e:
+            raise DuplicateEntityError("Some users already exist.") from e
+
+    def save(self, user: User) -> None:
+        """
+        Saves a user to the repository.
+
+        Args:
+            user (User): The user to save.
+
+        Raises:
+            DuplicateEntityError: If the username or the email is already in use.
+        """
+        try:
+            with self.engine.begin() as connection:
+                connection.execute(_INSERT, {"username": user.username,
+                                             "email": user.email,
+                                             "normalized_email": normalize_email(user.email),
+                                             "password": user.password})
+        except IntegrityError as e:
+            raise DuplicateEntityError(f"User {user.username} <{user.email}> already exists.") from e
+
+    def update(self, user: User) -> None:
+        """
+        Replaces the stored user having the same username.
+
+        Args:
+            user (User): The user to update.
+
+        Raises:
+            EntityNotFoundError: If there is no user with that username.
+            DuplicateEntityError: If the new email is used by another user.
+        """
+        try:
+            with self.engine.begin() as connection:
+                result = connection.execute(_UPDATE, {"target_username": user.username,
+                                                      "email": user.email,
+                                                      "normalized_email": normalize_email(user.email),
+                                                      "password": user.password})
+        except IntegrityError as e:
+            raise DuplicateEntityError(f"Email {user.email} already in use.") from e
+
+        if result.rowcount == 0:
+            raise EntityNotFoundError(f"User {user.username} does not exist.")
+
+    def delete(self, user: User) -> None:
+        """
+        Deletes a user from the repository.
+
+        Args:
+            user (User): The user to delete.
+        """
+        with self.engine.begin() as connection:
+            connection.execute(_DELETE, {"username": user.username})
+
+    def find_by_username(self, username: str) -> User | None:
+        """
+        Finds a user by its username.
+
+        Args:
+            username (str): The username of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        with self.engine.connect() as connection:
+            row = connection.execute(_FIND_BY_USERNAME, {"username": username}).first()
+
+        return _to_user(row) if row else None
+
+    def find_by_email(self, email: str) -> User | None:
+        """
+        Finds a user by its email, ignoring case.
+
+        Args:
+            email (str): The email of a user.
+
+        Returns:
+            User : A user if exists, otherwise None.
+
+        """
+        with self.engine.connect() as connection:
+            row = connection.execute(_FIND_BY_EMAIL, {"normalized_email": normalize_email(email)}).first()
+
+        return _to_user(row) if row else None
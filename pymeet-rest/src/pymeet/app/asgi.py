@@ -1,12 +1,14 @@
-"""Application implementation - ASGI."""
+"""Application implementation - ASGI.
+
+Only what building the application needs is imported with this module. The routes, their dependencies and the
+middleware are imported by the factory, and what only runs once the application starts, like the journal, the hashing
+pool and the gauges, by the lifespan.
+"""
 import logging
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 
-from pymeet.app.config.settings import Application
-from pymeet.app.router import base_router, root_api_router_v1
-
 log = logging.getLogger(__name__)
 
 
@@ -30,6 +32,39 @@ async def on_shutdown():
     log.debug("Execute FastAPI shutdown event handler.")
 
 
+def register_gauges(app: FastAPI, users, events) -> None:
+    """
+    Registers the gauges reporting how saturated the pools of the application are and how large its stores are.
+
+    Args:
+        app (FastAPI): Application object instance, its lifespan state already set.
+        users (UserRepository): The user repository, whose size is reported when it is kept in memory.
+        events (MeetingEventRepository): The meeting event repository.
+    """
+    from anyio import to_thread
+
+    from pymeet.adapters.metrics import REGISTRY
+    from pymeet.adapters.repository import InMemoryUserRepository
+
+    threads = REGISTRY.gauge("pymeet_threadpool_threads", "Worker threads by state.", ("state",))
+    threads.set_function(lambda: to_thread.current_default_thread_limiter().borrowed_tokens, "busy")
+    threads.set_function(lambda: to_thread.current_default_thread_limiter().statistics().tasks_waiting, "waiting")
+
+    database = REGISTRY.gauge("pymeet_database_connections", "Database connections by state.", ("state",))
+    database.set_function(lambda: app.state.database_limiter.borrowed_tokens, "busy")
+    database.set_function(lambda: app.state.database_limiter.statistics().tasks_waiting, "waiting")
+
+    encoder = REGISTRY.gauge("pymeet_password_encoder_queue_depth",
+                             "Passwords submitted to the hashing pool and not encoded or verified yet.")
+    encoder.set_function(lambda: app.state.password_encoder.stats.queue_depth)
+
+    stores = REGISTRY.gauge("pymeet_store_size", "Entries kept in memory, by store.", ("store",))
+    stores.set_function(lambda: len(events), "events")
+
+    if isinstance(getattr(users, "target", users), InMemoryUserRepository):
+        stores.set_function(lambda: len(users), "users")
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """
@@ -43,10 +78,76 @@ async def lifespan(app: FastAPI):
     """
     log.debug("Execute FastAPI lifespan event handler.")
 
+    import multiprocessing
+    import os
+    from concurrent.futures import ProcessPoolExecutor
+
+    from anyio import CapacityLimiter, to_thread
+
+    from pymeet.adapters.journal import EventJournal
+    from pymeet.adapters.metrics import PASSWORD_ENCODER_LATENCY
+    from pymeet.services.dependencies import get_event_repository, get_settings, get_user_repository
+    from pymeet.services.locks import StripedLock
+    from pymeet.services.password_encoder import (
+        BcryptPasswordEncoder,
+        PlainPasswordEncoder,
+        PooledPasswordEncoder,
+        calibrate_bcrypt_rounds,
+    )
+
+    settings = get_settings()
+
+    to_thread.current_default_thread_limiter().total_tokens = settings.THREADPOOL_SIZE
+    app.state.database_limiter = CapacityLimiter(settings.DATABASE_POOL_SIZE + settings.DATABASE_MAX_OVERFLOW)
+    app.state.event_locks = StripedLock(settings.EVENT_LOCK_STRIPES)
+    app.state.event_journal = None
+    users = await get_user_repository()
+    events = await get_event_repository()
+
+    if settings.JOURNAL_DIRECTORY:
+        app.state.event_journal = EventJournal(settings.JOURNAL_DIRECTORY,
+                                               commit_window=settings.JOURNAL_COMMIT_WINDOW,
+                                               snapshot_every=settings.JOURNAL_SNAPSHOT_EVERY)
+        app.state.event_journal.open(events, users.find_by_username)
+
+    hashing_pool = None
+
+    if settings.PASSWORD_ENCODER == "plain":
+        log.warning("Passwords are stored as they are, only use the plain password encoder for load tests.")
+        app.state.password_encoder = PooledPasswordEncoder(PlainPasswordEncoder(),
+                                                           max_queue_size=settings.HASHING_QUEUE_SIZE,
+                                                           retry_after=settings.HASHING_RETRY_AFTER,
+                                                           latency=PASSWORD_ENCODER_LATENCY)
+    else:
+        rounds = settings.BCRYPT_ROUNDS or calibrate_bcrypt_rounds(settings.BCRYPT_TARGET_MS / 1000,
+                                                                   min_rounds=settings.BCRYPT_MIN_ROUNDS,
+                                                                   max_rounds=settings.BCRYPT_MAX_ROUNDS)
+
+        # Spawned workers do not inherit the threads of the server process.
+        hashing_workers = settings.HASHING_WORKERS or os.cpu_count() or 1
+        hashing_pool = ProcessPoolExecutor(max_workers=hashing_workers,
+                                           mp_context=multiprocessing.get_context("spawn"))
+        app.state.password_encoder = PooledPasswordEncoder(BcryptPasswordEncoder(rounds),
+                                                           executor=hashing_pool,
+                                                           max_queue_size=settings.HASHING_QUEUE_SIZE,
+                                                           retry_after=settings.HASHING_RETRY_AFTER,
+                                                           parallelism=hashing_workers,
+                                                           latency=PASSWORD_ENCODER_LATENCY)
+
+    register_gauges(app, users, events)
+
     await on_startup()
     yield
     await on_shutdown()
 
+    log.info("Password encoder stats: %s", app.state.password_encoder.stats)
+
+    if hashing_pool is not None:
+        hashing_pool.shutdown(cancel_futures=True)
+
+    if app.state.event_journal is not None:
+        await app.state.event_journal.close()
+
 
 def get_application() -> FastAPI:
     """
@@ -57,7 +158,14 @@ def get_application() -> FastAPI:
     """
     log.debug("Initialize FastAPI application node.")
 
-    settings = Application()
+    from fastapi.responses import ORJSONResponse
+
+    from pymeet.app.middleware import MetricsMiddleware, ProfilingMiddleware
+    from pymeet.app.router import base_router, root_api_router_v1
+    from pymeet.services.dependencies import get_settings
+    from pymeet.services.tokens import TokenService
+
+    settings = get_settings()
 
     app = FastAPI(
         title=settings.PROJECT_NAME,
@@ -65,13 +173,23 @@ def get_application() -> FastAPI:
         debug=settings.DEBUG,
         version=settings.VERSION,
         docs_url=settings.DOCS_URL,
-        on_startup=[on_startup],
-        on_shutdown=[on_shutdown],
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
     log.debug("Add application routes.")
 
     app.include_router(base_router)
     app.include_router(root_api_router_v1)
+    app.add_middleware(MetricsMiddleware)
+
+    if settings.PROFILING_DIRECTORY:
+        log.debug("Add profiling middleware.")
+        app.add_middleware(ProfilingMiddleware,
+                           directory=settings.PROFILING_DIRECTORY,
+                           token_service=TokenService(settings.PROFILING_SECRET) if settings.PROFILING_SECRET else None,
+                           sample_rate=settings.PROFILING_SAMPLE_RATE,
+                           interval=settings.PROFILING_INTERVAL,
+                           max_duration=settings.PROFILING_MAX_DURATION)
 
     return app
@@ -1,4 +1,7 @@
-from pydantic import BaseSettings
+import secrets
+from typing import Literal
+
+from pydantic import BaseSettings, Field
 
 from pymeet.version import __version__
 
@@ -14,6 +17,35 @@ class Application(BaseSettings):
         * FASTAPI_VERSION
         * FASTAPI_DOCS_URL
         * FASTAPI_USE_SQLITE
+        * FASTAPI_DATABASE_URL
+        * FASTAPI_DATABASE_POOL_SIZE
+        * FASTAPI_DATABASE_MAX_OVERFLOW
+        * FASTAPI_DATABASE_POOL_TIMEOUT
+        * FASTAPI_THREADPOOL_SIZE
+        * FASTAPI_PASSWORD_ENCODER
+        * FASTAPI_HASHING_WORKERS
+        * FASTAPI_HASHING_QUEUE_SIZE
+        * FASTAPI_HASHING_RETRY_AFTER
+        * FASTAPI_BCRYPT_ROUNDS
+        * FASTAPI_BCRYPT_TARGET_MS
+        * FASTAPI_BCRYPT_MIN_ROUNDS
+        * FASTAPI_BCRYPT_MAX_ROUNDS
+        * FASTAPI_SECRET_KEY
+        * FASTAPI_SESSION_TTL
+        * FASTAPI_EVENT_UPDATES_WINDOW
+        * FASTAPI_EVENT_UPDATES_KEEPALIVE
+        * FASTAPI_EVENT_LOCK_STRIPES
+        * FASTAPI_JOURNAL_DIRECTORY
+        * FASTAPI_JOURNAL_COMMIT_WINDOW
+        * FASTAPI_JOURNAL_SNAPSHOT_EVERY
+        * FASTAPI_READINESS_HASHING_THRESHOLD
+        * FASTAPI_READINESS_THREADPOOL_THRESHOLD
+        * FASTAPI_READINESS_DATABASE_THRESHOLD
+        * FASTAPI_PROFILING_DIRECTORY
+        * FASTAPI_PROFILING_SECRET
+        * FASTAPI_PROFILING_SAMPLE_RATE
+        * FASTAPI_PROFILING_INTERVAL
+        * FASTAPI_PROFILING_MAX_DURATION
     Attributes:
         DEBUG (bool): FastAPI logging level. You should disable this for
             production.
@@ -21,6 +53,41 @@ class Application(BaseSettings):
         VERSION (str): Application version.
         DOCS_URL (str): Path where swagger ui will be served at.
         USE_SQLITE (bool): Whether to use SQLite DB.
+        DATABASE_URL (str): SQLAlchemy URL of the SQLite database.
+        DATABASE_POOL_SIZE (int): Connections kept open in the pool.
+        DATABASE_MAX_OVERFLOW (int): Connections allowed beyond the pool size.
+        DATABASE_POOL_TIMEOUT (float): Seconds to wait for a pooled connection.
+        THREADPOOL_SIZE (int): Worker threads available to blocking handlers and dependencies.
+        PASSWORD_ENCODER (str): How passwords are encoded, "bcrypt", or "plain" to keep them as they are. Plain is
+            only meant for load tests measuring everything but hashing.
+        HASHING_WORKERS (int): Processes hashing passwords, 0 uses one per CPU core.
+        HASHING_QUEUE_SIZE (int): Hashing calls allowed to wait before answering 503. A batch registration takes one
+            per hashing worker, whatever its size.
+        HASHING_RETRY_AFTER (int): Seconds sent in the Retry-After header when hashing is saturated.
+        BCRYPT_ROUNDS (int): The bcrypt cost factor, 0 calibrates it at startup.
+        BCRYPT_TARGET_MS (float): Milliseconds a single hash should take when calibrating.
+        BCRYPT_MIN_ROUNDS (int): Lowest bcrypt cost accepted by the calibration.
+        BCRYPT_MAX_ROUNDS (int): Highest bcrypt cost accepted by the calibration.
+        SECRET_KEY (str): Key signing session tokens. Defaults to a random key per process, so set it when
+            running several workers.
+        SESSION_TTL (int): Seconds a session token stays valid.
+        EVENT_UPDATES_WINDOW (float): Seconds event updates are coalesced for before they are pushed.
+        EVENT_UPDATES_KEEPALIVE (float): Seconds without updates before an event update stream sends a keepalive.
+        EVENT_LOCK_STRIPES (int): Locks shared by the events, changes to events on different locks run concurrently.
+        JOURNAL_DIRECTORY (str): Where the changes to events are journaled, events are only kept in memory when empty.
+        JOURNAL_COMMIT_WINDOW (float): Seconds journaled changes wait for other changes to share their fsync.
+        JOURNAL_SNAPSHOT_EVERY (int): Journaled changes between snapshots of every event, bounding the replay.
+        READINESS_HASHING_THRESHOLD (float): Share of the hashing queue taken from which the worker is not ready.
+        READINESS_THREADPOOL_THRESHOLD (float): Share of the threadpool taken, waiting tasks included, from which
+            the worker is not ready.
+        READINESS_DATABASE_THRESHOLD (float): Share of the database connections taken, waiting tasks included, from
+            which the worker is not ready.
+        PROFILING_DIRECTORY (str): Where profiled requests write their collapsed stacks, profiling is off when empty.
+        PROFILING_SECRET (str): Key signing the tokens which profile a request when sent in the X-Profile header.
+            Tokens are ignored when empty.
+        PROFILING_SAMPLE_RATE (float): Share of the requests profiled without a token.
+        PROFILING_INTERVAL (float): Seconds between the stack samples of a profiled request.
+        PROFILING_MAX_DURATION (float): Seconds a profiled request is sampled at most, streamed responses included.
     """
 
     DEBUG: bool = True
@@ -29,6 +96,35 @@ class Application(BaseSettings):
     VERSION: str = __version__
     DOCS_URL: str = "/docs"
     USE_SQLITE: bool = True
+    DATABASE_URL: str = "sqlite:///pymeet.db"
+    DATABASE_POOL_SIZE: int = 5
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: float = 30
+    THREADPOOL_SIZE: int = 40
+    PASSWORD_ENCODER: Literal["bcrypt", "plain"] = "bcrypt"
+    HASHING_WORKERS: int = 0
+    HASHING_QUEUE_SIZE: int = 64
+    HASHING_RETRY_AFTER: int = 1
+    BCRYPT_ROUNDS: int = 0
+    BCRYPT_TARGET_MS: float = 100
+    BCRYPT_MIN_ROUNDS: int = 10
+    BCRYPT_MAX_ROUNDS: int = 16
+    SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
+    SESSION_TTL: int = 3600
+    EVENT_UPDATES_WINDOW: float = 0.1
+    EVENT_UPDATES_KEEPALIVE: float = 15
+    EVENT_LOCK_STRIPES: int = 64
+    JOURNAL_DIRECTORY: str = ""
+    JOURNAL_COMMIT_WINDOW: float = 0.002
+    JOURNAL_SNAPSHOT_EVERY: int = 100_000
+    READINESS_HASHING_THRESHOLD: float = 0.9
+    READINESS_THREADPOOL_THRESHOLD: float = 0.9
+    READINESS_DATABASE_THRESHOLD: float = 0.9
+    PROFILING_DIRECTORY: str = ""
+    PROFILING_SECRET: str = ""
+    PROFILING_SAMPLE_RATE: float = 0.0
+    PROFILING_INTERVAL: float = 0.001
+    PROFILING_MAX_DURATION: float = 10.0
 
     # All your additional application configuration should go either here or in
     # separate file in this submodule.
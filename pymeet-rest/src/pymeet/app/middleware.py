@@ -0,0 +1,175 @@
+"""Application configuration - ASGI middleware.
+
+Resources:
+    1. https://www.starlette.io/middleware/#pure-asgi-middleware
+"""
+import asyncio
+import logging
+import os
+import random
+import re
+import time
+from pathlib import Path
+
+from anyio import to_thread
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from pymeet.adapters.metrics import REQUEST_LATENCY, Histogram
+from pymeet.adapters.profiling import StackSampler
+from pymeet.services.tokens import TokenService
+
+log = logging.getLogger(__name__)
+
+OTHER_ROUTE = "other"
+PROFILE_HEADER = b"x-profile"
+
+
+class MetricsMiddleware:
+    """
+    Observes the latency of every HTTP request by route template, method and status.
+
+    Routes are labeled by their template, such as `/api/v1/events/{event_id}`, which FastAPI leaves in the scope once
+    the request is routed, so the labels stay bounded whatever the paths requested. Requests outside the API routes,
+    unknown paths included, share the `other` route. It is a pure ASGI middleware, so streamed responses are not
+    buffered and a request costs two clock reads and an observation.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        histogram (Histogram): Where latencies are observed, labeled by route, method and status.
+    """
+
+    def __init__(self, app: ASGIApp, histogram: Histogram = REQUEST_LATENCY):
+        self.app = app
+        self.histogram = histogram
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        start = time.perf_counter()
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            self.histogram.observe(time.perf_counter() - start,
+                                   getattr(route, "path", OTHER_ROUTE),
+                                   scope["method"],
+                                   str(status))
+
+
+class ProfilingMiddleware:
+    """
+    Profiles the requests carrying a profiling token in the `X-Profile` header, and a random sample of the others.
+
+    A profiled request is sampled by a StackSampler from when it arrives until its response is sent, or for
+    max_duration seconds at most, so a streamed response which never ends, like the event updates, stops being sampled
+    at the deadline. The collapsed stacks are then written to the directory, named after the time, the method, the
+    route and the status. The samples hold everything the worker ran meanwhile, concurrent requests and threadpool
+    workers included, but not the password hashing processes. A single request is profiled at a time, others are served
+    as usual meanwhile.
+
+    It is only installed when profiling is configured. Requests which are not profiled cost a header lookup, and a
+    header which is not a valid token, whatever its bytes, only leaves the request not profiled.
+
+    Attributes:
+        app (ASGIApp): The wrapped application.
+        directory (Path): Where the collapsed stacks are written.
+        token_service (TokenService | None): Validates the profiling tokens, signed with a secret of their own. None
+            ignores the header.
+        sample_rate (float): Share of the requests profiled without a token.
+        interval (float): Seconds between samples.
+        max_duration (float): Seconds a request is sampled at most.
+    """
+
+    def __init__(self,
+                 app: ASGIApp,
+                 directory: str | os.PathLike,
+                 token_service: TokenService | None = None,
+                 sample_rate: float = 0.0,
+                 interval: float = 0.001,
+                 max_duration: float = 10.0):
+        self.app = app
+        self.directory = Path(directory)
+        self.token_service = token_service
+        self.sample_rate = sample_rate
+        self.interval = interval
+        self.max_duration = max_duration
+        self._profiling = False
+        self._writers: set[asyncio.Task] = set()
+
+    def _triggered(self, scope: Scope) -> bool:
+        if self.sample_rate and random.random() < self.sample_rate:
+            return True
+
+        if self.token_service is None:
+            return False
+
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                try:
+                    self.token_service.validate(value.decode("latin-1"))
+                except Exception as e:
+                    log.warning("Request not profiled: %s", e)
+                    return False
+
+                return True
+
+        return False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self._profiling or not self._triggered(scope):
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status
+
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+            await send(message)
+
+        self._profiling = True
+        sampler = StackSampler(self.interval)
+        sampler.start()
+        deadline = asyncio.get_running_loop().call_later(self.max_duration,
+                                                         lambda: self._write_later(sampler, scope, status))
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            deadline.cancel()
+            await self._write(sampler, scope, status)
+
+    def _write_later(self, sampler: StackSampler, scope: Scope, status: int) -> None:
+        writer = asyncio.create_task(self._write(sampler, scope, status))
+        self._writers.add(writer)
+        writer.add_done_callback(self._writers.discard)
+
+    async def _write(self, sampler: StackSampler, scope: Scope, status: int) -> None:
+        # Called when the response ends and when the deadline passes, whichever comes first writes the profile.
+        if sampler.stopped:
+            return
+
+        sampler.stop()
+        self._profiling = False
+
+        template = str(getattr(scope.get("route"), "path", scope["path"]))
+        route = re.sub(r"[^A-Za-z0-9]+", "_", template).strip("_")
+        path = self.directory / f"{time.time_ns()}-{scope['method']}-{route or 'root'}-{status}.collapsed"
+        await to_thread.run_sync(sampler.write, path)
+        log.info("Profiled %s %s in %s.", scope["method"], scope["path"], path)
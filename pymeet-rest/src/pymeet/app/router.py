@@ -8,7 +8,7 @@ Resources:
 from fastapi import APIRouter
 
 from pymeet.entrypoints import base
-from pymeet.entrypoints.v1 import user
+from pymeet.entrypoints.v1 import event, session, user
 
 root_api_router_v1 = APIRouter(prefix="/api/v1", tags=["v1"])
 base_router = APIRouter()
@@ -20,3 +20,5 @@ base_router.include_router(base.router)
 
 # V1
 root_api_router_v1.include_router(user.router)
+root_api_router_v1.include_router(session.router)
+root_api_router_v1.include_router(event.router)
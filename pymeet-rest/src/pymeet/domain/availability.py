@@ -0,0 +1,167 @@
+"""Availability
+    This module suggests the meeting event options most attendees are available for.
+"""
+import datetime
+import heapq
+import math
+from itertools import accumulate
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from pymeet.domain.models import MeetingEventOption
+
+Window = tuple[datetime.datetime, datetime.datetime]
+
+HOUR = datetime.timedelta(hours=1)
+
+
+def merge_windows(windows: Iterable[Window]) -> list[Window]:
+    """
+    Sorts availability windows and merges the ones which overlap or touch.
+
+    Args:
+        windows (Iterable[Window]): The windows of a single attendee, each from its start to its end.
+
+    Returns:
+        list[Window]: Disjoint windows, ordered by start.
+    """
+    merged: list[Window] = []
+
+    for start, end in sorted(windows):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _hour_bounds(windows: Iterable[Window], start: datetime.datetime, hours: int) -> tuple[list[int], list[int]]:
+    """
+    Converts windows into the first and past the last whole hour they cover within the horizon.
+    """
+    firsts, lasts = [], []
+
+    for window_start, window_end in windows:
+        first = max(math.ceil((window_start - start).total_seconds() / 3600), 0)
+        last = min(math.floor((window_end - start).total_seconds() / 3600), hours)
+
+        if first < last:
+            firsts.append(first)
+            lasts.append(last)
+
+    return firsts, lasts
+
+
+def _coverage(availability: Iterable[Iterable[Window]], start: datetime.datetime, hours: int) -> list[int]:
+    """
+    Counts the attendees available at each hour of the horizon, in Python.
+    """
+    difference = [0] * (hours + 1)
+
+    for windows in availability:
+        for first, last in zip(*_hour_bounds(merge_windows(windows), start, hours)):
+            difference[first] += 1
+            difference[last] -= 1
+
+    return list(accumulate(difference[:-1]))
+
+
+def _vectorized_coverage(availability: Iterable[Iterable[Window]], start: datetime.datetime, hours: int):
+    """
+    Counts the attendees available at each hour of the horizon, with NumPy.
+
+    Windows are clipped to the horizon and each attendee is shifted to its own stretch of a single line, so all the
+    windows are merged at once: sorted by start, a window opens a new merged window when it starts after every
+    previous window ended.
+    """
+    attendees, start_seconds, end_seconds = [], [], []
+
+    for attendee, windows in enumerate(availability):
+        for window_start, window_end in windows:
+            attendees.append(attendee)
+            start_seconds.append((window_start - start).total_seconds())
+            end_seconds.append((window_end - start).total_seconds())
+
+    if not attendees:
+        return np.zeros(hours, dtype=np.int64)
+
+    offsets = np.asarray(attendees, dtype=np.float64) * (hours + 1)
+    starts = np.clip(np.asarray(start_seconds) / 3600, 0, hours) + offsets
+    ends = np.clip(np.asarray(end_seconds) / 3600, 0, hours) + offsets
+
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    ended = np.maximum.accumulate(ends)
+    opens = np.flatnonzero(np.concatenate(([True], starts[1:] > ended[:-1])))
+
+    merged_offsets = offsets[order][opens]
+    firsts = np.ceil(starts[opens] - merged_offsets).astype(np.intp)
+    lasts = np.floor(np.maximum.reduceat(ends, opens) - merged_offsets).astype(np.intp)
+    covered = firsts < lasts
+
+    difference = (np.bincount(firsts[covered], minlength=hours + 1)
+                  - np.bincount(lasts[covered], minlength=hours + 1))
+    return np.cumsum(difference[:-1])
+
+
+def _top_hours(coverage, k: int) -> list[int]:
+    """
+    Finds up to k hours with most coverage, earlier hours first on ties, leaving out the hours nobody covers.
+    """
+    if np is None:
+        covered = (hour for hour in range(len(coverage)) if coverage[hour])
+        return heapq.nsmallest(k, covered, key=lambda hour: (-coverage[hour], hour))
+
+    covered = np.flatnonzero(coverage)
+    k = min(k, len(covered))
+
+    if k == 0:
+        return []
+
+    counts = coverage[covered]
+    kth = np.partition(counts, len(counts) - k)[len(counts) - k]
+    candidates = covered[counts >= kth]
+    return candidates[np.lexsort((candidates, -coverage[candidates]))][:k].tolist()
+
+
+def suggest_options(availability: Iterable[Iterable[Window]],
+                    start: datetime.datetime,
+                    hours: int,
+                    k: int) -> list[tuple[MeetingEventOption, int]]:
+    """
+    Suggests the k one-hour options, within a horizon, which most attendees are available for. Hours no attendee is
+    available for are never suggested, so fewer than k options may be returned.
+
+    Each attendee windows are merged, so overlapping windows count once, and added into a single difference array over
+    the hours of the horizon, whose running sum is how many attendees are available at each hour. An attendee is
+    available for an hour when their merged windows cover it whole. With NumPy installed the merge, the coverage and
+    the top k are vectorized, otherwise they are computed in Python.
+
+    Args:
+        availability (Iterable[Iterable[Window]]): The availability windows of each attendee.
+        start (datetime.datetime): The start of the horizon, rounded down to the hour.
+        hours (int): The length of the horizon, in hours.
+        k (int): How many options to suggest.
+
+    Returns:
+        list[tuple[MeetingEventOption, int]]: The suggested options with how many attendees are available for each,
+            most available first and then earliest first.
+    """
+    if hours <= 0 or k <= 0:
+        return []
+
+    start = start.replace(minute=0, second=0, microsecond=0)
+    coverage = _coverage(availability, start, hours) if np is None else _vectorized_coverage(availability, start, hours)
+
+    suggestions = []
+
+    for hour in _top_hours(coverage, k):
+        slot = start + hour * HOUR
+        suggestions.append((MeetingEventOption(date=slot.date(), hour=slot.hour), int(coverage[hour])))
+
+    return suggestions
@@ -9,3 +9,10 @@ class IllegalVoteError(Exception):
     Illegal Meeting Option Vote Error.
     """
     pass
+
+
+class IllegalAvailabilityError(Exception):
+    """
+    Illegal Meeting Availability Error.
+    """
+    pass
@@ -2,8 +2,11 @@
     This module contains the domain objects and errors used by pymeet.
 """
 import datetime
+import uuid
+from typing import Callable, Iterable
 
-from pymeet.domain.errors import IllegalVoteError
+from pymeet.domain.errors import IllegalAvailabilityError, IllegalVoteError
+from pymeet.domain.tallies import BucketVoteTally, VoteTally
 
 
 class User:
@@ -16,6 +19,8 @@ class User:
         password (str): The password of the user.
     """
 
+    __slots__ = ("username", "email", "password")
+
     def __init__(self, username: str, email: str, password: str):
         self.username = username
         self.email = email
@@ -39,19 +44,21 @@ class MeetingEventOption:
     Represents an option for a meeting event.
 
     Attributes:
-        date (datetime.date): A proposal date for the event.
+        date (datetime.date): A proposal date for the event, today by default.
         hour (int): A proposal hour for the event.
-        votes (list[User]): Who votes for this option.
+        votes (set[User]): Who votes for this option.
     """
 
+    __slots__ = ("date", "hour", "votes")
+
     def __init__(self,
-                 date: datetime.date = datetime.date.today(),
+                 date: datetime.date | None = None,
                  hour: int = 0,
-                 votes: list[User] | None = None
+                 votes: Iterable[User] | None = None
                  ):
-        self.date = date
+        self.date = date or datetime.date.today()
         self.hour = hour
-        self.votes = votes or []
+        self.votes: set[User] = set(votes or ())
 
     def vote(self, attendee: User):
         """
@@ -60,7 +67,16 @@ class MeetingEventOption:
         Args:
             attendee (User): The attendee who votes.
         """
-        self.votes.append(attendee)
+        self.votes.add(attendee)
+
+    def unvote(self, attendee: User):
+        """
+        Withdraw a vote for the option.
+
+        Args:
+            attendee (User): The attendee who withdraws the vote.
+        """
+        self.votes.discard(attendee)
 
     def __repr__(self) -> str:
         return f"Option({self.date}, {self.hour}, {self.votes})"
@@ -79,61 +95,209 @@ class MeetingEvent:
     """
     Represents a meeting event.
 
+    Votes are counted by a vote tally, a BucketVoteTally unless another one is given, which keeps the votes of each
+    option in the option itself. Ties are won by the option which reached the count first.
+
     Attributes:
+        id (str): The identifier of the event.
         name (str): The name of the event.
+        organizer (User | None): Who organizes the event.
         attendees (list[str]): The attendees of the event.
-        options (list[Option]): The options for the event.
+        options (dict[MeetingEventOption, MeetingEventOption]): The options for the event, keyed by date and hour.
+        availability (dict[User, list[tuple[datetime.datetime, datetime.datetime]]]): When each attendee is available.
+        duration (datetime.timedelta): How long the event lasts.
+        version (int): How many times the event was stored, to detect concurrent changes.
+
+    Events are identified by their id: equality and hashing only consider it, so they stay stable as events change.
+    Events are ordered by voted date, then by id, with the ones still without a voted date last.
     """
 
+    __slots__ = ("id", "name", "organizer", "options", "attendees", "voted_date", "open_voting", "availability",
+                 "duration", "tally", "version")
+
     def __init__(self,
                  name: str,
                  options: list[MeetingEventOption],
                  attendees: set[User] | None = None,
                  voted_date: datetime.datetime | None = None,
                  open_voting: bool = True,
+                 organizer: User | None = None,
+                 event_id: str | None = None,
+                 tally: Callable[[Iterable[MeetingEventOption]], VoteTally] = BucketVoteTally,
+                 duration: datetime.timedelta = datetime.timedelta(hours=1),
+                 version: int = 0,
                  ):
+        self.id = event_id or uuid.uuid4().hex
         self.name = name
-        self.options: set = set(options)
+        self.organizer = organizer
+        self.options: dict[MeetingEventOption, MeetingEventOption] = {}
         self.attendees: set = attendees or set()
         self.voted_date = voted_date
         self.open_voting = open_voting
+        self.availability: dict[User, list[tuple[datetime.datetime, datetime.datetime]]] = {}
+        self.duration = duration
+        self.version = version
+
+        for option in options:
+            self.options.setdefault(option, option)
 
-    def close_voting(self) -> datetime.datetime:
+        self.tally = tally(self.options)
+
+    @property
+    def end_date(self) -> datetime.datetime | None:
+        """
+        When the event ends, once the voting fixed when it starts.
+        """
+        return self.voted_date + self.duration if self.voted_date is not None else None
+
+    def current_leader(self) -> MeetingEventOption | None:
+        """
+        Gets the most voted option so far.
+
+        Returns:
+            MeetingEventOption | None: The most voted option, or None if the event has no options.
+        """
+        return self.tally.leader()
+
+    def votes_for(self, option: MeetingEventOption) -> int:
+        """
+        Gets the votes of an option.
+
+        Args:
+            option (MeetingEventOption): The option.
+
+        Returns:
+            int: How many attendees voted for the option.
+        """
+        return self.tally.count(option)
+
+    def tallies(self) -> dict[MeetingEventOption, int]:
+        """
+        Gets the votes of every option.
+
+        Returns:
+            dict[MeetingEventOption, int]: How many attendees voted for each option.
+        """
+        return self.tally.counts()
+
+    def close_voting(self) -> datetime.datetime | None:
         """
         Sets the most voted option as the final date for the event.
 
         Returns:
-            datetime.datetime: The date and time which had most votes.
+            datetime.datetime | None: The date and time which had most votes, or None if the event has no options.
         """
         self.open_voting = False
 
-        most_voted_option: MeetingEventOption = max(self.options, key=lambda option: len(option.votes))
+        most_voted_option = self.current_leader()
 
-        self.voted_date = datetime.datetime.combine(most_voted_option.date, datetime.time(hour=most_voted_option.hour))
+        if most_voted_option is not None:
+            self.voted_date = datetime.datetime.combine(most_voted_option.date,
+                                                        datetime.time(hour=most_voted_option.hour))
 
         return self.voted_date
 
-    def vote(self, voter: User, option: MeetingEventOption):
+    def check_open(self):
         """
-        Vote for an option.
+        Checks the voting is open, so options can be voted and added.
+
+        Raises:
+            IllegalVoteError: If the voting is closed.
+        """
+        if not self.open_voting:
+            raise IllegalVoteError("Voting is closed.")
+
+    def check_vote(self, voter: User, option: MeetingEventOption) -> MeetingEventOption:
+        """
+        Checks a voter can vote for an option, without voting.
 
         Args:
             voter (User): The attendee who votes.
             option (MeetingEventOption): The option to vote.
 
+        Returns:
+            MeetingEventOption: The option of the event.
+
         Raises:
-            IllegalVoteError: If the voter is not an attendee of the event or if the voting is closed.
+            IllegalVoteError: If the voter is not an attendee of the event, if the voting is closed or if the voter
+                already voted for that option.
         """
         if voter not in self.attendees:
             raise IllegalVoteError(f"{voter.username} is not an attendee of this event.")
 
-        if not self.open_voting:
-            raise IllegalVoteError("Voting is closed.")
+        self.check_open()
+        stored_option = self.options.get(option)
 
-        if option not in self.options:
+        if stored_option is None:
             raise IllegalVoteError(f"{option} is not an option for this event.")
 
-        option.vote(voter)
+        if self.tally.choice(voter) is stored_option:
+            raise IllegalVoteError(f"{voter.username} already voted for {stored_option}.")
+
+        return stored_option
+
+    def vote(self, voter: User, option: MeetingEventOption):
+        """
+        Vote for an option, replacing the previous vote of the voter, if any.
+
+        Args:
+            voter (User): The attendee who votes.
+            option (MeetingEventOption): The option to vote.
+
+        Raises:
+            IllegalVoteError: If the voter is not an attendee of the event, if the voting is closed or if the voter
+                already voted for that option.
+        """
+        self.tally.vote(voter, self.check_vote(voter, option))
+
+    def add_option(self, option: MeetingEventOption):
+        """
+        Adds an option to the event, unless it already has it.
+
+        Args:
+            option (MeetingEventOption): The option to add.
+
+        Raises:
+            IllegalVoteError: If the voting is closed.
+        """
+        self.check_open()
+
+        if option not in self.options:
+            self.options[option] = option
+            self.tally.add(option)
+
+    def set_availability(self, attendee: User, windows: list[tuple[datetime.datetime, datetime.datetime]]):
+        """
+        Replaces when an attendee is available.
+
+        Args:
+            attendee (User): The attendee.
+            windows (list[tuple[datetime.datetime, datetime.datetime]]): When the attendee is available, each window
+                from its start to its end.
+
+        Raises:
+            IllegalAvailabilityError: If the user is not an attendee of the event or if a window ends before it starts.
+        """
+        self.check_availability(attendee, windows)
+        self.availability[attendee] = list(windows)
+
+    def check_availability(self, attendee: User, windows: list[tuple[datetime.datetime, datetime.datetime]]):
+        """
+        Checks when an attendee is available can be replaced, without replacing it.
+
+        Args:
+            attendee (User): The attendee.
+            windows (list[tuple[datetime.datetime, datetime.datetime]]): When the attendee is available, each window
+                from its start to its end.
+
+        Raises:
+            IllegalAvailabilityError: If the user is not an attendee of the event or if a window ends before it starts.
+        """
+        if attendee not in self.attendees:
+            raise IllegalAvailabilityError(f"{attendee.username} is not an attendee of this event.")
+
+        if any(end <= start for start, end in windows):
+            raise IllegalAvailabilityError("Availability windows must end after they start.")
 
     def add_attendee(self, attendee: User):
         """
@@ -147,20 +311,26 @@ class MeetingEvent:
     def __repr__(self):
         return f"Event({self.name}, {self.voted_date or 'TBD'}, {self.attendees})"
 
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, MeetingEvent):
+            return False
+
+        return self.id == other.id
+
     def __hash__(self):
-        return hash(self.__repr__())
+        return hash(self.id)
+
+    def _order_key(self) -> tuple[bool, datetime.datetime, str]:
+        return self.voted_date is None, self.voted_date or datetime.datetime.min, self.id
 
     def __lt__(self, other):
-        return self.voted_date < other.voted_date
+        return self._order_key() < other._order_key()
 
     def __gt__(self, other):
-        return self.voted_date > other.voted_date
+        return self._order_key() > other._order_key()
 
     def __le__(self, other):
-        return self.voted_date <= other.start
+        return self._order_key() <= other._order_key()
 
     def __ge__(self, other):
-        return self.voted_date >= other.start
-
-    def __ne__(self, other):
-        return not self.__eq__(other)
+        return self._order_key() >= other._order_key()
@@ -2,11 +2,34 @@
 
 Represents the schemas for transferring data in or out pymeet application.
 """
+import datetime as dt
+from datetime import datetime
+
 from pydantic import BaseModel, BaseConfig, Field, validator, EmailStr
 
 from pymeet.app import formatters
+from pymeet.domain.models import MeetingEvent, User
 
 PASSWORD_MIN_LENGTH = 8
+USER_BATCH_MAX_SIZE = 5000
+AVAILABILITY_MAX_WINDOWS = 200
+EVENT_MIN_DURATION = 5
+EVENT_MAX_DURATION = 24 * 60
+
+
+def naive_utc(value: datetime) -> datetime:
+    """
+    Converts a moment to a naive datetime in UTC, the way moments are kept. Naive moments are already taken as UTC.
+
+    Args:
+        value (datetime): The moment.
+
+    Returns:
+        datetime: The same moment, naive in UTC.
+    """
+    if value.tzinfo is not None:
+        return value.astimezone(dt.timezone.utc).replace(tzinfo=None)
+    return value
 
 
 class CamelCaseModel(BaseModel):
@@ -15,7 +38,7 @@ class CamelCaseModel(BaseModel):
     """
 
     class Config(BaseConfig):
-        alias_generator = formatters.to_camel
+        alias_generator = staticmethod(formatters.to_camel)
         allow_population_by_field_name = True
 
 
@@ -33,6 +56,21 @@ class BaseUser(CamelCaseModel):
         return v
 
 
+def project_user(user: User) -> dict:
+    """
+    Projects a domain user into the BaseUser output shape.
+
+    Domain users were validated when registered, so the projection skips validating them again.
+
+    Args:
+        user (User): The user to project.
+
+    Returns:
+        dict: The public attributes of the user, keyed by their aliases.
+    """
+    return {"username": user.username, "email": user.email}
+
+
 class UserIn(BaseUser):
     """
     Represents a user.
@@ -52,8 +90,256 @@ class UserIn(BaseUser):
         return v
 
 
+class UserBatchIn(CamelCaseModel):
+    """
+    Represents several users to register at once.
+    """
+
+    users: list[UserIn] = Field(title="Users",
+                                description="The users to register.",
+                                min_items=1,
+                                max_items=USER_BATCH_MAX_SIZE)
+
+
 class UserResponse(CamelCaseModel):
     """
     Represents a user.
     """
     data: BaseUser | list[BaseUser] = Field(title="User", description="User data output without sensible information")
+
+
+class UserBatchResult(BaseUser):
+    """
+    Represents the outcome of registering one user of a batch.
+    """
+
+    status: int = Field(title="Status", description="201 if the user was registered, 409 on a conflict.")
+    detail: str | None = Field(default=None, title="Detail", description="Why the user was not registered.")
+
+
+class UserBatchResponse(CamelCaseModel):
+    """
+    Represents the outcome of registering several users.
+    """
+    data: list[UserBatchResult] = Field(title="Results", description="One result per requested user, in order.")
+
+
+class UserPageResponse(UserResponse):
+    """
+    Represents a page of users.
+    """
+    next: str | None = Field(default=None,
+                             title="Next",
+                             description="Cursor to send as `after` for the next page, absent on the last page.")
+
+
+class Credentials(CamelCaseModel):
+    """
+    Represents a login attempt.
+    """
+
+    username: str = Field(title="Username", description="The username of the user.")
+    password: str = Field(title="Password", description="The password of the user.")
+
+
+class Session(CamelCaseModel):
+    """
+    Represents an authenticated session.
+    """
+
+    username: str = Field(title="Username", description="The user the session belongs to.")
+    expires_at: datetime = Field(title="Expires At", description="When the session stops being valid.")
+
+
+class SessionToken(Session):
+    """
+    Represents a newly issued session.
+    """
+
+    access_token: str = Field(title="Access Token", description="Signed token to send as a Bearer credential.")
+    token_type: str = Field(default="bearer", title="Token Type", description="How the token must be sent.")
+
+
+class SessionResponse(CamelCaseModel):
+    """
+    Represents a session.
+    """
+    data: SessionToken | Session = Field(title="Session", description="Session data output")
+
+
+class MeetingEventOptionIn(CamelCaseModel):
+    """
+    Represents a proposed date and hour for an event.
+    """
+
+    date: dt.date = Field(title="Date", description="The proposed date.")
+    hour: int = Field(title="Hour", description="The proposed hour of the day.", ge=0, le=23)
+
+
+class MeetingEventOptionOut(MeetingEventOptionIn):
+    """
+    Represents a proposed date and hour for an event, with its votes.
+    """
+
+    votes: int = Field(title="Votes", description="How many attendees voted for this option.")
+
+
+class MeetingEventIn(CamelCaseModel):
+    """
+    Represents a new event.
+    """
+
+    name: str = Field(title="Name", description="The name of the event.", min_length=1)
+    options: list[MeetingEventOptionIn] = Field(title="Options", description="The proposed dates.", min_items=1)
+    attendees: list[str] = Field(default_factory=list,
+                                 title="Attendees",
+                                 description="Usernames of the attendees, the organizer always attends.")
+    duration: int = Field(default=60, title="Duration", description="How long the event lasts, in minutes.",
+                          ge=EVENT_MIN_DURATION, le=EVENT_MAX_DURATION)
+
+
+class MeetingEventOut(CamelCaseModel):
+    """
+    Represents an event.
+    """
+
+    id: str = Field(title="ID", description="The identifier of the event.")
+    name: str = Field(title="Name", description="The name of the event.")
+    organizer: str | None = Field(title="Organizer", description="Username of the organizer.")
+    attendees: list[str] = Field(title="Attendees", description="Usernames of the attendees.")
+    options: list[MeetingEventOptionOut] = Field(title="Options", description="The proposed dates.")
+    participation: int = Field(title="Participation", description="How many attendees voted.")
+    leader: MeetingEventOptionIn | None = Field(title="Leader", description="The most voted option so far.")
+    duration: int = Field(title="Duration", description="How long the event lasts, in minutes.")
+    voted_date: datetime | None = Field(title="Voted Date", description="The most voted date, once voting closed.")
+    open_voting: bool = Field(title="Open Voting", description="Whether attendees can still vote.")
+
+
+class MeetingEventResponse(CamelCaseModel):
+    """
+    Represents an event or several.
+    """
+    data: MeetingEventOut | list[MeetingEventOut] = Field(title="Event", description="Event data output")
+
+
+class AttendeeConflictOut(CamelCaseModel):
+    """
+    Represents an attendee of an event who attends other events at the same time.
+    """
+
+    username: str = Field(title="Username", description="The username of the attendee.")
+    events: list[str] = Field(title="Events", description="Identifiers of the other events overlapping the event.")
+
+
+class MeetingEventCloseResponse(MeetingEventResponse):
+    """
+    Represents a closed event and the attendees it conflicts for.
+    """
+    conflicts: list[AttendeeConflictOut] = Field(title="Conflicts",
+                                                 description="Attendees who attend other events at the same time.")
+
+
+class ConflictOut(CamelCaseModel):
+    """
+    Represents an event overlapping other events of the same attendee.
+    """
+
+    id: str = Field(title="ID", description="The identifier of the event.")
+    name: str = Field(title="Name", description="The name of the event.")
+    start: datetime = Field(title="Start", description="When the event starts.")
+    end: datetime = Field(title="End", description="When the event ends.")
+    conflicts_with: list[str] = Field(title="Conflicts With", description="Identifiers of the overlapping events.")
+
+
+class ConflictResponse(CamelCaseModel):
+    """
+    Represents the conflicting events of a user.
+    """
+    data: list[ConflictOut] = Field(title="Conflicts", description="Conflicting events, ordered by start.")
+
+
+class AvailabilityWindowIn(CamelCaseModel):
+    """
+    Represents a window of time when an attendee is available.
+    """
+
+    start: datetime = Field(title="Start", description="When the attendee becomes available.")
+    end: datetime = Field(title="End", description="When the attendee stops being available.")
+
+    @validator('start', 'end')
+    def as_naive_utc(cls, v):
+        return naive_utc(v)
+
+    @validator('end')
+    def ends_after_start(cls, v, values, **kwargs):
+        if 'start' in values and v <= values['start']:
+            raise ValueError('must end after it starts')
+        return v
+
+
+class AvailabilityIn(CamelCaseModel):
+    """
+    Represents when an attendee is available.
+    """
+
+    windows: list[AvailabilityWindowIn] = Field(title="Windows",
+                                                description="When the attendee is available.",
+                                                max_items=AVAILABILITY_MAX_WINDOWS)
+
+
+class AvailabilityResponse(CamelCaseModel):
+    """
+    Represents when an attendee is available.
+    """
+    data: AvailabilityIn = Field(title="Availability", description="Availability data output")
+
+
+class MeetingEventOptionsIn(CamelCaseModel):
+    """
+    Represents options to add to an event, suggested ones included.
+    """
+
+    options: list[MeetingEventOptionIn] = Field(title="Options", description="The proposed dates.", min_items=1)
+
+
+class SuggestionOut(MeetingEventOptionIn):
+    """
+    Represents a suggested option.
+    """
+
+    attendees: int = Field(title="Attendees", description="How many attendees are available for the option.")
+
+
+class SuggestionResponse(CamelCaseModel):
+    """
+    Represents the suggested options of an event.
+    """
+    data: list[SuggestionOut] = Field(title="Suggestions", description="Suggested options, most available first.")
+
+
+def project_event(event: MeetingEvent) -> dict:
+    """
+    Projects a domain event into the MeetingEventOut output shape, without validation.
+
+    Args:
+        event (MeetingEvent): The event to project.
+
+    Returns:
+        dict: The event, keyed by the output aliases.
+    """
+    leader = event.current_leader()
+    tallies = event.tallies()
+
+    return {
+        "id": event.id,
+        "name": event.name,
+        "organizer": event.organizer.username if event.organizer else None,
+        "attendees": sorted(attendee.username for attendee in event.attendees),
+        "options": [{"date": option.date, "hour": option.hour, "votes": tallies[option]}
+                    for option in sorted(event.options, key=lambda option: (option.date, option.hour))],
+        "participation": event.tally.participation(),
+        "leader": {"date": leader.date, "hour": leader.hour} if leader else None,
+        "duration": event.duration // dt.timedelta(minutes=1),
+        "votedDate": event.voted_date,
+        "openVoting": event.open_voting,
+    }
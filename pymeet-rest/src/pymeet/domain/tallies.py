@@ -0,0 +1,300 @@
+"""Tallies
+    This module contains the vote tallies a meeting event keeps, one per voting backend.
+"""
+import abc
+from abc import ABC
+from typing import Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore[assignment]
+
+from pymeet.domain.errors import IllegalVoteError
+
+PACKED_VOTES_AVAILABLE = np is not None
+
+
+class VoteTally(ABC):
+    """
+    Counts the votes of an event, where each voter picks at most one option.
+
+    Ties are won by the option which reached the count first.
+    """
+
+    __slots__ = ()
+
+    @abc.abstractmethod
+    def vote(self, voter, option):
+        """
+        Records a vote, replacing the previous vote of the voter, if any.
+
+        Args:
+            voter (User): The voter.
+            option (MeetingEventOption): The option, which must be one of the event options.
+
+        Raises:
+            IllegalVoteError: If the voter already voted for that option.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def add(self, option):
+        """
+        Adds an option without votes, which reaches its count after every other option.
+
+        Args:
+            option (MeetingEventOption): The new option.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def count(self, option) -> int:
+        """
+        Gets the votes of an option.
+
+        Args:
+            option (MeetingEventOption): The option.
+
+        Returns:
+            int: How many voters picked the option.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def counts(self) -> dict:
+        """
+        Gets the votes of every option.
+
+        Returns:
+            dict[MeetingEventOption, int]: How many voters picked each option.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def participation(self) -> int:
+        """
+        Gets how many voters voted.
+
+        Returns:
+            int: The number of voters.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def leader(self):
+        """
+        Gets the most voted option.
+
+        Returns:
+            MeetingEventOption | None: The most voted option, or None if there are no options.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def ballots(self) -> list:
+        """
+        Gets the option each voter picked, ordered so voting them again into an empty tally ranks the options the same.
+
+        Returns:
+            list[tuple[User, MeetingEventOption]]: Each voter with the option they picked, the options with most votes
+                first and tied options in the order they reached their count.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def choice(self, voter):
+        """
+        Gets the option a voter picked.
+
+        Args:
+            voter (User): The voter.
+
+        Returns:
+            MeetingEventOption | None: The option, or None if the voter has not voted.
+        """
+        raise NotImplementedError
+
+
+class BucketVoteTally(VoteTally):
+    """
+    Keeps the voters of each option in the option itself, maps voters to the option they picked and ranks the options
+    in buckets by vote count, so voting, changing a vote and finding the leader never scan the options or their votes.
+    """
+
+    __slots__ = ("_ballots", "_ranking", "_top_count")
+
+    def __init__(self, options: Iterable):
+        self._ballots: dict = {}
+        self._ranking: dict[int, dict] = {}
+        self._top_count = 0
+
+        for option in options:
+            self._rank(option, len(option.votes))
+
+            for voter in option.votes:
+                self._ballots.setdefault(voter, option)
+
+    def _rank(self, option, count: int):
+        self._ranking.setdefault(count, {})[option] = None
+        self._top_count = max(self._top_count, count)
+
+    def _unrank(self, option, count: int):
+        bucket = self._ranking[count]
+        del bucket[option]
+
+        if not bucket:
+            del self._ranking[count]
+
+    def vote(self, voter, option):
+        previous_option = self._ballots.get(voter)
+
+        if previous_option is option:
+            raise IllegalVoteError(f"{voter.username} already voted for {option}.")
+
+        if previous_option is not None:
+            count = len(previous_option.votes)
+            self._unrank(previous_option, count)
+            previous_option.unvote(voter)
+            self._rank(previous_option, count - 1)
+
+            if count == self._top_count and count not in self._ranking:
+                self._top_count = count - 1
+
+        count = len(option.votes)
+        self._unrank(option, count)
+        option.vote(voter)
+        self._rank(option, count + 1)
+        self._ballots[voter] = option
+
+    def add(self, option):
+        self._rank(option, len(option.votes))
+
+    def count(self, option) -> int:
+        return len(option.votes)
+
+    def counts(self) -> dict:
+        return {option: count for count, bucket in self._ranking.items() for option in bucket}
+
+    def participation(self) -> int:
+        return len(self._ballots)
+
+    def leader(self):
+        bucket = self._ranking.get(self._top_count)
+        return next(iter(bucket)) if bucket else None
+
+    def ballots(self) -> list:
+        return [(voter, option) for count in sorted(self._ranking, reverse=True)
+                for option in self._ranking[count] for voter in option.votes]
+
+    def choice(self, voter):
+        return self._ballots.get(voter)
+
+
+class PackedVoteTally(VoteTally):
+    """
+    Maps voters and options to dense integer ids and keeps a single NumPy vector with the option id each voter picked,
+    -1 when they have not voted, instead of the voters of each option.
+
+    Voting is single choice, so this vector holds the same information as a voter by option boolean matrix in 4 bytes
+    per voter, whatever the number of options. Tallies are a single bincount over it. Every option also keeps the
+    sequence number of its last change, which is when it reached its current count, to break ties the way
+    BucketVoteTally does. Options keep no voters, so their votes stay empty.
+
+    Requires NumPy.
+    """
+
+    __slots__ = ("_options", "_option_ids", "_voter_ids", "_choices", "_changed_at", "_sequence")
+
+    def __init__(self, options: Iterable, initial_capacity: int = 64):
+        if not PACKED_VOTES_AVAILABLE:
+            raise ImportError("PackedVoteTally requires numpy, install pymeet with the 'packed-votes' extra.")
+
+        self._options = list(options)
+        self._option_ids = {option: option_id for option_id, option in enumerate(self._options)}
+        self._voter_ids: dict = {}
+        self._choices: np.ndarray = np.full(initial_capacity, -1, dtype=np.int32)
+        self._changed_at = np.arange(-len(self._options), 0, dtype=np.int64)
+        self._sequence = 0
+
+        for option in self._options:
+            for voter in option.votes:
+                self._choices[self._voter_id(voter)] = self._option_ids[option]
+
+            option.votes.clear()
+
+    def _voter_id(self, voter) -> int:
+        voter_id = self._voter_ids.setdefault(voter, len(self._voter_ids))
+
+        if voter_id == len(self._choices):
+            self._choices = np.concatenate([self._choices, np.full(max(1, len(self._choices)), -1, dtype=np.int32)])
+
+        return voter_id
+
+    def _cast(self) -> "np.ndarray":
+        return self._choices[:len(self._voter_ids)]
+
+    def vote(self, voter, option):
+        voter_id = self._voter_id(voter)
+        option_id = self._option_ids[option]
+        previous_option_id = self._choices[voter_id]
+
+        if previous_option_id == option_id:
+            raise IllegalVoteError(f"{voter.username} already voted for {option}.")
+
+        if previous_option_id >= 0:
+            self._changed_at[previous_option_id] = self._sequence
+
+        self._changed_at[option_id] = self._sequence + 1
+        self._sequence += 2
+        self._choices[voter_id] = option_id
+
+    def add(self, option):
+        self._option_ids[option] = len(self._options)
+        self._options.append(option)
+        self._changed_at = np.append(self._changed_at, self._sequence)
+        self._sequence += 1
+
+    def tallies(self) -> "np.ndarray":
+        """
+        Counts the votes of every option at once.
+
+        Returns:
+            np.ndarray: The votes of each option, in the order the options were given.
+        """
+        cast = self._cast()
+        return np.bincount(cast[cast >= 0], minlength=len(self._options))
+
+    def count(self, option) -> int:
+        return int(np.count_nonzero(self._cast() == self._option_ids[option]))
+
+    def counts(self) -> dict:
+        return dict(zip(self._options, self.tallies().tolist()))
+
+    def participation(self) -> int:
+        return int(np.count_nonzero(self._cast() >= 0))
+
+    def leader(self):
+        if not self._options:
+            return None
+
+        tallies = self.tallies()
+        leaders = np.flatnonzero(tallies == tallies.max())
+        return self._options[leaders[np.argmin(self._changed_at[leaders])]]
+
+    def ballots(self) -> list:
+        cast = self._cast()
+        voted = np.flatnonzero(cast >= 0)
+        choices = cast[voted]
+        order = voted[np.lexsort((voted, self._changed_at[choices], -self.tallies()[choices]))]
+        voters = list(self._voter_ids)
+        return [(voters[voter_id], self._options[option_id])
+                for voter_id, option_id in zip(order.tolist(), cast[order].tolist())]
+
+    def choice(self, voter):
+        voter_id = self._voter_ids.get(voter)
+
+        if voter_id is None or self._choices[voter_id] < 0:
+            return None
+
+        return self._options[self._choices[voter_id]]
@@ -2,8 +2,15 @@
 Base endpoints. Including health check and readiness.
 """
 
-from fastapi import APIRouter
-from starlette.responses import RedirectResponse
+from anyio import to_thread
+from fastapi import APIRouter, Request
+from fastapi.responses import ORJSONResponse
+from starlette.responses import RedirectResponse, Response
+from starlette.status import HTTP_200_OK, HTTP_503_SERVICE_UNAVAILABLE
+
+from pymeet.adapters.metrics import CONTENT_TYPE, REGISTRY
+from pymeet.services.dependencies import get_settings
+from pymeet.services.health import encoder_saturation, limiter_saturation
 
 router = APIRouter()
 
@@ -18,3 +25,57 @@ def root_redirect():
     Redirects the root path to the docs.
     """
     return RedirectResponse(url="/docs", status_code=301)
+
+
+@router.get(
+    "/metrics",
+    include_in_schema=False,
+    status_code=200,
+)
+async def metrics():
+    """
+    Exposes the metrics of this process in the Prometheus text format.
+    """
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
+@router.get(
+    "/healthz",
+    include_in_schema=False,
+    status_code=HTTP_200_OK,
+)
+async def healthz():
+    """
+    Answers as long as the event loop of this worker is running, for liveness probes.
+    """
+    return ORJSONResponse({"status": "ok"})
+
+
+@router.get(
+    "/readyz",
+    include_in_schema=False,
+    status_code=HTTP_200_OK,
+)
+async def readyz(request: Request):
+    """
+    Answers 503 once the hashing queue, the threadpool or the database connections reach their saturation threshold,
+    so load balancers send work to other workers before the latency of this one collapses.
+
+    It only reads counters kept in memory, never the repositories.
+    """
+    settings = get_settings()
+    pools = {
+        "hashing": encoder_saturation(request.app.state.password_encoder.stats,
+                                      settings.READINESS_HASHING_THRESHOLD),
+        "threadpool": limiter_saturation(to_thread.current_default_thread_limiter(),
+                                         settings.READINESS_THREADPOOL_THRESHOLD),
+        "database": limiter_saturation(request.app.state.database_limiter, settings.READINESS_DATABASE_THRESHOLD),
+    }
+    ready = not any(saturation.saturated for saturation in pools.values())
+
+    return ORJSONResponse({"status": "ready" if ready else "saturated",
+                           "pools": {name: {"used": saturation.used,
+                                            "capacity": saturation.capacity,
+                                            "saturated": saturation.saturated}
+                                     for name, saturation in pools.items()}},
+                          status_code=HTTP_200_OK if ready else HTTP_503_SERVICE_UNAVAILABLE)
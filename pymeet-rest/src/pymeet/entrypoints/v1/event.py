@@ -0,0 +1,286 @@
+"""Meeting Event Entry Point
+
+This module contains the entry point for the meeting event domain object.
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import Annotated, AsyncIterator
+
+import orjson
+
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from starlette.responses import StreamingResponse
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+
+from pymeet.domain.errors import IllegalAvailabilityError, IllegalVoteError
+from pymeet.domain.schemas import (
+    AvailabilityIn,
+    AvailabilityResponse,
+    MeetingEventCloseResponse,
+    MeetingEventIn,
+    MeetingEventOptionIn,
+    MeetingEventOptionsIn,
+    MeetingEventResponse,
+    SuggestionResponse,
+    naive_utc,
+    project_event,
+)
+from pymeet.adapters.broker import EventBroker, Subscription
+from pymeet.domain.models import MeetingEvent
+from pymeet.services.dependencies import (
+    CurrentSessionDependency,
+    EventBrokerDependency,
+    get_event_service,
+    get_settings,
+)
+from pymeet.services.events import (
+    SUGGESTION_MAX_DAYS,
+    EventNotFoundException,
+    IllegalEventException,
+    MeetingEventService,
+)
+
+router: APIRouter = APIRouter(prefix="/events", tags=["events"])
+
+MeetingEventServiceDependency = Annotated[MeetingEventService, Depends(get_event_service)]
+
+
+def _get_event(service: MeetingEventService, event_id: str):
+    try:
+        return service.get(event_id)
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+
+@router.post("/", status_code=HTTP_201_CREATED, response_model=MeetingEventResponse)
+async def create_event(event_form: MeetingEventIn,
+                       session: CurrentSessionDependency,
+                       service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Create an event organized by the caller.
+    """
+
+    try:
+        event = await service.create(name=event_form.name,
+                                     organizer=session.subject,
+                                     options=[(option.date, option.hour) for option in event_form.options],
+                                     attendees=event_form.attendees,
+                                     duration=timedelta(minutes=event_form.duration))
+    except IllegalEventException as e:
+        raise HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail=str(e)) from e
+
+    return ORJSONResponse({"data": project_event(event)}, status_code=HTTP_201_CREATED)
+
+
+@router.get("/", status_code=HTTP_200_OK, response_model=MeetingEventResponse)
+async def get_events(service: MeetingEventServiceDependency,
+                     attendee: Annotated[str | None, Query(description="Only events attended by this user.")] = None,
+                     start: Annotated[datetime | None, Query(description="Only events voted from this moment.")] = None,
+                     end: Annotated[datetime | None, Query(description="Only events voted before this moment.")] = None,
+                     after: Annotated[str | None, Query(description="Identifier of the last event seen.")] = None,
+                     limit: Annotated[int, Query(ge=1, le=1000)] = 100,
+                     ) -> ORJSONResponse:
+    """
+    Get a page of the events attended by a user, voted within a date range, both, or else of every event.
+    """
+
+    events = service.find(attendee=attendee,
+                          start=naive_utc(start) if start is not None else None,
+                          end=naive_utc(end) if end is not None else None,
+                          after=after,
+                          limit=limit)
+
+    return ORJSONResponse({"data": [project_event(event) for event in events]})
+
+
+@router.get("/{event_id}", status_code=HTTP_200_OK, response_model=MeetingEventResponse)
+async def get_event(event_id: str, service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Get an event.
+    """
+
+    return ORJSONResponse({"data": project_event(_get_event(service, event_id))})
+
+
+def _subscribe(broker: EventBroker,
+               service: MeetingEventService,
+               event_id: str) -> tuple[MeetingEvent, Subscription | None]:
+    """
+    Subscribes to the updates of an event and then reads it, so no change made in between is missed, and unsubscribes
+    at once if its voting is already closed.
+    """
+    subscription = broker.subscribe(event_id)
+
+    try:
+        event = _get_event(service, event_id)
+    except HTTPException:
+        broker.unsubscribe(subscription)
+        raise
+
+    if not event.open_voting:
+        broker.unsubscribe(subscription)
+        return event, None
+
+    return event, subscription
+
+
+async def _stream_updates(broker: EventBroker,
+                          event: MeetingEvent,
+                          subscription: Subscription | None,
+                          keepalive: float) -> AsyncIterator[bytes]:
+    """
+    Yields the event and then every update as server-sent events, with a comment as keepalive, until the voting closes.
+    """
+    try:
+        yield b"data: " + orjson.dumps(project_event(event)) + b"\n\n"
+
+        while subscription is not None:
+            try:
+                message = await asyncio.wait_for(subscription.get(), keepalive)
+            except asyncio.TimeoutError:
+                yield b": keepalive\n\n"
+                continue
+
+            if message is None:
+                return
+
+            yield b"data: " + message + b"\n\n"
+    finally:
+        if subscription is not None:
+            broker.unsubscribe(subscription)
+
+
+@router.get("/{event_id}/updates",
+            status_code=HTTP_200_OK,
+            response_class=StreamingResponse,
+            responses={HTTP_200_OK: {"content": {"text/event-stream": {}}}})
+async def stream_event_updates(event_id: str,
+                               service: MeetingEventServiceDependency,
+                               broker: EventBrokerDependency) -> StreamingResponse:
+    """
+    Stream an event as server-sent events, pushing its tallies as it is voted until the voting closes.
+
+    Votes are coalesced, so a busy event pushes a few updates per second whatever the number of votes.
+    """
+
+    event, subscription = _subscribe(broker, service, event_id)
+
+    return StreamingResponse(_stream_updates(broker, event, subscription, get_settings().EVENT_UPDATES_KEEPALIVE),
+                             media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache"})
+
+
+@router.post("/{event_id}/votes", status_code=HTTP_200_OK, response_model=MeetingEventResponse)
+async def vote_event(event_id: str,
+                     option: MeetingEventOptionIn,
+                     session: CurrentSessionDependency,
+                     service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Vote, as the caller, for an option of an event.
+    """
+
+    try:
+        event = await service.vote(event_id=event_id, voter=session.subject, date=option.date, hour=option.hour)
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except (IllegalEventException, IllegalVoteError) as e:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=str(e)) from e
+
+    return ORJSONResponse({"data": project_event(event)})
+
+
+@router.post("/{event_id}/close", status_code=HTTP_200_OK, response_model=MeetingEventCloseResponse)
+async def close_event(event_id: str,
+                      session: CurrentSessionDependency,
+                      service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Close the voting of an event organized by the caller, fixing its most voted option.
+
+    The response lists the attendees who already attend other events at that time.
+    """
+
+    try:
+        event = await service.close(event_id=event_id, username=session.subject)
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except IllegalEventException as e:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=str(e)) from e
+
+    conflicts = [{"username": username, "events": [other.id for other in others]}
+                 for username, others in sorted(service.find_attendee_conflicts(event).items())]
+
+    return ORJSONResponse({"data": project_event(event), "conflicts": conflicts})
+
+
+@router.put("/{event_id}/availability", status_code=HTTP_200_OK, response_model=AvailabilityResponse)
+async def set_availability(event_id: str,
+                           availability: AvailabilityIn,
+                           session: CurrentSessionDependency,
+                           service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Replace when the caller is available for an event.
+    """
+
+    windows = [(window.start, window.end) for window in availability.windows]
+
+    try:
+        await service.set_availability(event_id=event_id, username=session.subject, windows=windows)
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except (IllegalEventException, IllegalAvailabilityError) as e:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=str(e)) from e
+
+    return ORJSONResponse({"data": {"windows": [{"start": start, "end": end} for start, end in windows]}})
+
+
+@router.get("/{event_id}/suggestions", status_code=HTTP_200_OK, response_model=SuggestionResponse)
+async def get_suggestions(event_id: str,
+                          service: MeetingEventServiceDependency,
+                          start: Annotated[datetime | None, Query(description="Start of the horizon.")] = None,
+                          days: Annotated[int, Query(ge=1, le=SUGGESTION_MAX_DAYS)] = 90,
+                          limit: Annotated[int, Query(ge=1, le=100)] = 5,
+                          ) -> ORJSONResponse:
+    """
+    Get the options which most attendees are available for, most available first.
+
+    Suggestions can be added as they are to the event options.
+    """
+
+    try:
+        suggestions = service.suggest(event_id=event_id,
+                                      start=naive_utc(start) if start is not None else None,
+                                      days=days,
+                                      limit=limit)
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+
+    return ORJSONResponse({"data": [{"date": option.date, "hour": option.hour, "attendees": attendees}
+                                    for option, attendees in suggestions]})
+
+
+@router.post("/{event_id}/options", status_code=HTTP_200_OK, response_model=MeetingEventResponse)
+async def add_options(event_id: str,
+                      options_form: MeetingEventOptionsIn,
+                      session: CurrentSessionDependency,
+                      service: MeetingEventServiceDependency) -> ORJSONResponse:
+    """
+    Add options to an event organized by the caller.
+    """
+
+    try:
+        event = await service.add_options(event_id=event_id,
+                                          username=session.subject,
+                                          options=[(option.date, option.hour) for option in options_form.options])
+    except EventNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=str(e)) from e
+    except (IllegalEventException, IllegalVoteError) as e:
+        raise HTTPException(status_code=HTTP_409_CONFLICT, detail=str(e)) from e
+
+    return ORJSONResponse({"data": project_event(event)})
@@ -0,0 +1,48 @@
+"""Session Entry Point
+
+This module contains the entry point for authenticated sessions.
+"""
+from datetime import datetime, timezone
+from typing import Annotated
+
+from fastapi import APIRouter, HTTPException, Depends
+from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_401_UNAUTHORIZED, HTTP_503_SERVICE_UNAVAILABLE
+
+from pymeet.domain.schemas import Credentials, Session, SessionResponse, SessionToken
+from pymeet.services.authentication import AuthenticationService
+from pymeet.services.dependencies import CurrentSessionDependency, get_authentication_service
+from pymeet.services.password_encoder import EncoderOverloadedException, InvalidPasswordException
+
+router: APIRouter = APIRouter(prefix="/sessions", tags=["sessions"])
+
+AuthenticationServiceDependency = Annotated[AuthenticationService, Depends(get_authentication_service)]
+
+
+@router.post("/", status_code=HTTP_201_CREATED)
+async def create_session(credentials: Credentials, authentication: AuthenticationServiceDependency) -> SessionResponse:
+    """
+    Log in, exchanging a username and password for a session token.
+    """
+
+    try:
+        token, claims = await authentication.login(username=credentials.username, password=credentials.password)
+    except InvalidPasswordException as e:
+        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="Invalid username or password.") from e
+    except EncoderOverloadedException as e:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)}) from e
+
+    return SessionResponse(data=SessionToken(access_token=token,
+                                             username=claims.subject,
+                                             expires_at=datetime.fromtimestamp(claims.expires_at, tz=timezone.utc)))
+
+
+@router.get("/current", status_code=HTTP_200_OK)
+async def read_current_session(session: CurrentSessionDependency) -> SessionResponse:
+    """
+    Get the session of the caller.
+    """
+
+    return SessionResponse(data=Session(username=session.subject,
+                                        expires_at=datetime.fromtimestamp(session.expires_at, tz=timezone.utc)))
@@ -2,42 +2,142 @@
 
 This module contains the entry point for the user domain object.
 """
-from typing import Annotated
+from typing import Annotated, Any, AsyncIterator
 
-from fastapi import APIRouter, HTTPException, Depends
-from starlette.status import HTTP_409_CONFLICT, HTTP_201_CREATED, HTTP_200_OK
+import orjson
+from fastapi import APIRouter, HTTPException, Depends, Query
+from fastapi.responses import ORJSONResponse
+from starlette.responses import StreamingResponse
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_207_MULTI_STATUS,
+    HTTP_409_CONFLICT,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
 
-from pymeet.domain.schemas import UserIn, UserResponse, BaseUser
-from pymeet.services.dependencies import get_register_service, UserRepositoryDependency
+from pymeet.domain.schemas import (
+    ConflictResponse,
+    UserBatchIn,
+    UserBatchResponse,
+    UserIn,
+    UserPageResponse,
+    UserResponse,
+    project_user,
+)
+from pymeet.adapters.repository import AsyncUserRepository
+from pymeet.services.dependencies import get_event_service, get_register_service, AsyncUserRepositoryDependency
+from pymeet.services.events import MeetingEventService
+from pymeet.services.password_encoder import EncoderOverloadedException
 from pymeet.services.register import IllegalUserException, RegisterService
 
 router: APIRouter = APIRouter(prefix="/users", tags=["users"])
 
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+EXPORT_CHUNK_SIZE = 1000
+
 RegisterServiceDependency = Annotated[RegisterService, Depends(get_register_service)]
+MeetingEventServiceDependency = Annotated[MeetingEventService, Depends(get_event_service)]
 
 
-@router.post("/", status_code=HTTP_201_CREATED)
-def register_user(user_form: UserIn, user_repository: RegisterServiceDependency) -> UserResponse:
+@router.post("/", status_code=HTTP_201_CREATED, response_model=UserResponse)
+async def register_user(user_form: UserIn, user_repository: RegisterServiceDependency) -> ORJSONResponse:
     """
     Register a new user.
     """
 
     try:
-        user = user_repository.register(username=user_form.username,
-                                        email=user_form.email,
-                                        password=user_form.password1)
+        user = await user_repository.register(username=user_form.username,
+                                              email=user_form.email,
+                                              password=user_form.password1)
     except IllegalUserException as e:
         raise HTTPException(status_code=HTTP_409_CONFLICT, detail=str(e)) from e
+    except EncoderOverloadedException as e:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)}) from e
+
+    return ORJSONResponse({"data": project_user(user)}, status_code=HTTP_201_CREATED)
+
+
+@router.post("/batch", status_code=HTTP_207_MULTI_STATUS, response_model=UserBatchResponse)
+async def register_users(batch: UserBatchIn, register_service: RegisterServiceDependency) -> ORJSONResponse:
+    """
+    Register several users at once, reporting the outcome of each one.
+    """
+
+    users = [(user.username, user.email, user.password1) for user in batch.users]
+
+    try:
+        registrations = await register_service.register_many(users)
+    except EncoderOverloadedException as e:
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE,
+                            detail=str(e),
+                            headers={"Retry-After": str(e.retry_after)}) from e
+
+    results = [{"username": r.username,
+                "email": r.email,
+                "status": HTTP_409_CONFLICT if r.error else HTTP_201_CREATED,
+                "detail": r.error} for r in registrations]
+
+    return ORJSONResponse({"data": results}, status_code=HTTP_207_MULTI_STATUS)
+
+
+@router.get("/", status_code=HTTP_200_OK, response_model=UserPageResponse, response_model_exclude_none=True)
+async def get_users(user_repository: AsyncUserRepositoryDependency,
+                    limit: Annotated[int, Query(ge=1, le=MAX_PAGE_SIZE)] = DEFAULT_PAGE_SIZE,
+                    after: Annotated[str | None, Query(description="Username of the last user already seen.")] = None,
+                    ) -> ORJSONResponse:
+    """
+    Get users, a page at a time, ordered by username.
+    """
+
+    found = await user_repository.find_page(after=after, limit=limit + 1)
+    content: dict[str, Any] = {"data": [project_user(user) for user in found[:limit]]}
+
+    if len(found) > limit:
+        content["next"] = found[limit - 1].username
+
+    return ORJSONResponse(content)
+
+
+async def _export_users(user_repository: AsyncUserRepository) -> AsyncIterator[bytes]:
+    """
+    Yields every user as NDJSON, one repository page per chunk.
+    """
+    after = None
+
+    while users := await user_repository.find_page(after=after, limit=EXPORT_CHUNK_SIZE):
+        yield b"".join(orjson.dumps(project_user(user)) + b"\n" for user in users)
+        after = users[-1].username
+
+
+@router.get(":export",
+            status_code=HTTP_200_OK,
+            response_class=StreamingResponse,
+            responses={HTTP_200_OK: {"content": {"application/x-ndjson": {}}}})
+async def export_users(user_repository: AsyncUserRepositoryDependency) -> StreamingResponse:
+    """
+    Export every user as newline-delimited JSON, ordered by username.
+
+    The body is streamed while users are read, so memory does not grow with the number of users.
+    """
 
-    return UserResponse(data=BaseUser(**{"username": user.username, "email": user.email}))
+    return StreamingResponse(_export_users(user_repository), media_type="application/x-ndjson")
 
 
-@router.get("/", status_code=HTTP_200_OK)
-def get_users(user_repository: UserRepositoryDependency) -> UserResponse:
+@router.get("/{username}/conflicts", status_code=HTTP_200_OK, response_model=ConflictResponse)
+async def get_user_conflicts(username: str, service: MeetingEventServiceDependency) -> ORJSONResponse:
     """
-    Get all users.
+    Get the events with a voted date a user attends which overlap other ones they attend, ordered by start.
     """
 
-    users = list((BaseUser(**{"username": user.username, "email": user.email}) for user in user_repository.find_all()))
+    conflicts = service.find_user_conflicts(username)
 
-    return UserResponse(data=users)
+    return ORJSONResponse({"data": [{"id": event.id,
+                                     "name": event.name,
+                                     "start": event.voted_date,
+                                     "end": event.end_date,
+                                     "conflictsWith": [other.id for other in others]}
+                                    for event, others in conflicts]})
@@ -1,11 +1,38 @@
 """
 Applicant Main File.
+
+Serve it with `uvicorn --factory pymeet.main:create_app`. Importing this module builds nothing: the application, and
+the modules it needs, are loaded when the factory is called or when `app` is first accessed, so `pymeet.main:app`
+keeps working.
 """
-import uvicorn
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fastapi import FastAPI
+
+
+def create_app() -> "FastAPI":
+    """
+    Builds a new application, for `uvicorn --factory`.
+
+    Returns:
+       FastAPI: Application object instance.
+    """
+    from pymeet.app.asgi import get_application
 
-from pymeet.app.asgi import get_application
+    return get_application()
+
+
+def __getattr__(name: str):
+    # PEP 562: `app` is built on first access and then kept as a module attribute.
+    if name == "app":
+        globals()["app"] = create_app()
+        return globals()["app"]
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-app = get_application()
 
 if __name__ == "__main__":
-    uvicorn.run(app)
+    import uvicorn
+
+    uvicorn.run(create_app, factory=True)
@@ -0,0 +1,94 @@
+"""
+Authentication Service
+"""
+import logging
+import secrets
+from weakref import WeakKeyDictionary
+
+from pymeet.adapters.repository import AsyncUserRepository
+from pymeet.domain.models import User
+from pymeet.services.password_encoder import AsyncPasswordEncoder, InvalidPasswordException
+from pymeet.services.tokens import TokenClaims, TokenService
+
+log = logging.getLogger(__name__)
+
+_dummy_passwords: WeakKeyDictionary[AsyncPasswordEncoder, str] = WeakKeyDictionary()
+
+
+class AuthenticationService:
+    """
+    Authentication Service
+
+    Unknown usernames are verified against a dummy password encoded by the same encoder, so logging in costs the same
+    whether the user exists or not and response times do not reveal which usernames are registered.
+    """
+
+    def __init__(self,
+                 user_repository: AsyncUserRepository,
+                 password_encoder: AsyncPasswordEncoder,
+                 token_service: TokenService):
+        self.user_repository = user_repository
+        self.password_encoder = password_encoder
+        self.token_service = token_service
+
+    async def authenticate(self, username: str, password: str) -> User:
+        """
+        Verifies a user credentials.
+
+        When the stored password was hashed with outdated settings it is replaced with a fresh hash.
+
+        Args:
+            username (str): The username of the user.
+            password (str): The password of the user.
+
+        Returns:
+            User: The authenticated user.
+
+        Raises:
+            InvalidPasswordException: If the user does not exist or the password does not match.
+            EncoderOverloadedException: If the password encoder cannot accept more work.
+        """
+        user = await self.user_repository.find_by_username(username)
+
+        if user is None:
+            await self._verify_dummy(password)
+            raise InvalidPasswordException("Invalid username or password.")
+
+        new_password = await self.password_encoder.verify(password, user.password)
+
+        if new_password is not None:
+            log.debug("Rehash password of %s.", username)
+            user.password = new_password
+            await self.user_repository.update(user)
+
+        return user
+
+    async def _verify_dummy(self, password: str) -> None:
+        dummy = _dummy_passwords.get(self.password_encoder)
+
+        if dummy is None:
+            dummy = await self.password_encoder.encode(secrets.token_urlsafe(16))
+            dummy = _dummy_passwords.setdefault(self.password_encoder, dummy)
+
+        try:
+            await self.password_encoder.verify(password, dummy)
+        except InvalidPasswordException:
+            pass
+
+    async def login(self, username: str, password: str) -> tuple[str, TokenClaims]:
+        """
+        Authenticates a user and issues a session token.
+
+        Args:
+            username (str): The username of the user.
+            password (str): The password of the user.
+
+        Returns:
+            tuple[str, TokenClaims]: The session token and what it asserts.
+
+        Raises:
+            InvalidPasswordException: If the user does not exist or the password does not match.
+            EncoderOverloadedException: If the password encoder cannot accept more work.
+        """
+        user = await self.authenticate(username, password)
+        return self.token_service.issue(user.username)
@@ -1,39 +1,199 @@
 """Dependencies
 
 This module contains the dependencies for the application.
+
+Dependencies are coroutines so FastAPI resolves them on the event loop instead of sending each one to the threadpool.
 """
+from functools import lru_cache
 from typing import Annotated
 
-from fastapi import Depends
+import orjson
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from starlette.status import HTTP_401_UNAUTHORIZED
 
-from pymeet.adapters.repository import UserRepository, ListUserRepository
-from pymeet.services.password_encoder import PasswordEncoder, BcryptPasswordEncoder
+from pymeet.adapters.broker import EventBroker
+from pymeet.adapters.metrics import timed
+from pymeet.adapters.repository import (
+    AsyncUserRepository,
+    AsyncUserRepositoryAdapter,
+    InMemoryMeetingEventRepository,
+    InMemoryUserRepository,
+    MeetingEventRepository,
+    UserRepository,
+)
+from pymeet.app.config.settings import Application
+from pymeet.domain.schemas import project_event
+from pymeet.services.authentication import AuthenticationService
+from pymeet.services.events import MeetingEventService
+from pymeet.services.password_encoder import AsyncPasswordEncoder
 from pymeet.services.register import RegisterService
+from pymeet.services.tokens import InvalidTokenException, TokenClaims, TokenService
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Application:
+    """
+    Returns the application settings.
+    """
+    return Application()
 
 
-def get_password_encoder() -> PasswordEncoder:
+async def get_password_encoder(request: Request) -> AsyncPasswordEncoder:
     """
-    Returns the password encoder.
+    Returns the password encoder, created once by the application lifespan.
     """
-    return BcryptPasswordEncoder()
+    return request.app.state.password_encoder
+
+
+PasswordEncoderDependency = Annotated[AsyncPasswordEncoder, Depends(get_password_encoder)]
+
 
+@lru_cache(maxsize=1)
+def _create_user_repository() -> UserRepository:
+    settings = get_settings()
 
-PasswordEncoderDependency = Annotated[PasswordEncoder, Depends(get_password_encoder)]
+    if settings.USE_SQLITE:
+        # SQLAlchemy takes a while to import, so only processes using it pay for it.
+        from pymeet.adapters.orm import create_sqlite_engine
+        from pymeet.adapters.sql_repository import SqlAlchemyUserRepository
 
+        engine = create_sqlite_engine(settings.DATABASE_URL,
+                                      pool_size=settings.DATABASE_POOL_SIZE,
+                                      max_overflow=settings.DATABASE_MAX_OVERFLOW,
+                                      pool_timeout=settings.DATABASE_POOL_TIMEOUT)
+        return timed(SqlAlchemyUserRepository(engine), name="users")
 
-def get_user_repository() -> UserRepository:
+    return timed(InMemoryUserRepository(), name="users")
+
+
+async def get_user_repository() -> UserRepository:
     """
     Returns the user repository.
+
+    The repository is shared by every request served by this process. It is backed by SQLite when `USE_SQLITE` is
+    enabled, otherwise users are kept in memory. Its operations are timed in the repository latency metrics.
     """
-    return ListUserRepository()
+    return _create_user_repository()
 
 
 UserRepositoryDependency = Annotated[UserRepository, Depends(get_user_repository)]
 
 
-def get_register_service(repository: UserRepositoryDependency,
-                         encoder: PasswordEncoderDependency) -> RegisterService:
+async def get_async_user_repository(request: Request, repository: UserRepositoryDependency) -> AsyncUserRepository:
+    """
+    Returns the user repository to be awaited from the event loop.
+    """
+    return AsyncUserRepositoryAdapter(repository, limiter=request.app.state.database_limiter)
+
+
+AsyncUserRepositoryDependency = Annotated[AsyncUserRepository, Depends(get_async_user_repository)]
+
+
+async def get_register_service(repository: AsyncUserRepositoryDependency,
+                               encoder: PasswordEncoderDependency) -> RegisterService:
     """
     Returns the register service.
     """
     return RegisterService(user_repository=repository, password_encoder=encoder)
+
+
+@lru_cache(maxsize=1)
+def _create_token_service() -> TokenService:
+    settings = get_settings()
+    return TokenService(secret_key=settings.SECRET_KEY, ttl=settings.SESSION_TTL)
+
+
+async def get_token_service() -> TokenService:
+    """
+    Returns the session token service.
+    """
+    return _create_token_service()
+
+
+TokenServiceDependency = Annotated[TokenService, Depends(get_token_service)]
+
+
+async def get_authentication_service(repository: AsyncUserRepositoryDependency,
+                                     encoder: PasswordEncoderDependency,
+                                     token_service: TokenServiceDependency) -> AuthenticationService:
+    """
+    Returns the authentication service.
+    """
+    return AuthenticationService(user_repository=repository, password_encoder=encoder, token_service=token_service)
+
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_session(token_service: TokenServiceDependency,
+                              credentials: Annotated[HTTPAuthorizationCredentials | None, Depends(bearer_scheme)]
+                              ) -> TokenClaims:
+    """
+    Returns the session of the caller, validated from its Bearer token alone.
+
+    Raises:
+        HTTPException: If the token is missing or invalid.
+    """
+    if credentials is None:
+        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED,
+                            detail="Not authenticated.",
+                            headers={"WWW-Authenticate": "Bearer"})
+
+    try:
+        return token_service.validate(credentials.credentials)
+    except InvalidTokenException as e:
+        raise HTTPException(status_code=HTTP_401_UNAUTHORIZED,
+                            detail=str(e),
+                            headers={"WWW-Authenticate": "Bearer"}) from e
+
+
+CurrentSessionDependency = Annotated[TokenClaims, Depends(get_current_session)]
+
+
+@lru_cache(maxsize=1)
+def _create_event_repository() -> MeetingEventRepository:
+    return timed(InMemoryMeetingEventRepository(), name="events")
+
+
+async def get_event_repository() -> MeetingEventRepository:
+    """
+    Returns the meeting event repository, shared by every request served by this process.
+
+    Events are kept in memory, loaded at startup from the event journal when `JOURNAL_DIRECTORY` is set. Its operations
+    are timed in the repository latency metrics.
+    """
+    return _create_event_repository()
+
+
+EventRepositoryDependency = Annotated[MeetingEventRepository, Depends(get_event_repository)]
+
+
+@lru_cache(maxsize=1)
+def _create_event_broker() -> EventBroker:
+    return EventBroker(render=lambda event: orjson.dumps(project_event(event)),
+                       window=get_settings().EVENT_UPDATES_WINDOW)
+
+
+async def get_event_broker() -> EventBroker:
+    """
+    Returns the broker pushing event updates, shared by every request served by this process.
+    """
+    return _create_event_broker()
+
+
+EventBrokerDependency = Annotated[EventBroker, Depends(get_event_broker)]
+
+
+async def get_event_service(request: Request,
+                            event_repository: EventRepositoryDependency,
+                            user_repository: AsyncUserRepositoryDependency,
+                            broker: EventBrokerDependency) -> MeetingEventService:
+    """
+    Returns the meeting event service.
+    """
+    return MeetingEventService(event_repository=event_repository,
+                               user_repository=user_repository,
+                               broker=broker,
+                               locks=request.app.state.event_locks,
+                               journal=request.app.state.event_journal)
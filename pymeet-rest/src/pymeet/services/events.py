@@ -0,0 +1,379 @@
+"""
+Meeting Event Service
+"""
+import datetime
+from functools import partial
+from typing import Callable
+
+from pymeet.adapters.broker import EventBroker
+from pymeet.adapters.journal import EventJournal, event_record
+from pymeet.adapters.repository import AsyncUserRepository, MeetingEventRepository
+from pymeet.domain.availability import Window, suggest_options
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.tallies import PACKED_VOTES_AVAILABLE, BucketVoteTally, PackedVoteTally
+from pymeet.services.locks import StripedLock
+
+PACKED_TALLY_MIN_BALLOTS = 100_000
+SUGGESTION_MAX_DAYS = 366
+
+
+class EventNotFoundException(Exception):
+    """
+    Exception raised when an event does not exist.
+    """
+    pass
+
+
+class IllegalEventException(Exception):
+    """
+    Exception raised when an event cannot be created or changed as requested.
+    """
+    pass
+
+
+class MeetingEventService:
+    """
+    Meeting Event Service
+
+    Changes to an event hold the lock of its stripe from reading the event until the change is stored, so changes to
+    the same event never interleave while changes to events on other stripes run concurrently. Users are looked up
+    before taking the lock. Each change is first checked against the stored event, which is then changed in place once
+    the change is stored, so a rejected change leaves nothing behind and a change costs the same whatever the size of
+    the event. Only closing the voting refreshes the indexes of the event.
+
+    When given a broker, every change to the votes or options of an event is published to the subscribers of the
+    event, and closing the voting ends their subscriptions.
+
+    When given a journal, every change is appended to it with the version of the event it was made to, and only applied
+    once the journal made it durable, so the events never hold a change the journal could lose. Changes to events on
+    other stripes wait for the journal meanwhile, so they are committed together, while changes to the same event wait
+    for each other to be durable. A change the journal failed to write is not applied, and its OSError raised.
+    """
+
+    def __init__(self,
+                 event_repository: MeetingEventRepository,
+                 user_repository: AsyncUserRepository,
+                 broker: EventBroker | None = None,
+                 locks: StripedLock | None = None,
+                 journal: EventJournal | None = None):
+        self.event_repository = event_repository
+        self.user_repository = user_repository
+        self.broker = broker
+        self.locks = locks or StripedLock()
+        self.journal = journal
+
+    async def _change(self,
+                      event_id: str,
+                      check: Callable[[MeetingEvent], object],
+                      change: Callable[[MeetingEvent], object],
+                      record: dict,
+                      reindex: bool = False) -> MeetingEvent:
+        async with self.locks.lock_for(event_id):
+            event = self.get(event_id)
+            check(event)
+            await self._store({**record, "version": event.version}, partial(self._apply, event, change, reindex))
+
+        return event
+
+    def _apply(self, event: MeetingEvent, change: Callable[[MeetingEvent], object], reindex: bool) -> None:
+        change(event)
+        self.event_repository.update(event, reindex=reindex)
+
+    async def _store(self, record: dict, store: Callable[[], None]) -> None:
+        if self.journal is None:
+            store()
+        else:
+            await self.journal.append(record, store)
+
+    def _publish(self, event: MeetingEvent) -> None:
+        if self.broker is not None:
+            self.broker.publish(event.id, event)
+
+    async def _find_user(self, username: str) -> User:
+        user = await self.user_repository.find_by_username(username)
+
+        if user is None:
+            raise IllegalEventException(f"User {username} does not exist.")
+
+        return user
+
+    def get(self, event_id: str) -> MeetingEvent:
+        """
+        Gets an event.
+
+        Args:
+            event_id (str): The identifier of the event.
+
+        Returns:
+            MeetingEvent: The event.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+        """
+        event = self.event_repository.find_by_id(event_id)
+
+        if event is None:
+            raise EventNotFoundException(f"Event {event_id} does not exist.")
+
+        return event
+
+    async def create(self,
+                     name: str,
+                     organizer: str,
+                     options: list[tuple[datetime.date, int]],
+                     attendees: list[str],
+                     duration: datetime.timedelta = datetime.timedelta(hours=1)) -> MeetingEvent:
+        """
+        Creates an event. The organizer always attends it.
+
+        Events with at least PACKED_TALLY_MIN_BALLOTS attendee and option pairs count their votes with a
+        PackedVoteTally, when NumPy is installed.
+
+        Args:
+            name (str): The name of the event.
+            organizer (str): The username of the organizer.
+            options (list[tuple[datetime.date, int]]): The proposed date and hour of each option.
+            attendees (list[str]): The usernames of the attendees.
+            duration (datetime.timedelta): How long the event lasts.
+
+        Returns:
+            MeetingEvent: The created event.
+
+        Raises:
+            IllegalEventException: If the organizer or an attendee does not exist.
+        """
+        organizer_user = await self._find_user(organizer)
+        attendee_users = {organizer_user}
+
+        for username in set(attendees) - {organizer}:
+            attendee_users.add(await self._find_user(username))
+
+        packed = PACKED_VOTES_AVAILABLE and len(attendee_users) * len(options) >= PACKED_TALLY_MIN_BALLOTS
+
+        event = MeetingEvent(name=name,
+                             options=[MeetingEventOption(date=date, hour=hour) for date, hour in options],
+                             attendees=attendee_users,
+                             organizer=organizer_user,
+                             tally=PackedVoteTally if packed else BucketVoteTally,
+                             duration=duration)
+
+        await self._store(event_record(event), partial(self.event_repository.save, event))
+        return event
+
+    async def vote(self, event_id: str, voter: str, date: datetime.date, hour: int) -> MeetingEvent:
+        """
+        Votes for an option of an event.
+
+        Args:
+            event_id (str): The identifier of the event.
+            voter (str): The username of the voter.
+            date (datetime.date): The date of the option.
+            hour (int): The hour of the option.
+
+        Returns:
+            MeetingEvent: The voted event.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+            IllegalEventException: If the voter does not exist.
+            IllegalVoteError: If the voter cannot vote for that option.
+        """
+        user = await self._find_user(voter)
+        option = MeetingEventOption(date=date, hour=hour)
+        event = await self._change(event_id,
+                                   lambda e: e.check_vote(voter=user, option=option),
+                                   lambda e: e.vote(voter=user, option=option),
+                                   {"op": "vote", "id": event_id, "voter": voter, "option": (date, hour)})
+        self._publish(event)
+        return event
+
+    @staticmethod
+    def _check_organizer(event: MeetingEvent, username: str) -> None:
+        if event.organizer is None or event.organizer.username != username:
+            raise IllegalEventException("Only the organizer can change the event.")
+
+    async def set_availability(self, event_id: str, username: str, windows: list[Window]) -> MeetingEvent:
+        """
+        Replaces when an attendee is available for an event.
+
+        Args:
+            event_id (str): The identifier of the event.
+            username (str): The username of the attendee.
+            windows (list[Window]): When the attendee is available, each window from its start to its end.
+
+        Returns:
+            MeetingEvent: The event.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+            IllegalEventException: If the user does not exist.
+            IllegalAvailabilityError: If the user is not an attendee or a window ends before it starts.
+        """
+        user = await self._find_user(username)
+        return await self._change(event_id,
+                                  lambda e: e.check_availability(user, windows),
+                                  lambda e: e.set_availability(user, windows),
+                                  {"op": "availability", "id": event_id, "attendee": username, "windows": windows})
+
+    def suggest(self,
+                event_id: str,
+                start: datetime.datetime | None = None,
+                days: int = 90,
+                limit: int = 5) -> list[tuple[MeetingEventOption, int]]:
+        """
+        Suggests the options of an event which most attendees are available for.
+
+        Args:
+            event_id (str): The identifier of the event.
+            start (datetime.datetime | None): The start of the horizon, naive in UTC, the earliest availability by
+                default.
+            days (int): The length of the horizon, in days, up to SUGGESTION_MAX_DAYS.
+            limit (int): The most options to suggest, hours no attendee is available for are never suggested.
+
+        Returns:
+            list[tuple[MeetingEventOption, int]]: The suggested options with how many attendees are available for each.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+        """
+        event = self.get(event_id)
+
+        if start is None:
+            start = min((window[0] for windows in event.availability.values() for window in windows), default=None)
+
+        if start is None:
+            return []
+
+        return suggest_options(event.availability.values(), start, min(days, SUGGESTION_MAX_DAYS) * 24, limit)
+
+    async def add_options(self,
+                          event_id: str,
+                          username: str,
+                          options: list[tuple[datetime.date, int]]) -> MeetingEvent:
+        """
+        Adds options to an event, skipping the ones it already has.
+
+        Args:
+            event_id (str): The identifier of the event.
+            username (str): Who adds the options, it must be the organizer.
+            options (list[tuple[datetime.date, int]]): The proposed date and hour of each option.
+
+        Returns:
+            MeetingEvent: The event.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+            IllegalEventException: If the user is not the organizer.
+            IllegalVoteError: If the voting is closed.
+        """
+        def check(event: MeetingEvent) -> None:
+            self._check_organizer(event, username)
+            event.check_open()
+
+        def add(event: MeetingEvent) -> None:
+            for date, hour in options:
+                event.add_option(MeetingEventOption(date=date, hour=hour))
+
+        event = await self._change(event_id, check, add, {"op": "options", "id": event_id, "options": options})
+        self._publish(event)
+        return event
+
+    async def close(self, event_id: str, username: str) -> MeetingEvent:
+        """
+        Closes the voting of an event, fixing its most voted option.
+
+        Args:
+            event_id (str): The identifier of the event.
+            username (str): Who closes the voting, it must be the organizer.
+
+        Returns:
+            MeetingEvent: The closed event.
+
+        Raises:
+            EventNotFoundException: If the event does not exist.
+            IllegalEventException: If the user is not the organizer or the voting is already closed.
+        """
+        def check(event: MeetingEvent) -> None:
+            self._check_organizer(event, username)
+
+            if not event.open_voting:
+                raise IllegalEventException("Voting is already closed.")
+
+        event = await self._change(event_id, check, MeetingEvent.close_voting, {"op": "close", "id": event_id},
+                                   reindex=True)
+
+        if self.broker is not None:
+            self.broker.close(event.id, event)
+        return event
+
+    def find_attendee_conflicts(self, event: MeetingEvent) -> dict[str, list[MeetingEvent]]:
+        """
+        Finds the attendees of an event with a voted date who attend other events overlapping it.
+
+        Args:
+            event (MeetingEvent): The event.
+
+        Returns:
+            dict[str, list[MeetingEvent]]: The other events overlapping the event, by username of the attendee.
+        """
+        start, end = event.voted_date, event.end_date
+
+        if start is None or end is None:
+            return {}
+
+        conflicts = {}
+
+        for attendee in event.attendees:
+            overlapping = [other for other in self.event_repository.find_overlapping(attendee.username, start, end)
+                           if other.id != event.id]
+
+            if overlapping:
+                conflicts[attendee.username] = overlapping
+
+        return conflicts
+
+    def find_user_conflicts(self, username: str) -> list[tuple[MeetingEvent, list[MeetingEvent]]]:
+        """
+        Finds the events with a voted date a user attends which overlap other ones they attend.
+
+        Args:
+            username (str): The username of the attendee.
+
+        Returns:
+            list[tuple[MeetingEvent, list[MeetingEvent]]]: Each conflicting event, ordered by voted date, with the
+                events it overlaps.
+        """
+        return self.event_repository.find_conflicts(username)
+
+    def find(self,
+             attendee: str | None = None,
+             start: datetime.datetime | None = None,
+             end: datetime.datetime | None = None,
+             after: str | None = None,
+             limit: int = 100) -> list[MeetingEvent]:
+        """
+        Finds a page of the events by attendee, by voted date range, or else of every event.
+
+        Pages within a voted date range are ordered by voted date, the others by identifier.
+
+        Args:
+            attendee (str | None): Only events attended by this username.
+            start (datetime.datetime | None): Only events voted for this moment or later, naive in UTC.
+            end (datetime.datetime | None): Only events voted for before this moment, naive in UTC.
+            after (str | None): Identifier of the last event of the previous page.
+            limit (int): The maximum number of events to return.
+
+        Returns:
+            list[MeetingEvent]: The matching events.
+        """
+        if start is not None or end is not None:
+            return self.event_repository.find_by_voted_date(start or datetime.datetime.min,
+                                                            end or datetime.datetime.max,
+                                                            attendee=attendee,
+                                                            after=after,
+                                                            limit=limit)
+
+        if attendee is not None:
+            return self.event_repository.find_by_attendee(attendee, after=after, limit=limit)
+
+        return self.event_repository.find_page(after=after, limit=limit)
@@ -0,0 +1,68 @@
+"""
+Health Service
+"""
+from dataclasses import dataclass
+
+from anyio import CapacityLimiter
+
+from pymeet.services.password_encoder import EncoderStats
+
+
+@dataclass(frozen=True)
+class Saturation:
+    """
+    How much of a pool is taken, compared with the share from which the worker should stop taking work.
+
+    Attributes:
+        used (int): Slots taken, plus the tasks waiting for one.
+        capacity (int): Slots in the pool.
+        threshold (float): Share of the capacity from which the pool is saturated.
+    """
+    used: int
+    capacity: int
+    threshold: float
+
+    @property
+    def ratio(self) -> float:
+        """
+        Returns the share of the capacity taken, above 1 when tasks are waiting.
+        """
+        return self.used / self.capacity if self.capacity else float("inf")
+
+    @property
+    def saturated(self) -> bool:
+        """
+        Returns whether the pool reached the threshold.
+        """
+        return self.ratio >= self.threshold
+
+
+def limiter_saturation(limiter: CapacityLimiter, threshold: float) -> Saturation:
+    """
+    Measures the saturation of a capacity limiter, such as the threadpool or the database connections.
+
+    Args:
+        limiter (CapacityLimiter): The limiter.
+        threshold (float): Share of the tokens from which the limiter is saturated.
+
+    Returns:
+        Saturation: The tokens borrowed and waited for, out of the total tokens.
+    """
+    statistics = limiter.statistics()
+    return Saturation(used=statistics.borrowed_tokens + statistics.tasks_waiting,
+                      capacity=int(limiter.total_tokens),
+                      threshold=threshold)
+
+
+def encoder_saturation(stats: EncoderStats, threshold: float) -> Saturation:
+    """
+    Measures the saturation of the queue of a pooled password encoder.
+
+    Args:
+        stats (EncoderStats): The encoder activity.
+        threshold (float): Share of the queue from which the encoder is saturated.
+
+    Returns:
+        Saturation: The calls pending, out of the calls allowed to be pending.
+    """
+    return Saturation(used=stats.queue_depth, capacity=stats.max_queue_size, threshold=threshold)
@@ -0,0 +1,33 @@
+"""
+Lock Striping
+"""
+import asyncio
+from zlib import crc32
+
+
+class StripedLock:
+    """
+    A fixed set of asyncio locks shared by any number of keys.
+
+    Each key always maps to the same stripe, so changes to the same key are serialized while changes to keys on
+    other stripes proceed concurrently, without keeping a lock per key.
+
+    Attributes:
+        stripes (int): How many locks are shared by the keys.
+    """
+
+    def __init__(self, stripes: int = 64):
+        self.stripes = stripes
+        self._locks = [asyncio.Lock() for _ in range(stripes)]
+
+    def lock_for(self, key: str) -> asyncio.Lock:
+        """
+        Gets the lock guarding a key.
+
+        Args:
+            key (str): The key.
+
+        Returns:
+            asyncio.Lock: The lock of the stripe of the key.
+        """
+        return self._locks[crc32(key.encode()) % self.stripes]
@@ -2,8 +2,21 @@
 Password Encoder Service
 """
 import abc
+import asyncio
+import hmac
+import logging
+import math
+import time
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
 
-from passlib.context import CryptContext
+from pymeet.adapters.metrics import Histogram
+
+if TYPE_CHECKING:
+    from passlib.context import CryptContext
+
+log = logging.getLogger(__name__)
 
 
 class InvalidPasswordException(Exception):
@@ -13,6 +26,19 @@ class InvalidPasswordException(Exception):
     pass
 
 
+class EncoderOverloadedException(Exception):
+    """
+    Exception raised when too many passwords are already waiting to be encoded.
+
+    Attributes:
+        retry_after (int): Seconds the caller should wait before trying again.
+    """
+
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class PasswordEncoder(abc.ABC):
     """
     Abstract Password Encoder
@@ -32,7 +58,7 @@ class PasswordEncoder(abc.ABC):
         raise NotImplementedError
 
     @abc.abstractmethod
-    def verify(self, password: str, encoded_password: str):
+    def verify(self, password: str, encoded_password: str) -> str | None:
         """
         Verifies a password.
 
@@ -40,6 +66,9 @@ class PasswordEncoder(abc.ABC):
             password (str): The password to verify.
             encoded_password (str): The encoded password to compare with.
 
+        Returns:
+            str | None: A new encoding of the password if the given one uses outdated settings, otherwise None.
+
         Raises:
             InvalidPasswordException: If the password is invalid.
         """
@@ -49,10 +78,34 @@ class PasswordEncoder(abc.ABC):
 class BcryptPasswordEncoder(PasswordEncoder):
     """
     BCrypt Password Encoder
+
+    Passlib and its bcrypt backend are only imported on first use, so a server whose hashing runs in worker processes
+    never loads them, and neither does a worker until it hashes.
+
+    Attributes:
+        rounds (int | None): The bcrypt cost factor, None uses the passlib default.
     """
 
-    def __init__(self):
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+    def __init__(self, rounds: int | None = None):
+        self.rounds = rounds
+        self._pwd_context = None
+
+    def __reduce__(self):
+        # The CryptContext cannot be pickled, so worker processes build their own.
+        return self.__class__, (self.rounds,)
+
+    @property
+    def pwd_context(self) -> "CryptContext":
+        """
+        Returns the passlib context hashing with the configured cost, built on first use.
+        """
+        if self._pwd_context is None:
+            from passlib.context import CryptContext
+
+            settings = {"bcrypt__rounds": self.rounds} if self.rounds else {}
+            self._pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", **settings)
+
+        return self._pwd_context
 
     def encode(self, password: str) -> str:
         """
@@ -66,7 +119,7 @@ class BcryptPasswordEncoder(PasswordEncoder):
         """
         return self.pwd_context.hash(password)
 
-    def verify(self, password: str, encoded_password: str):
+    def verify(self, password: str, encoded_password: str) -> str | None:
         """
         Verifies a password.
 
@@ -74,9 +127,319 @@ class BcryptPasswordEncoder(PasswordEncoder):
             password (str): The password to verify.
             encoded_password (str): The encoded password to compare with.
 
+        Returns:
+            str | None: The password hashed with the current cost if the given hash used another one, otherwise None.
+
+        Raises:
+            InvalidPasswordException: If the password does not match or the encoded password is malformed.
         """
 
         try:
-            self.pwd_context.verify(password, encoded_password)
-        except ValueError | TypeError as e:
+            valid = self.pwd_context.verify(password, encoded_password)
+        except (ValueError, TypeError) as e:
             raise InvalidPasswordException("Password does not match.") from e
+
+        if not valid:
+            raise InvalidPasswordException("Password does not match.")
+
+        if self.pwd_context.needs_update(encoded_password):
+            return self.pwd_context.hash(password)
+
+        return None
+
+
+class PlainPasswordEncoder(PasswordEncoder):
+    """
+    Plain Password Encoder
+
+    Keeps passwords as they are. It is only meant for load tests, to measure everything but the hashing, and must never
+    be used to store real passwords.
+    """
+
+    def encode(self, password: str) -> str:
+        """
+        Encodes a password, returning it unchanged.
+
+        Args:
+            password (str): The password to encode.
+
+        Returns:
+            str: The same password.
+        """
+        return password
+
+    def verify(self, password: str, encoded_password: str) -> str | None:
+        """
+        Verifies a password.
+
+        Args:
+            password (str): The password to verify.
+            encoded_password (str): The stored password to compare with.
+
+        Returns:
+            str | None: Always None, plain passwords never need an update.
+
+        Raises:
+            InvalidPasswordException: If the password does not match.
+        """
+        if not hmac.compare_digest(password.encode(), encoded_password.encode()):
+            raise InvalidPasswordException("Password does not match.")
+
+        return None
+
+
+def calibrate_bcrypt_rounds(target_latency: float, min_rounds: int = 10, max_rounds: int = 16) -> int:
+    """
+    Finds the highest bcrypt cost whose hashing time stays within a target on this machine.
+
+    Every extra round doubles the hashing time, so the cost is extrapolated from a cheap probe and then checked once,
+    stepping down while it misses the target.
+
+    Args:
+        target_latency (float): Seconds a single hash may take.
+        min_rounds (int): The lowest cost accepted, regardless of the target.
+        max_rounds (int): The highest cost accepted, regardless of the target.
+
+    Returns:
+        int: The bcrypt cost to use.
+    """
+
+    from passlib.context import CryptContext
+
+    def measure(rounds: int) -> float:
+        context = CryptContext(schemes=["bcrypt"], bcrypt__rounds=rounds)
+        start = time.perf_counter()
+        context.hash("calibration password")
+        return time.perf_counter() - start
+
+    probe = 4
+    measure(probe)  # Loads the bcrypt backend.
+    elapsed = min(measure(probe) for _ in range(3))
+
+    rounds = probe + math.floor(math.log2(target_latency / elapsed))
+    rounds = max(min_rounds, min(max_rounds, rounds))
+
+    while rounds > min_rounds and measure(rounds) > target_latency:
+        rounds -= 1
+
+    log.info("Calibrated bcrypt to %d rounds for a %.0f ms target.", rounds, target_latency * 1000)
+    return rounds
+
+
+class AsyncPasswordEncoder(abc.ABC):
+    """
+    Abstract Password Encoder which can be awaited from the event loop.
+    """
+
+    @abc.abstractmethod
+    async def encode(self, password: str) -> str:
+        """
+        Encodes a password.
+
+        Args:
+            password (str): The password to encode.
+
+        Returns:
+            str: The encoded password.
+
+        Raises:
+            EncoderOverloadedException: If the encoder cannot accept more work.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def encode_many(self, passwords: list[str]) -> list[str]:
+        """
+        Encodes several passwords, in parallel where possible.
+
+        Args:
+            passwords (list[str]): The passwords to encode.
+
+        Returns:
+            list[str]: The encoded passwords, in the same order.
+
+        Raises:
+            EncoderOverloadedException: If the encoder cannot accept more work.
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    async def verify(self, password: str, encoded_password: str) -> str | None:
+        """
+        Verifies a password.
+
+        Args:
+            password (str): The password to verify.
+            encoded_password (str): The encoded password to compare with.
+
+        Returns:
+            str | None: A new encoding of the password if the given one uses outdated settings, otherwise None.
+
+        Raises:
+            InvalidPasswordException: If the password is invalid.
+            EncoderOverloadedException: If the encoder cannot accept more work.
+        """
+        raise NotImplementedError
+
+
+@dataclass(frozen=True)
+class EncoderStats:
+    """
+    Snapshot of a pooled encoder activity.
+
+    Attributes:
+        queue_depth (int): Executor calls submitted and not finished yet.
+        max_queue_size (int): Executor calls allowed to be pending at once.
+        completed (int): Calls finished, successfully or not.
+        rejected (int): Calls refused because the queue was full.
+        mean_latency (float): Mean seconds from submission to completion.
+        max_latency (float): Slowest call, in seconds, from submission to completion.
+    """
+    queue_depth: int
+    max_queue_size: int
+    completed: int
+    rejected: int
+    mean_latency: float
+    max_latency: float
+
+
+def _encode_all(encoder: PasswordEncoder, passwords: list[str]) -> list[str]:
+    return [encoder.encode(password) for password in passwords]
+
+
+class PooledPasswordEncoder(AsyncPasswordEncoder):
+    """
+    Runs a password encoder in an executor, usually a process pool, behind a bounded queue.
+
+    Hashing is CPU bound and holds the GIL, so it is sent to other processes to keep the event loop responsive. Once
+    `max_queue_size` calls are pending in the executor new calls are rejected right away instead of piling up latency.
+
+    Attributes:
+        encoder (PasswordEncoder): The encoder doing the work. It is pickled into the executor workers.
+        executor (Executor | None): Where the encoder runs. None runs it inline, meant for cheap encoders.
+        max_queue_size (int): Executor calls allowed to be pending at once, a batch taking one per chunk.
+        retry_after (int): Seconds suggested to rejected callers.
+        parallelism (int): Calls the executor runs at once, used to split batches.
+        latency (Histogram | None): Where the latency of each call is observed, by operation, if any.
+    """
+
+    def __init__(self,
+                 encoder: PasswordEncoder,
+                 executor: Executor | None = None,
+                 max_queue_size: int = 64,
+                 retry_after: int = 1,
+                 parallelism: int = 1,
+                 latency: Histogram | None = None):
+        self.encoder = encoder
+        self.executor = executor
+        self.max_queue_size = max_queue_size
+        self.retry_after = retry_after
+        self.parallelism = parallelism
+        self.latency = latency
+        self._queue_depth = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_latency = 0.0
+        self._max_latency = 0.0
+
+    @property
+    def stats(self) -> EncoderStats:
+        """
+        Returns a snapshot of the encoder activity.
+        """
+        return EncoderStats(queue_depth=self._queue_depth,
+                            max_queue_size=self.max_queue_size,
+                            completed=self._completed,
+                            rejected=self._rejected,
+                            mean_latency=self._total_latency / self._completed if self._completed else 0.0,
+                            max_latency=self._max_latency)
+
+    def _reserve(self, slots: int) -> None:
+        if self._queue_depth + slots > self.max_queue_size:
+            self._rejected += 1
+            raise EncoderOverloadedException("Too many passwords waiting to be encoded.", self.retry_after)
+
+        self._queue_depth += slots
+
+    async def _run(self, operation: str, func: Callable, *args):
+        # The caller must have reserved the queue slot of this call.
+        start = time.perf_counter()
+
+        try:
+            if self.executor is None:
+                return func(*args)
+
+            return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            latency = time.perf_counter() - start
+            self._queue_depth -= 1
+            self._completed += 1
+            self._total_latency += latency
+            self._max_latency = max(self._max_latency, latency)
+
+            if self.latency is not None:
+                self.latency.observe(latency, operation)
+
+    async def _submit(self, operation: str, func: Callable, *args):
+        self._reserve(1)
+        return await self._run(operation, func, *args)
+
+    async def encode(self, password: str) -> str:
+        """
+        Encodes a password.
+
+        Args:
+            password (str): The password to encode.
+
+        Returns:
+            str: The encoded password.
+
+        Raises:
+            EncoderOverloadedException: If the queue is full.
+        """
+        return await self._submit("encode", self.encoder.encode, password)
+
+    async def encode_many(self, passwords: list[str]) -> list[str]:
+        """
+        Encodes several passwords, split in one chunk per executor worker.
+
+        Every chunk takes a queue slot, as a single encoding does, so a batch is admitted against the executor calls it
+        makes rather than its size: a batch larger than the queue is accepted as long as the workers have room, and
+        holds at most one slot per worker while it is encoded.
+
+        Args:
+            passwords (list[str]): The passwords to encode.
+
+        Returns:
+            list[str]: The encoded passwords, in the same order.
+
+        Raises:
+            EncoderOverloadedException: If the queue cannot take every chunk.
+        """
+        if not passwords:
+            return []
+
+        size = -(-len(passwords) // self.parallelism)
+        chunks = [passwords[i:i + size] for i in range(0, len(passwords), size)]
+        self._reserve(len(chunks))
+
+        encoded = await asyncio.gather(*(self._run("encode_many", _encode_all, self.encoder, chunk)
+                                         for chunk in chunks))
+        return [password for chunk in encoded for password in chunk]
+
+    async def verify(self, password: str, encoded_password: str) -> str | None:
+        """
+        Verifies a password.
+
+        Args:
+            password (str): The password to verify.
+            encoded_password (str): The encoded password to compare with.
+
+        Returns:
+            str | None: A new encoding of the password if the given one uses outdated settings, otherwise None.
+
+        Raises:
+            InvalidPasswordException: If the password is invalid.
+            EncoderOverloadedException: If the queue is full.
+        """
+        return await self._submit("verify", self.encoder.verify, password, encoded_password)
@@ -1,25 +1,49 @@
 """
 Register Service
 """
-from pymeet.adapters.repository import UserRepository
+from dataclasses import dataclass
+from typing import Sequence
+
+from pymeet.adapters.repository import AsyncUserRepository, DuplicateEntityError, normalize_email
 from pymeet.domain.models import User
-from pymeet.services.password_encoder import PasswordEncoder
+from pymeet.services.password_encoder import AsyncPasswordEncoder
+
+SAVE_ATTEMPTS = 3
 
 
 class IllegalUserException(Exception):
     pass
 
 
+@dataclass
+class Registration:
+    """
+    Outcome of registering one user of a batch.
+
+    Attributes:
+        username (str): The requested username.
+        email (str): The requested email.
+        password (str): The plain password, emptied once the batch is processed.
+        user (User | None): The registered user, None if it was rejected.
+        error (str | None): Why the user was rejected, None if it was registered.
+    """
+    username: str
+    email: str
+    password: str = ""
+    user: User | None = None
+    error: str | None = None
+
+
 class RegisterService:
     """
     Registration Service
     """
 
-    def __init__(self, user_repository: UserRepository, password_encoder: PasswordEncoder):
+    def __init__(self, user_repository: AsyncUserRepository, password_encoder: AsyncPasswordEncoder):
         self.user_repository = user_repository
         self.password_encoder = password_encoder
 
-    def _verify_username(self, username: str):
+    async def _verify_username(self, username: str):
         """
         Verifies if the username is available.
 
@@ -29,11 +53,11 @@ class RegisterService:
         Raises:
             UserAlreadyExistsException: If the username is already in use.
         """
-        user = self.user_repository.find_by(username=username)
+        user = await self.user_repository.find_by_username(username)
         if user:
             raise IllegalUserException(f"Username {username} already in use.")
 
-    def _verify_email(self, email: str):
+    async def _verify_email(self, email: str):
         """
         Verifies if the email is available.
 
@@ -43,11 +67,11 @@ class RegisterService:
         Raises:
             UserAlreadyExistsException: If the email is already in use.
         """
-        user = self.user_repository.find_by(email=email)
+        user = await self.user_repository.find_by_email(email)
         if user:
             raise IllegalUserException(f"Email {email} already in use.")
 
-    def register(self, username, email, password):
+    async def register(self, username, email, password):
         """
         Registers a new user.
 
@@ -61,14 +85,105 @@ class RegisterService:
 
         Raises:
             UserAlreadyExistsException: If the username or email is already in use.
+            EncoderOverloadedException: If the password encoder cannot accept more work.
         """
 
-        self._verify_username(username)
-        self._verify_email(email)
+        await self._verify_username(username)
+        await self._verify_email(email)
 
-        hashed_password = self.password_encoder.encode(password)
+        hashed_password = await self.password_encoder.encode(password)
 
         user = User(username=username, email=email, password=hashed_password)
 
-        self.user_repository.save(user)
+        try:
+            await self.user_repository.save(user)
+        except DuplicateEntityError as e:
+            raise IllegalUserException(f"Username {username} or email {email} already in use.") from e
+
         return user
+
+    async def _reject_taken(self, registrations: list[Registration]) -> list[Registration]:
+        """
+        Rejects the registrations whose username or email is already in use, with a single repository lookup.
+
+        Returns:
+            list[Registration]: The registrations still accepted.
+        """
+        usernames, emails = await self.user_repository.find_taken([r.username for r in registrations],
+                                                                  [r.email for r in registrations])
+        accepted = []
+
+        for registration in registrations:
+            if registration.username in usernames:
+                registration.error = f"Username {registration.username} already in use."
+            elif normalize_email(registration.email) in emails:
+                registration.error = f"Email {registration.email} already in use."
+            else:
+                accepted.append(registration)
+
+        return accepted
+
+    async def register_many(self, users: Sequence[tuple[str, str, str]]) -> list[Registration]:
+        """
+        Registers several users at once.
+
+        Uniqueness is checked for the whole batch with one lookup, including duplicates within the batch itself,
+        passwords are hashed in parallel and the accepted users are saved in a single transaction. Users registered by
+        someone else meanwhile are rejected and the rest saved again, up to SAVE_ATTEMPTS times.
+
+        Args:
+            users (Sequence[tuple[str, str, str]]): The username, email and password of each user.
+
+        Returns:
+            list[Registration]: The outcome of each user, in the same order.
+
+        Raises:
+            EncoderOverloadedException: If the password encoder cannot accept the batch.
+        """
+        registrations = [Registration(username=username, email=email, password=password)
+                         for username, email, password in users]
+        seen_usernames, seen_emails, candidates = set(), set(), []
+
+        for registration in registrations:
+            email = normalize_email(registration.email)
+
+            if registration.username in seen_usernames:
+                registration.error = f"Username {registration.username} repeated in the batch."
+            elif email in seen_emails:
+                registration.error = f"Email {registration.email} repeated in the batch."
+            else:
+                candidates.append(registration)
+
+            seen_usernames.add(registration.username)
+            seen_emails.add(email)
+
+        accepted = await self._reject_taken(candidates)
+        hashed_passwords = await self.password_encoder.encode_many([r.password for r in accepted])
+
+        for registration, hashed_password in zip(accepted, hashed_passwords):
+            registration.user = User(username=registration.username,
+                                     email=registration.email,
+                                     password=hashed_password)
+
+        pending = accepted
+
+        for _ in range(SAVE_ATTEMPTS):
+            try:
+                await self.user_repository.save_all([r.user for r in pending if r.user is not None])
+                break
+            except DuplicateEntityError:
+                # Someone registered one of these users meanwhile, check again and save whatever is still free.
+                pending = await self._reject_taken(pending)
+        else:
+            for registration in pending:
+                registration.error = (f"Username {registration.username} or email {registration.email} was taken "
+                                      f"while registering, try again.")
+
+        for registration in accepted:
+            if registration.error:
+                registration.user = None
+
+        for registration in registrations:
+            registration.password = ""
+
+        return registrations
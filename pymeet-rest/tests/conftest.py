@@ -1,15 +1,22 @@
 """
 Pytest Fixtures
 """
+import os
 import typing
 
 import pytest
 from starlette.testclient import TestClient
 
+from src.pymeet import main
 from src.pymeet.adapters.repository import UserRepository
-from src.pymeet.main import app
 from tests.mocks import FakeUserRepository
 
+# The application lifespan reads its settings from the environment, before any test overrides a dependency: users are
+# kept in memory, so no database file is left behind, and bcrypt uses a fixed low cost, so no calibration runs.
+os.environ.setdefault("FASTAPI_USE_SQLITE", "false")
+os.environ.setdefault("FASTAPI_BCRYPT_ROUNDS", "5")
+os.environ.setdefault("FASTAPI_HASHING_WORKERS", "1")
+
 
 class DependencyOverrider:
     """
@@ -20,7 +27,7 @@ class DependencyOverrider:
             self, overrides: typing.Mapping[typing.Callable, typing.Callable]
     ) -> None:
         self.overrides = overrides
-        self._app = app
+        self._app = main.app
         self._old_overrides = {}
 
     def __enter__(self):
@@ -44,12 +51,15 @@ class DependencyOverrider:
 @pytest.fixture(name="test_client")
 def fixture_test_client() -> TestClient:
     """
-    Create a test client for the FastAPI application.
+    Create a test client for the FastAPI application, running its lifespan handlers.
+
+    The application is built on first use, so sessions which never request it, such as the unit tests, skip it.
 
     Returns:
         TestClient: A test client for the app.
     """
-    return TestClient(app)
+    with TestClient(main.app) as client:
+        yield client
 
 
 @pytest.fixture(name="user_repository")
@@ -61,3 +71,14 @@ def fixture_user_repository() -> FakeUserRepository:
         UserRepository: A user repository.
     """
     return FakeUserRepository()
+
+
+@pytest.fixture(name="anyio_backend")
+def fixture_anyio_backend() -> str:
+    """
+    Run asynchronous tests on asyncio only, as the application does.
+
+    Returns:
+        str: The anyio backend name.
+    """
+    return "asyncio"
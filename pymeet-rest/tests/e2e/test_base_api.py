@@ -0,0 +1,81 @@
+"""
+Test for base endpoints.
+"""
+from starlette.status import HTTP_200_OK, HTTP_404_NOT_FOUND, HTTP_503_SERVICE_UNAVAILABLE
+
+
+class TestMetricsAPI:
+    """
+    Test for the metrics endpoint.
+    """
+
+    def test_exposes_request_latency_by_route(self, test_client):
+        """
+        Test requests are observed by route template and status, next to the pool and store gauges.
+        """
+        # given
+        assert test_client.get("/api/v1/events/missing").status_code == HTTP_404_NOT_FOUND
+        assert test_client.get("/not/a/route").status_code == HTTP_404_NOT_FOUND
+
+        # when
+        response = test_client.get("/metrics")
+
+        # then
+        assert response.status_code == HTTP_200_OK
+        assert response.headers["content-type"] == "text/plain; version=0.0.4; charset=utf-8"
+        lines = response.text.splitlines()
+        assert any(line.startswith('pymeet_http_request_duration_seconds_count{route="/api/v1/events/{event_id}",'
+                                   'method="GET",status="404"}') for line in lines)
+        assert any(line.startswith('pymeet_http_request_duration_seconds_count{route="other",method="GET",'
+                                   'status="404"}') for line in lines)
+        assert any(line.startswith('pymeet_repository_operation_seconds_count{repository="events",method="find_by_id"}')
+                   for line in lines)
+        assert 'pymeet_threadpool_threads{state="waiting"} 0' in lines
+        assert "pymeet_password_encoder_queue_depth 0" in lines
+        assert any(line.startswith('pymeet_store_size{store="events"}') for line in lines)
+
+
+class TestHealthAPI:
+    """
+    Test for the liveness and readiness endpoints.
+    """
+
+    def test_is_alive(self, test_client):
+        """
+        Test the liveness endpoint answers while the worker runs.
+        """
+        # when
+        response = test_client.get("/healthz")
+
+        # then
+        assert response.status_code == HTTP_200_OK
+        assert response.json() == {"status": "ok"}
+
+    def test_is_ready_while_idle(self, test_client):
+        """
+        Test the readiness endpoint reports every pool while none is saturated.
+        """
+        # when
+        response = test_client.get("/readyz")
+
+        # then
+        assert response.status_code == HTTP_200_OK
+        assert response.json()["status"] == "ready"
+        assert set(response.json()["pools"]) == {"hashing", "threadpool", "database"}
+
+    def test_is_not_ready_once_hashing_saturates(self, test_client):
+        """
+        Test the readiness endpoint answers 503 once the hashing queue reaches its threshold.
+        """
+        # given
+        encoder = test_client.app.state.password_encoder
+        encoder.max_queue_size, max_queue_size = 0, encoder.max_queue_size
+
+        # when
+        response = test_client.get("/readyz")
+        encoder.max_queue_size = max_queue_size
+
+        # then
+        assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+        assert response.json()["status"] == "saturated"
+        assert response.json()["pools"]["hashing"] == {"used": 0, "capacity": 0, "saturated": True}
@@ -0,0 +1,224 @@
+"""
+Test for Meeting Event resource API endpoints.
+"""
+import json
+
+import pytest
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_404_NOT_FOUND,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+)
+
+from pymeet.adapters.repository import InMemoryMeetingEventRepository
+from pymeet.services.dependencies import get_event_repository, get_token_service, get_user_repository
+from pymeet.services.tokens import TokenService
+from tests.conftest import DependencyOverrider
+
+prefix = "api/v1"
+events_endpoint = "events"
+
+token_service = TokenService(secret_key="test-secret", ttl=60)
+
+
+def _auth(username: str) -> dict[str, str]:
+    token, _ = token_service.issue(username)
+    return {"Authorization": f"Bearer {token}"}
+
+
+@pytest.fixture(name="event_overrides")
+def fixture_event_overrides(user_repository) -> dict:
+    """
+    Overrides the repositories and the token service, with alice and bob registered.
+    """
+    user_repository.add(username="alice", email="alice@mail.com", password="pw")
+    user_repository.add(username="bob", email="bob@mail.com", password="pw")
+
+    event_repository = InMemoryMeetingEventRepository()
+
+    return {get_user_repository: lambda: user_repository,
+            get_event_repository: lambda: event_repository,
+            get_token_service: lambda: token_service}
+
+
+class TestMeetingEventAPI:
+    """
+    Test for Meeting Event resource API endpoints.
+    """
+
+    event_form = {"name": "Planning",
+                  "options": [{"date": "2023-05-01", "hour": 10}, {"date": "2023-05-02", "hour": 15}],
+                  "attendees": ["bob"]}
+
+    def test_creating_an_event_requires_a_session(self, test_client, event_overrides):
+        """
+        Test for creating an event without a bearer token.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # when
+            response = test_client.post(f"/{prefix}/{events_endpoint}", json=self.event_form)
+
+            # then
+            assert response.status_code == HTTP_401_UNAUTHORIZED
+
+    def test_can_vote_and_close_an_event(self, test_client, event_overrides):
+        """
+        Test for the organizer creating an event, attendees voting and the organizer closing it.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # given
+            created = test_client.post(f"/{prefix}/{events_endpoint}", json=self.event_form, headers=_auth("alice"))
+            event_id = created.json()["data"]["id"]
+
+            # when
+            vote = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/votes",
+                                    json={"date": "2023-05-02", "hour": 15},
+                                    headers=_auth("bob"))
+            repeated = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/votes",
+                                        json={"date": "2023-05-02", "hour": 15},
+                                        headers=_auth("bob"))
+            forbidden = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/close", headers=_auth("bob"))
+            closed = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/close", headers=_auth("alice"))
+            late_vote = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/votes",
+                                         json={"date": "2023-05-01", "hour": 10},
+                                         headers=_auth("alice"))
+
+            # then
+            assert created.status_code == HTTP_201_CREATED
+            assert created.json()["data"]["organizer"] == "alice"
+            assert created.json()["data"]["attendees"] == ["alice", "bob"]
+            assert vote.status_code == HTTP_200_OK
+            assert [option["votes"] for option in vote.json()["data"]["options"]] == [0, 1]
+            assert vote.json()["data"]["leader"] == {"date": "2023-05-02", "hour": 15}
+            assert repeated.status_code == HTTP_409_CONFLICT
+            assert forbidden.status_code == HTTP_409_CONFLICT
+            assert closed.status_code == HTTP_200_OK
+            assert closed.json()["data"]["votedDate"] == "2023-05-02T15:00:00"
+            assert late_vote.status_code == HTTP_409_CONFLICT
+
+    def test_can_find_events_by_attendee_and_voted_date(self, test_client, event_overrides):
+        """
+        Test for listing events by attendee and by voted date range.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # given
+            solo = test_client.post(f"/{prefix}/{events_endpoint}",
+                                    json={**self.event_form, "attendees": []},
+                                    headers=_auth("alice")).json()["data"]["id"]
+            shared = test_client.post(f"/{prefix}/{events_endpoint}",
+                                      json=self.event_form,
+                                      headers=_auth("alice")).json()["data"]["id"]
+            test_client.post(f"/{prefix}/{events_endpoint}/{shared}/close", headers=_auth("alice"))
+
+            # when
+            by_bob = test_client.get(f"/{prefix}/{events_endpoint}", params={"attendee": "bob"})
+            by_alice = test_client.get(f"/{prefix}/{events_endpoint}", params={"attendee": "alice"})
+            in_may = test_client.get(f"/{prefix}/{events_endpoint}",
+                                     params={"start": "2023-05-01T00:00:00", "end": "2023-06-01T00:00:00"})
+            in_may_by_bob = test_client.get(f"/{prefix}/{events_endpoint}",
+                                            params={"attendee": "bob",
+                                                    "start": "2023-05-01T00:00:00Z",
+                                                    "end": "2023-06-01T02:00:00+02:00",
+                                                    "limit": 1})
+            first_page = test_client.get(f"/{prefix}/{events_endpoint}", params={"attendee": "alice", "limit": 1})
+            missing = test_client.get(f"/{prefix}/{events_endpoint}/unknown")
+
+            # then
+            assert [event["id"] for event in by_bob.json()["data"]] == [shared]
+            assert {event["id"] for event in by_alice.json()["data"]} == {solo, shared}
+            assert [event["id"] for event in in_may.json()["data"]] == [shared]
+            assert [event["id"] for event in in_may_by_bob.json()["data"]] == [shared]
+            assert len(first_page.json()["data"]) == 1
+            assert missing.status_code == HTTP_404_NOT_FOUND
+
+    def test_can_add_suggested_options_from_availability(self, test_client, event_overrides):
+        """
+        Test for attendees submitting availability and the organizer adding the suggested options.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # given
+            event_id = test_client.post(f"/{prefix}/{events_endpoint}",
+                                        json=self.event_form,
+                                        headers=_auth("alice")).json()["data"]["id"]
+            test_client.put(f"/{prefix}/{events_endpoint}/{event_id}/availability",
+                            json={"windows": [{"start": "2023-06-01T09:00:00", "end": "2023-06-01T12:00:00"}]},
+                            headers=_auth("alice"))
+            test_client.put(f"/{prefix}/{events_endpoint}/{event_id}/availability",
+                            json={"windows": [{"start": "2023-06-01T12:00:00+02:00",
+                                               "end": "2023-06-01T13:30:00+02:00"}]},
+                            headers=_auth("bob"))
+
+            # when
+            suggestions = test_client.get(f"/{prefix}/{events_endpoint}/{event_id}/suggestions", params={"limit": 2})
+            from_aware_start = test_client.get(f"/{prefix}/{events_endpoint}/{event_id}/suggestions",
+                                               params={"start": "2023-06-01T12:00:00+02:00", "limit": 2})
+            added = test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/options",
+                                     json={"options": suggestions.json()["data"]},
+                                     headers=_auth("alice"))
+            inverted = test_client.put(f"/{prefix}/{events_endpoint}/{event_id}/availability",
+                                       json={"windows": [{"start": "2023-06-01T12:00:00",
+                                                          "end": "2023-06-01T09:00:00"}]},
+                                       headers=_auth("bob"))
+
+            # then
+            assert suggestions.status_code == HTTP_200_OK
+            assert suggestions.json()["data"] == [{"date": "2023-06-01", "hour": 10, "attendees": 2},
+                                                  {"date": "2023-06-01", "hour": 9, "attendees": 1}]
+            assert from_aware_start.json()["data"] == [{"date": "2023-06-01", "hour": 10, "attendees": 2},
+                                                       {"date": "2023-06-01", "hour": 11, "attendees": 1}]
+            assert added.status_code == HTTP_200_OK
+            assert len(added.json()["data"]["options"]) == 4
+            assert inverted.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_close_reports_attendees_with_overlapping_events(self, test_client, event_overrides):
+        """
+        Test for closing an event which overlaps another event of an attendee.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # given
+            first = test_client.post(f"/{prefix}/{events_endpoint}",
+                                     json={**self.event_form, "duration": 120},
+                                     headers=_auth("alice")).json()["data"]["id"]
+            second = test_client.post(f"/{prefix}/{events_endpoint}",
+                                      json={"name": "Review", "options": [{"date": "2023-05-01", "hour": 11}]},
+                                      headers=_auth("bob")).json()["data"]["id"]
+            test_client.post(f"/{prefix}/{events_endpoint}/{first}/close", headers=_auth("alice"))
+
+            # when
+            closed = test_client.post(f"/{prefix}/{events_endpoint}/{second}/close", headers=_auth("bob"))
+            bob_conflicts = test_client.get(f"/{prefix}/users/bob/conflicts")
+            alice_conflicts = test_client.get(f"/{prefix}/users/alice/conflicts")
+
+            # then
+            assert closed.json()["conflicts"] == [{"username": "bob", "events": [first]}]
+            assert bob_conflicts.status_code == HTTP_200_OK
+            assert bob_conflicts.json()["data"] == [
+                {"id": first, "name": "Planning", "start": "2023-05-01T10:00:00", "end": "2023-05-01T12:00:00",
+                 "conflictsWith": [second]},
+                {"id": second, "name": "Review", "start": "2023-05-01T11:00:00", "end": "2023-05-01T12:00:00",
+                 "conflictsWith": [first]},
+            ]
+            assert alice_conflicts.json()["data"] == []
+
+    def test_updates_of_a_closed_event_end_after_its_state(self, test_client, event_overrides):
+        """
+        Test for streaming the updates of an event whose voting is closed.
+        """
+        with DependencyOverrider(overrides=event_overrides):
+            # given
+            event_id = test_client.post(f"/{prefix}/{events_endpoint}",
+                                        json=self.event_form,
+                                        headers=_auth("alice")).json()["data"]["id"]
+            test_client.post(f"/{prefix}/{events_endpoint}/{event_id}/close", headers=_auth("alice"))
+
+            # when
+            response = test_client.get(f"/{prefix}/{events_endpoint}/{event_id}/updates")
+
+            # then
+            assert response.status_code == HTTP_200_OK
+            assert response.headers["content-type"].startswith("text/event-stream")
+            assert response.text.count("data: ") == 1
+            assert json.loads(response.text.removeprefix("data: "))["openVoting"] is False
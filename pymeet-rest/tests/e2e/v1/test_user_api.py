@@ -1,9 +1,20 @@
 """
 Test for User resource API endpoints.
 """
-from starlette.status import HTTP_200_OK, HTTP_201_CREATED, HTTP_409_CONFLICT, HTTP_422_UNPROCESSABLE_ENTITY
+import json
 
-from pymeet.services.dependencies import get_user_repository
+from starlette.status import (
+    HTTP_200_OK,
+    HTTP_201_CREATED,
+    HTTP_207_MULTI_STATUS,
+    HTTP_409_CONFLICT,
+    HTTP_422_UNPROCESSABLE_ENTITY,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
+
+from pymeet.app.config.settings import Application
+from pymeet.services.dependencies import get_password_encoder, get_user_repository
+from pymeet.services.password_encoder import BcryptPasswordEncoder, PooledPasswordEncoder
 from tests.conftest import DependencyOverrider
 
 prefix = "api/v1"
@@ -155,3 +166,111 @@ class TestUserAPI:
 
             # then
             assert response.status_code == HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_cannot_register_user_when_hashing_is_saturated(self, test_client, user_repository):
+        """
+        Test for registering a user while the password hashing queue is full must return service unavailable.
+        """
+        # given
+        saturated_encoder = PooledPasswordEncoder(BcryptPasswordEncoder(), max_queue_size=0, retry_after=3)
+        override = {get_user_repository: lambda: user_repository, get_password_encoder: lambda: saturated_encoder}
+        username, email, password = "user1", "a_valid@email.com", "password1"
+
+        request_body = {
+            "username": username,
+            "email": email,
+            "password1": password,
+            "password2": password
+        }
+
+        with DependencyOverrider(overrides=override):
+            # when
+            response = test_client.post(f"/{prefix}/{users_endpoint}", json=request_body)
+
+            # then
+            assert response.status_code == HTTP_503_SERVICE_UNAVAILABLE
+            assert response.headers["Retry-After"] == "3"
+            assert user_repository.find_by_username(username) is None
+
+    def test_get_users_by_pages(self, test_client, user_repository):
+        """
+        Test for walking through users a page at a time.
+        """
+        # given
+        overrides = {get_user_repository: lambda: user_repository}
+        for username in ["user3", "user1", "user2"]:
+            user_repository.add(username=username, password="password1", email=f"{username}@email.com")
+
+        with DependencyOverrider(overrides=overrides):
+            # when
+            first = test_client.get(f"/{prefix}/{users_endpoint}", params={"limit": 2}).json()
+            second = test_client.get(f"/{prefix}/{users_endpoint}", params={"limit": 2, "after": first["next"]}).json()
+
+            # then
+            assert [user["username"] for user in first["data"]] == ["user1", "user2"]
+            assert first["next"] == "user2"
+            assert [user["username"] for user in second["data"]] == ["user3"]
+            assert "next" not in second
+
+    def test_export_users_as_ndjson(self, test_client, user_repository):
+        """
+        Test for exporting every user as newline-delimited JSON.
+        """
+        # given
+        overrides = {get_user_repository: lambda: user_repository}
+        for username in ["user2", "user1"]:
+            user_repository.add(username=username, password="password1", email=f"{username}@email.com")
+
+        with DependencyOverrider(overrides=overrides):
+            # when
+            response = test_client.get(f"/{prefix}/{users_endpoint}:export")
+
+            # then
+            assert response.status_code == HTTP_200_OK
+            assert response.headers["content-type"] == "application/x-ndjson"
+            assert [json.loads(line) for line in response.text.splitlines()] == [
+                {"username": "user1", "email": "user1@email.com"},
+                {"username": "user2", "email": "user2@email.com"},
+            ]
+
+    def test_register_users_in_batch(self, test_client, user_repository):
+        """
+        Test for registering several users at once reports the outcome of each one.
+        """
+        # given
+        overrides = {get_user_repository: lambda: user_repository}
+        user_repository.add(username="user1", password="password1", email="user1@email.com")
+        request_body = {"users": [{"username": username, "email": f"{username}@email.com",
+                                   "password1": "password1", "password2": "password1"}
+                                  for username in ["user1", "user2", "user2"]]}
+
+        with DependencyOverrider(overrides=overrides):
+            # when
+            response = test_client.post(f"/{prefix}/{users_endpoint}/batch", json=request_body)
+
+            # then
+            assert response.status_code == HTTP_207_MULTI_STATUS
+            assert [result["status"] for result in response.json()["data"]] == [
+                HTTP_409_CONFLICT, HTTP_201_CREATED, HTTP_409_CONFLICT
+            ]
+            assert user_repository.find_by_username("user2") is not None
+
+    def test_register_a_batch_larger_than_the_hashing_queue(self, test_client, user_repository):
+        """
+        Test for registering more users at once than the default hashing queue holds must register all of them.
+        """
+        # given
+        overrides = {get_user_repository: lambda: user_repository}
+        usernames = [f"user{i}" for i in range(Application().HASHING_QUEUE_SIZE + 1)]
+        request_body = {"users": [{"username": username, "email": f"{username}@email.com",
+                                   "password1": "password1", "password2": "password1"}
+                                  for username in usernames]}
+
+        with DependencyOverrider(overrides=overrides):
+            # when
+            response = test_client.post(f"/{prefix}/{users_endpoint}/batch", json=request_body)
+
+            # then
+            assert response.status_code == HTTP_207_MULTI_STATUS
+            assert [result["status"] for result in response.json()["data"]] == [HTTP_201_CREATED] * len(usernames)
+            assert all(user_repository.find_by_username(username) is not None for username in usernames)
@@ -0,0 +1,236 @@
+"""
+Event Journal Test
+"""
+import asyncio
+import datetime
+import errno
+import os
+import threading
+
+import orjson
+import pytest
+
+from pymeet.adapters.journal import EventJournal
+from pymeet.adapters.repository import (AsyncUserRepositoryAdapter, InMemoryMeetingEventRepository,
+                                        InMemoryUserRepository)
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.services.events import MeetingEventService
+
+DAY = datetime.date(2023, 5, 1)
+USERNAMES = [f"user{i}" for i in range(20)]
+
+
+@pytest.fixture(name="users")
+def fixture_users() -> InMemoryUserRepository:
+    """
+    Create a user repository with a few users.
+    """
+    return InMemoryUserRepository([User(username, f"{username}@mail.com", "password") for username in USERNAMES])
+
+
+def _service(journal: EventJournal, users: InMemoryUserRepository) -> MeetingEventService:
+    repository = InMemoryMeetingEventRepository()
+    journal.open(repository, users.find_by_username)
+    return MeetingEventService(event_repository=repository,
+                               user_repository=AsyncUserRepositoryAdapter(users),
+                               journal=journal)
+
+
+def _replayed(directory, users: InMemoryUserRepository) -> dict[str, MeetingEvent]:
+    repository = InMemoryMeetingEventRepository()
+    EventJournal(directory).open(repository, users.find_by_username)
+    return {event.id: event for event in repository.find_all()}
+
+
+def _state(event: MeetingEvent) -> tuple:
+    return (event.name, event.organizer, event.attendees, event.tallies(), event.current_leader(), event.duration,
+            event.availability, event.voted_date, event.open_voting)
+
+
+async def _vote_everyone(service: MeetingEventService, event: MeetingEvent) -> None:
+    await asyncio.gather(*(service.vote(event_id=event.id, voter=username, date=DAY, hour=9 + i % 3)
+                           for i, username in enumerate(USERNAMES)))
+
+
+@pytest.mark.anyio
+class TestEventJournal:
+    """
+    Integration test suite for the event journal.
+    """
+
+    async def test_commits_concurrent_changes_together(self, tmp_path, users):
+        """
+        Tests concurrent votes for different events are durable once returned while sharing a few fsyncs.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0.01)
+        service = _service(journal, users)
+        events = await asyncio.gather(*(service.create(name=f"event{i}", organizer="user0",
+                                                       options=[(DAY, 9), (DAY, 10)], attendees=USERNAMES)
+                                        for i in range(len(USERNAMES))))
+        created = journal.commits
+
+        # When
+        await asyncio.gather(*(service.vote(event_id=event.id, voter=username, date=DAY, hour=9)
+                               for event, username in zip(events, USERNAMES)))
+
+        # Then
+        replayed = _replayed(tmp_path, users)
+        assert journal.appended == 2 * len(USERNAMES)
+        assert journal.commits - created <= 5
+        assert all(_state(replayed[event.id]) == _state(service.get(event.id)) for event in events)
+
+        await journal.close()
+
+    async def test_replay_rebuilds_every_change(self, tmp_path, users):
+        """
+        Tests replaying the journal rebuilds events created, voted, revoted, extended, scheduled and closed.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0)
+        service = _service(journal, users)
+        closed = await service.create(name="closed", organizer="user0", options=[(DAY, 9), (DAY, 10), (DAY, 11)],
+                                      attendees=USERNAMES, duration=datetime.timedelta(minutes=30))
+        open_event = await service.create(name="open", organizer="user1", options=[(DAY, 9)], attendees=USERNAMES)
+
+        # When
+        await _vote_everyone(service, closed)
+        await service.vote(event_id=closed.id, voter="user3", date=DAY, hour=11)
+        await service.close(event_id=closed.id, username="user0")
+        await service.add_options(event_id=open_event.id, username="user1", options=[(DAY, 12), (DAY, 9)])
+        await service.vote(event_id=open_event.id, voter="user2", date=DAY, hour=12)
+        await service.set_availability(event_id=open_event.id, username="user2",
+                                       windows=[(datetime.datetime(2023, 5, 1, 9), datetime.datetime(2023, 5, 1, 12))])
+        await journal.close()
+
+        # Then
+        replayed = _replayed(tmp_path, users)
+        assert _state(replayed[closed.id]) == _state(service.get(closed.id))
+        assert _state(replayed[open_event.id]) == _state(service.get(open_event.id))
+
+    async def test_snapshots_bound_the_replay(self, tmp_path, users):
+        """
+        Tests older segments are replaced by a snapshot, which replays with the segments after it to the same events.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0, snapshot_every=10)
+        service = _service(journal, users)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9), (DAY, 10), (DAY, 11)],
+                                     attendees=USERNAMES)
+
+        # When
+        for i, username in enumerate(USERNAMES):
+            await service.vote(event_id=event.id, voter=username, date=DAY, hour=9 + i % 3)
+        await service.vote(event_id=event.id, voter="user0", date=DAY, hour=11)
+        await journal.close()
+
+        # Then
+        assert journal.snapshots == 2
+        assert len(list(tmp_path.glob("snapshot-*.jsonl"))) == 1
+        assert _state(_replayed(tmp_path, users)[event.id]) == _state(service.get(event.id))
+
+    async def test_skips_a_partial_record(self, tmp_path, users):
+        """
+        Tests a record cut short by a crash is skipped on replay.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0)
+        service = _service(journal, users)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9)], attendees=USERNAMES)
+        await service.vote(event_id=event.id, voter="user1", date=DAY, hour=9)
+        await journal.close()
+
+        # When
+        with next(tmp_path.glob("journal-*.jsonl")).open("ab") as segment:
+            segment.write(b'{"op": "vote", "id": "')
+
+        # Then
+        assert _state(_replayed(tmp_path, users)[event.id]) == _state(service.get(event.id))
+
+    async def test_a_failed_commit_changes_nothing(self, tmp_path, users, monkeypatch):
+        """
+        Tests a vote whose commit fails is neither stored nor left in the segment, and later votes are still committed.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0)
+        service = _service(journal, users)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9), (DAY, 10)],
+                                     attendees=USERNAMES)
+        fsync = os.fsync
+        failures = [OSError(errno.EIO, "Input/output error")]
+
+        def failing_fsync(descriptor: int) -> None:
+            if failures:
+                raise failures.pop()
+            fsync(descriptor)
+
+        monkeypatch.setattr(os, "fsync", failing_fsync)
+
+        # When
+        with pytest.raises(OSError):
+            await service.vote(event_id=event.id, voter="user1", date=DAY, hour=9)
+        await service.vote(event_id=event.id, voter="user2", date=DAY, hour=10)
+        await journal.close()
+
+        # Then
+        stored = service.get(event.id)
+        assert stored.tallies() == {MeetingEventOption(date=DAY, hour=9): 0, MeetingEventOption(date=DAY, hour=10): 1}
+        assert stored.version == 1
+        assert _state(_replayed(tmp_path, users)[event.id]) == _state(stored)
+
+    async def test_skips_records_which_cannot_be_applied(self, tmp_path, users):
+        """
+        Tests records for unknown options, events or operations are skipped on replay, and the others applied.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0)
+        service = _service(journal, users)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9)], attendees=USERNAMES)
+        await journal.close()
+
+        # When
+        with next(tmp_path.glob("journal-*.jsonl")).open("ab") as segment:
+            for record in ({"op": "vote", "id": event.id, "voter": "user1", "option": (DAY, 12), "version": 0},
+                           {"op": "vote", "id": "missing", "voter": "user1", "option": (DAY, 9), "version": 0},
+                           {"op": "rename", "id": event.id, "version": 0},
+                           {"op": "vote", "id": event.id, "voter": "user2", "option": (DAY, 9), "version": 0}):
+                segment.write(orjson.dumps(record) + b"\n")
+
+        replaying = EventJournal(tmp_path)
+        replayed = replaying.replay(users.find_by_username)
+
+        # Then
+        assert replaying.skipped == 3
+        assert replayed[0].tallies() == {MeetingEventOption(date=DAY, hour=9): 1}
+        assert replayed[0].version == 1
+
+    async def test_commits_while_a_snapshot_is_written(self, tmp_path, users, monkeypatch):
+        """
+        Tests votes are committed to the new segment while the snapshot of the previous one is still being written.
+        """
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0, snapshot_every=2)
+        service = _service(journal, users)
+        written = threading.Event()
+        write_snapshot = journal._write_snapshot
+
+        def slow_write_snapshot(*args) -> None:
+            written.wait(5)
+            write_snapshot(*args)
+
+        monkeypatch.setattr(journal, "_write_snapshot", slow_write_snapshot)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9), (DAY, 10)],
+                                     attendees=USERNAMES)
+        await service.vote(event_id=event.id, voter="user1", date=DAY, hour=9)
+
+        # When
+        for username in USERNAMES[2:6]:
+            await service.vote(event_id=event.id, voter=username, date=DAY, hour=10)
+        snapshots = journal.snapshots
+        written.set()
+        await journal.close()
+
+        # Then
+        assert snapshots == 0
+        assert journal.snapshots == 1
+        assert _state(_replayed(tmp_path, users)[event.id]) == _state(service.get(event.id))
@@ -0,0 +1,122 @@
+"""
+SQL User Repository Test
+"""
+import pytest
+
+from pymeet.adapters.orm import create_sqlite_engine
+from pymeet.adapters.repository import DuplicateEntityError
+from pymeet.adapters.sql_repository import SqlAlchemyUserRepository
+from pymeet.domain.models import User
+
+
+@pytest.fixture(name="sql_repository")
+def fixture_sql_repository(tmp_path) -> SqlAlchemyUserRepository:
+    """
+    Create a user repository backed by a temporary SQLite database.
+    """
+    engine = create_sqlite_engine(f"sqlite:///{tmp_path / 'pymeet.db'}")
+    yield SqlAlchemyUserRepository(engine)
+    engine.dispose()
+
+
+class TestSqlAlchemyUserRepository:
+    """
+    Integration test suite for the SQL user repository.
+    """
+
+    def test_can_save_and_find_user(self, sql_repository):
+        """
+        Tests a saved user can be found by its username and by its email.
+        """
+        # Given
+        user = User(username="user1", email="User@Mail.com", password="password1")
+
+        # When
+        sql_repository.save(user)
+
+        # Then
+        assert sql_repository.find_by_username("user1") == user
+        assert sql_repository.find_by_email("user@mail.com") == user
+        assert sql_repository.find_by(username="user1", email="USER@mail.com") == user
+        assert sql_repository.find_all() == [user]
+
+    def test_cannot_save_duplicated_username_or_email(self, sql_repository):
+        """
+        Tests the unique indexes reject a repeated username or email.
+        """
+        # Given
+        sql_repository.save(User(username="user1", email="user@mail.com", password="password1"))
+
+        # When / Then
+        with pytest.raises(DuplicateEntityError):
+            sql_repository.save(User(username="user1", email="other@mail.com", password="password1"))
+
+        with pytest.raises(DuplicateEntityError):
+            sql_repository.save(User(username="user2", email="USER@mail.com", password="password1"))
+
+    def test_can_delete_user(self, sql_repository):
+        """
+        Tests a deleted user can no longer be found.
+        """
+        # Given
+        user = User(username="user1", email="user@mail.com", password="password1")
+        sql_repository.save(user)
+
+        # When
+        sql_repository.delete(user)
+
+        # Then
+        assert sql_repository.find_by_username("user1") is None
+
+    def test_can_find_pages_after_a_username(self, sql_repository):
+        """
+        Tests pages are ordered by username and start after the given cursor.
+        """
+        # Given
+        for i in (3, 1, 2):
+            sql_repository.save(User(username=f"user{i}", email=f"user{i}@mail.com", password="password1"))
+
+        # When
+        first = sql_repository.find_page(limit=2)
+        second = sql_repository.find_page(after=first[-1].username, limit=2)
+
+        # Then
+        assert [user.username for user in first] == ["user1", "user2"]
+        assert [user.username for user in second] == ["user3"]
+
+    def test_can_find_taken_usernames_and_emails(self, sql_repository):
+        """
+        Tests the usernames and emails in use are found with a single lookup.
+        """
+        # Given
+        sql_repository.save_all([User(username="user1", email="user1@mail.com", password="password1"),
+                                 User(username="user2", email="user2@mail.com", password="password1")])
+
+        # When
+        usernames, emails = sql_repository.find_taken(["user1", "user3"], ["USER2@mail.com", "user3@mail.com"])
+
+        # Then
+        assert usernames == {"user1"}
+        assert emails == {"user2@mail.com"}
+
+    def test_save_all_is_all_or_nothing(self, sql_repository):
+        """
+        Tests a batch with a duplicated user saves none of its users.
+        """
+        # Given
+        sql_repository.save(User(username="user1", email="user1@mail.com", password="password1"))
+
+        # When
+        with pytest.raises(DuplicateEntityError):
+            sql_repository.save_all([User(username="user2", email="user2@mail.com", password="password1"),
+                                     User(username="user1", email="other@mail.com", password="password1")])
+
+        # Then
+        assert sql_repository.find_by_username("user2") is None
+
+    def test_uses_write_ahead_logging(self, sql_repository):
+        """
+        Tests connections are configured in WAL mode.
+        """
+        with sql_repository.engine.connect() as connection:
+            assert connection.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
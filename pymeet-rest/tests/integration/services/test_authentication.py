@@ -0,0 +1,36 @@
+"""
+Authentication Service Test
+"""
+import pytest
+
+from src.pymeet.adapters.repository import AsyncUserRepositoryAdapter
+from src.pymeet.services.authentication import AuthenticationService
+from src.pymeet.services.password_encoder import BcryptPasswordEncoder, InvalidPasswordException, PooledPasswordEncoder
+from src.pymeet.services.tokens import TokenService
+from tests.mocks import FakeUserRepository
+
+
+@pytest.mark.anyio
+class TestAuthenticationService:
+    """
+    Integration test suite for the authentication service.
+    """
+
+    async def test_unknown_username_costs_a_verification(self):
+        """
+        Test that logging in as an unknown user verifies a password too, so it takes as long as a wrong password.
+        """
+
+        # Given
+        encoder = PooledPasswordEncoder(BcryptPasswordEncoder(rounds=4))
+        service = AuthenticationService(user_repository=AsyncUserRepositoryAdapter(FakeUserRepository()),
+                                        password_encoder=encoder,
+                                        token_service=TokenService(secret_key="secret"))
+
+        # When
+        for _ in range(2):
+            with pytest.raises(InvalidPasswordException):
+                await service.authenticate("nobody", "password1")
+
+        # Then
+        assert encoder.stats.completed == 3
@@ -0,0 +1,170 @@
+"""
+Meeting Event Service Test
+"""
+import asyncio
+import datetime
+
+import orjson
+import pytest
+
+from pymeet.adapters.broker import EventBroker
+from pymeet.adapters.journal import EventJournal
+from pymeet.adapters.repository import AsyncUserRepositoryAdapter, InMemoryMeetingEventRepository
+from pymeet.domain.errors import IllegalVoteError
+from pymeet.domain.schemas import project_event
+from pymeet.domain.models import MeetingEvent, MeetingEventOption
+from pymeet.entrypoints.v1.event import stream_event_updates
+from pymeet.services.events import MeetingEventService
+from pymeet.services.locks import StripedLock
+from tests.mocks import FakeUserRepository
+
+DAY = datetime.date(2023, 5, 1)
+
+
+async def _events_voted_concurrently(service: MeetingEventService, events: int, voters: int) -> list[MeetingEvent]:
+    usernames = [f"user{i}" for i in range(voters)]
+    created = [await service.create(name=f"event{i}", organizer=usernames[0], options=[(DAY, 9), (DAY, 10)],
+                                    attendees=usernames) for i in range(events)]
+
+    await asyncio.gather(*(service.vote(event_id=event.id, voter=username, date=DAY, hour=9 + i % 2)
+                           for event in created for i, username in enumerate(usernames)))
+    return [service.get(event.id) for event in created]
+
+
+def _users(voters: int) -> AsyncUserRepositoryAdapter:
+    users = FakeUserRepository()
+
+    for i in range(voters):
+        users.add(username=f"user{i}", email=f"user{i}@mail.com", password="pw")
+
+    return AsyncUserRepositoryAdapter(users)
+
+
+@pytest.mark.anyio
+class TestMeetingEventService:
+    """
+    Integration test suite for the meeting event service.
+    """
+
+    async def test_pushes_votes_to_subscribers_until_closed(self):
+        """
+        Test that subscribers of an event receive its tallies as it is voted and are released when it closes.
+        """
+
+        # Given
+        users = FakeUserRepository()
+        users.add(username="alice", email="alice@mail.com", password="pw")
+        users.add(username="bob", email="bob@mail.com", password="pw")
+        broker = EventBroker(render=lambda event: orjson.dumps(project_event(event)), window=0.001)
+        service = MeetingEventService(event_repository=InMemoryMeetingEventRepository(),
+                                      user_repository=AsyncUserRepositoryAdapter(users),
+                                      broker=broker)
+        day = datetime.date(2023, 5, 1)
+        event = await service.create(name="Planning", organizer="alice", options=[(day, 10)], attendees=["bob"])
+        subscription = broker.subscribe(event.id)
+
+        # When
+        await service.vote(event_id=event.id, voter="alice", date=day, hour=10)
+        await service.vote(event_id=event.id, voter="bob", date=day, hour=10)
+        update = orjson.loads(await subscription.get())
+        await service.close(event_id=event.id, username="alice")
+        final = orjson.loads(await subscription.get())
+
+        # Then
+        assert update["options"][0]["votes"] == 2
+        assert final["openVoting"] is False
+        assert await subscription.get() is None
+
+    async def test_streams_subscribe_before_reading_the_event(self):
+        """
+        Test that a stream is subscribed once its response is built, so an event closed before the stream is read
+        still ends it with the final state.
+        """
+
+        # Given
+        broker = EventBroker(render=lambda event: orjson.dumps(project_event(event)), window=0.001)
+        service = MeetingEventService(event_repository=InMemoryMeetingEventRepository(), user_repository=_users(2),
+                                      broker=broker)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9)], attendees=["user1"])
+        response = await stream_event_updates(event.id, service, broker)
+
+        # When
+        subscribed = broker.subscribers(event.id)
+        await service.vote(event_id=event.id, voter="user1", date=DAY, hour=9)
+        await service.close(event_id=event.id, username="user0")
+        messages = [orjson.loads(message.removeprefix(b"data: ")) async for message in response.body_iterator]
+
+        # Then
+        assert subscribed == 1
+        assert messages[-1]["openVoting"] is False
+        assert messages[-1]["options"][0]["votes"] == 1
+        assert broker.subscribers(event.id) == 0
+
+    async def test_concurrent_votes_are_never_lost(self):
+        """
+        Test that every vote is counted when many events are voted at once, with users looked up in the threadpool.
+        """
+
+        # Given
+        service = MeetingEventService(event_repository=InMemoryMeetingEventRepository(), user_repository=_users(50))
+
+        # When
+        events = await _events_voted_concurrently(service, events=20, voters=50)
+
+        # Then
+        for event in events:
+            assert event.tally.participation() == 50
+            assert sorted(event.tallies().values()) == [25, 25]
+            assert event.version == 50
+
+    async def test_independent_events_are_changed_concurrently(self, tmp_path):
+        """
+        Test that changes to events on different stripes are committed together, while a single lock waits for each
+        change to be durable before the next one.
+        """
+
+        # Given
+        striped_journal = EventJournal(tmp_path / "striped", commit_window=0.001)
+        striped_journal.open(InMemoryMeetingEventRepository(), lambda username: None)
+        single_journal = EventJournal(tmp_path / "single", commit_window=0.001)
+        single_journal.open(InMemoryMeetingEventRepository(), lambda username: None)
+        striped = MeetingEventService(event_repository=InMemoryMeetingEventRepository(), user_repository=_users(10),
+                                      locks=StripedLock(1024), journal=striped_journal)
+        single = MeetingEventService(event_repository=InMemoryMeetingEventRepository(), user_repository=_users(10),
+                                     locks=StripedLock(1), journal=single_journal)
+
+        # When
+        striped_events = await _events_voted_concurrently(striped, events=8, voters=10)
+        single_events = await _events_voted_concurrently(single, events=8, voters=10)
+        await striped_journal.close()
+        await single_journal.close()
+
+        # Then
+        assert all(event.tally.participation() == 10 for event in striped_events + single_events)
+        assert single_journal.commits == 8 + 8 * 10
+        assert striped_journal.commits <= 8 + 2 * 10
+
+    async def test_rejected_changes_are_neither_journaled_nor_applied(self, tmp_path):
+        """
+        Test that a change rejected by the stored event is not journaled, while an accepted one is applied to the
+        stored event in place once durable.
+        """
+
+        # Given
+        journal = EventJournal(tmp_path, commit_window=0.001)
+        journal.open(InMemoryMeetingEventRepository(), lambda username: None)
+        service = MeetingEventService(event_repository=InMemoryMeetingEventRepository(), user_repository=_users(2),
+                                      journal=journal)
+        event = await service.create(name="event", organizer="user0", options=[(DAY, 9)], attendees=["user1"])
+        appended = journal.appended
+
+        # When
+        with pytest.raises(IllegalVoteError):
+            await service.vote(event_id=event.id, voter="user1", date=DAY, hour=10)
+        voted = await service.vote(event_id=event.id, voter="user1", date=DAY, hour=9)
+        await journal.close()
+
+        # Then
+        assert journal.appended == appended + 1
+        assert voted is event and event.version == 1
+        assert event.tallies() == {MeetingEventOption(date=DAY, hour=9): 1}
@@ -3,17 +3,21 @@ Register Service Test
 """
 import pytest
 
-from src.pymeet.services.password_encoder import BcryptPasswordEncoder
+from pymeet.adapters.repository import DuplicateEntityError
+from pymeet.domain.models import User
+from src.pymeet.adapters.repository import AsyncUserRepositoryAdapter
+from src.pymeet.services.password_encoder import BcryptPasswordEncoder, PlainPasswordEncoder, PooledPasswordEncoder
 from src.pymeet.services.register import RegisterService, IllegalUserException
 from tests.mocks import FakeUserRepository
 
 
+@pytest.mark.anyio
 class TestRegisterService:
     """
     Unit test suite for the register in the service layer
     """
 
-    def test_register_with_encoded_password(self):
+    async def test_register_with_encoded_password(self):
         """
         Test that the register service registers a user with an encoded password
         """
@@ -21,20 +25,20 @@ class TestRegisterService:
         # Given
         encoder = BcryptPasswordEncoder()
         repository = FakeUserRepository()
-        service = RegisterService(password_encoder=encoder,
-                                  user_repository=repository
+        service = RegisterService(password_encoder=PooledPasswordEncoder(encoder),
+                                  user_repository=AsyncUserRepositoryAdapter(repository)
                                   )
         username, email, password = ("user1", "user@mail.com", "password1")
 
         # When
-        registered_user = service.register(username=username, email=email, password=password)
+        registered_user = await service.register(username=username, email=email, password=password)
 
         # Then
         encoder.verify(password, registered_user.password)
 
         assert registered_user in repository.find_all()
 
-    def test_cannot_register_with_existing_username(self):
+    async def test_cannot_register_with_existing_username(self):
         """
         Test that the register service raises an error when an existing username is provided.
         """
@@ -44,17 +48,17 @@ class TestRegisterService:
         repository = FakeUserRepository()
         repository.add(username="user1", password="password1", email="an@email.com")
 
-        service = RegisterService(password_encoder=encoder,
-                                  user_repository=repository
+        service = RegisterService(password_encoder=PooledPasswordEncoder(encoder),
+                                  user_repository=AsyncUserRepositoryAdapter(repository)
                                   )
 
         username, email, password = ("user1", "another@email.com", "password1")
 
         # When / Then
         with pytest.raises(IllegalUserException):
-            service.register(username=username, email=email, password=password)
+            await service.register(username=username, email=email, password=password)
 
-    def test_cannot_register_with_existing_email(self):
+    async def test_cannot_register_with_existing_email(self):
         """
         Test that the register service raises an error when an existing email is provided.
         """
@@ -64,8 +68,54 @@ class TestRegisterService:
         repository = FakeUserRepository()
         username, email, password = ("user2", "user@email.com", "password1")
         repository.add(username="user1", password=password, email=email)
-        service = RegisterService(password_encoder=encoder, user_repository=repository)
+        service = RegisterService(password_encoder=PooledPasswordEncoder(encoder),
+                                  user_repository=AsyncUserRepositoryAdapter(repository))
 
         # When / Then
         with pytest.raises(IllegalUserException):
-            service.register(username=username, email=email, password=password)
+            await service.register(username=username, email=email, password=password)
+
+    async def test_register_many_reports_each_user(self):
+        """
+        Test that a batch registers the free users and reports conflicts with stored users and within the batch.
+        """
+
+        # Given
+        encoder = BcryptPasswordEncoder(rounds=4)
+        repository = FakeUserRepository()
+        repository.add(username="taken", password="password1", email="taken@email.com")
+        service = RegisterService(password_encoder=PooledPasswordEncoder(encoder, parallelism=2),
+                                  user_repository=AsyncUserRepositoryAdapter(repository))
+
+        # When
+        registrations = await service.register_many([("user1", "user1@email.com", "password1"),
+                                                     ("taken", "free@email.com", "password1"),
+                                                     ("user2", "TAKEN@email.com", "password1"),
+                                                     ("user1", "other@email.com", "password1"),
+                                                     ("user3", "USER1@email.com", "password1"),
+                                                     ("user4", "user4@email.com", "password1")])
+
+        # Then
+        assert [r.error is None for r in registrations] == [True, False, False, False, False, True]
+        assert [user.username for user in repository.find_all()] == ["taken", "user1", "user4"]
+        encoder.verify("password1", repository.find_by_username("user4").password)
+
+    async def test_register_many_reports_users_taken_while_saving(self):
+        """
+        Test that a batch whose users keep being taken while it is saved reports them as conflicts instead of failing.
+        """
+
+        # Given
+        class RacingUserRepository(FakeUserRepository):
+            def save_all(self, entities: list[User]) -> None:
+                raise DuplicateEntityError("Some users already exist.")
+
+        service = RegisterService(password_encoder=PooledPasswordEncoder(PlainPasswordEncoder()),
+                                  user_repository=AsyncUserRepositoryAdapter(RacingUserRepository()))
+
+        # When
+        registrations = await service.register_many([("user1", "user1@email.com", "password1"),
+                                                     ("user2", "user2@email.com", "password1")])
+
+        # Then
+        assert all(r.error is not None and r.user is None for r in registrations)
@@ -17,15 +17,33 @@ class FakeUserRepository(UserRepository):
         properties = kwargs.keys()
         return next((x for x in self._users if all(getattr(x, p) == kwargs[p] for p in properties)), None)
 
+    def find_page(self, after: str | None = None, limit: int = 100) -> list[User]:
+        users = sorted((x for x in self._users if after is None or x.username > after), key=lambda x: x.username)
+        return users[:limit]
+
     def save(self, entity: User) -> None:
         self._users.append(entity)
 
+    def find_taken(self, usernames, emails) -> tuple[set[str], set[str]]:
+        usernames, emails = set(usernames), {email.lower() for email in emails}
+        return ({x.username for x in self._users if x.username in usernames},
+                {x.email.lower() for x in self._users if x.email.lower() in emails})
+
+    def save_all(self, entities: list[User]) -> None:
+        self._users.extend(entities)
+
+    def update(self, entity: User) -> None:
+        self._users[self._users.index(entity)] = entity
+
     def delete(self, entity) -> None:
         self._users.remove(entity)
 
     def find_by_username(self, username: str) -> User | None:
         return self.find_by(username=username)
 
+    def find_by_email(self, email: str) -> User | None:
+        return next((x for x in self._users if x.email.lower() == email.lower()), None)
+
     def add(self, username: str, password: str, email: str):
         """
         Adds a user.
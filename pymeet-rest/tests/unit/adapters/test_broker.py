@@ -0,0 +1,86 @@
+"""
+Event Broker Test
+"""
+import asyncio
+
+import pytest
+
+from pymeet.adapters.broker import EventBroker
+
+
+@pytest.mark.anyio
+class TestEventBroker:
+    """
+    Unit test suite for the in-process event broker.
+    """
+
+    async def test_coalesces_publications_within_the_window(self):
+        """
+        Tests many publications within the window are rendered and broadcast once, with the latest state.
+        """
+        # Given
+        rendered = []
+        broker = EventBroker(render=lambda state: rendered.append(state) or str(state).encode(), window=0.01)
+        subscriptions = [broker.subscribe("event") for _ in range(100)]
+
+        # When
+        for state in range(1000):
+            broker.publish("event", state)
+
+        messages = await asyncio.gather(*(subscription.get() for subscription in subscriptions))
+
+        # Then
+        assert rendered == [999]
+        assert set(messages) == {b"999"}
+        assert broker.published == 1000
+        assert broker.broadcasts == 1
+
+    async def test_slow_subscribers_skip_to_the_latest_state(self):
+        """
+        Tests a subscriber which does not read keeps only the latest message, without holding back the others.
+        """
+        # Given
+        broker = EventBroker(render=lambda state: str(state).encode(), window=0.001)
+        slow, fast = broker.subscribe("event"), broker.subscribe("event")
+
+        # When
+        received = []
+        for state in range(3):
+            broker.publish("event", state)
+            received.append(await fast.get())
+
+        # Then
+        assert received == [b"0", b"1", b"2"]
+        assert await slow.get() == b"2"
+
+    async def test_closing_a_topic_sends_the_final_state_and_ends_subscriptions(self):
+        """
+        Tests closing a topic broadcasts at once, drops pending publications and ends every subscription.
+        """
+        # Given
+        broker = EventBroker(render=lambda state: str(state).encode(), window=60)
+        subscription = broker.subscribe("event")
+        broker.publish("event", "pending")
+
+        # When
+        broker.close("event", "final")
+
+        # Then
+        assert [message async for message in subscription] == [b"final"]
+        assert broker.subscribers("event") == 0
+
+    async def test_topics_without_subscribers_are_skipped(self):
+        """
+        Tests publishing to a topic nobody subscribed to does nothing.
+        """
+        # Given
+        broker = EventBroker(render=lambda state: pytest.fail("nothing to render"), window=0.001)
+        subscription = broker.subscribe("event")
+        broker.unsubscribe(subscription)
+
+        # When
+        broker.publish("event", "state")
+        await asyncio.sleep(0.01)
+
+        # Then
+        assert broker.published == 0
@@ -0,0 +1,175 @@
+"""
+In-Memory Meeting Event Repository Test
+"""
+import datetime
+import random
+
+import pytest
+
+from pymeet.adapters.repository import InMemoryMeetingEventRepository, StaleEntityError
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+
+
+def _closed(name: str, start: datetime.datetime, minutes: int, *attendees: User) -> MeetingEvent:
+    event = MeetingEvent(name=name, options=[], attendees=set(attendees), duration=datetime.timedelta(minutes=minutes))
+    event.voted_date = start
+    event.open_voting = False
+    return event
+
+
+def _event(name: str, *attendees: User) -> MeetingEvent:
+    return MeetingEvent(name=name,
+                        options=[MeetingEventOption(date=datetime.date(2023, 5, 1), hour=10)],
+                        attendees=set(attendees))
+
+
+class TestInMemoryMeetingEventRepository:
+    """
+    Unit test suite for the in-memory meeting event repository.
+    """
+
+    def test_can_find_events_by_attendee(self):
+        """
+        Tests events are indexed by each of their attendees, including ones added later.
+        """
+        # Given
+        alice, bob = User("alice", "alice@mail.com", "pw"), User("bob", "bob@mail.com", "pw")
+        first, second = _event("first", alice), _event("second", alice, bob)
+        repository = InMemoryMeetingEventRepository(events=[first, second])
+
+        # When
+        first.add_attendee(bob)
+        repository.update(first)
+
+        # Then
+        assert {event.id for event in repository.find_by_attendee("alice")} == {first.id, second.id}
+        assert {event.id for event in repository.find_by_attendee("bob")} == {first.id, second.id}
+        assert repository.find_by_attendee("carol") == []
+
+    def test_can_find_events_voted_within_a_range(self):
+        """
+        Tests closed events are found by their voted date, ordered, with the end excluded.
+        """
+        # Given
+        alice = User("alice", "alice@mail.com", "pw")
+        events = [_event(f"event{day}", alice) for day in (3, 1, 2)]
+        open_event = _event("open", alice)
+        repository = InMemoryMeetingEventRepository(events=[*events, open_event])
+
+        # When
+        for day, event in zip((3, 1, 2), events):
+            event.voted_date = datetime.datetime(2023, 5, day, 10)
+            event.open_voting = False
+            repository.update(event)
+
+        found = repository.find_by_voted_date(datetime.datetime(2023, 5, 1), datetime.datetime(2023, 5, 3))
+
+        # Then
+        assert [event.name for event in found] == ["event1", "event2"]
+
+    def test_pages_events_by_attendee_and_voted_date(self):
+        """
+        Tests every query is paged, and a range of voted dates of an attendee only reads their own events.
+        """
+        # Given
+        alice, bob = User("alice", "alice@mail.com", "pw"), User("bob", "bob@mail.com", "pw")
+        shared = [_closed(f"shared{day}", datetime.datetime(2023, 5, day, 10), 60, alice, bob) for day in (1, 2, 3, 4)]
+        solo = [_closed(f"solo{day}", datetime.datetime(2023, 5, day, 12), 60, alice) for day in (1, 2, 3)]
+        repository = InMemoryMeetingEventRepository(events=[*shared, *solo])
+        start, end = datetime.datetime(2023, 5, 2), datetime.datetime(2023, 5, 4)
+
+        # When
+        first = repository.find_by_voted_date(start, end, attendee="bob", limit=1)
+        rest = repository.find_by_voted_date(start, end, attendee="bob", after=first[-1].id, limit=10)
+        everyone = repository.find_by_voted_date(start, end, after=solo[1].id, limit=10)
+        attended = repository.find_by_attendee("alice", limit=4)
+        attended += repository.find_by_attendee("alice", after=attended[-1].id, limit=4)
+
+        # Then
+        assert [event.name for event in first + rest] == ["shared2", "shared3"]
+        assert [event.name for event in everyone] == ["shared3", "solo3"]
+        assert [event.id for event in attended] == sorted(event.id for event in shared + solo)
+        assert repository.find_by_voted_date(start, end, attendee="carol") == []
+
+    def test_deleted_event_is_removed_from_every_index(self):
+        """
+        Tests a deleted event can no longer be found.
+        """
+        # Given
+        alice = User("alice", "alice@mail.com", "pw")
+        event = _event("event", alice)
+        event.voted_date = datetime.datetime(2023, 5, 1, 10)
+        repository = InMemoryMeetingEventRepository(events=[event])
+
+        # When
+        repository.delete(event)
+
+        # Then
+        assert repository.find_by_id(event.id) is None
+        assert repository.find_by_attendee("alice") == []
+        assert repository.find_by_voted_date(datetime.datetime.min, datetime.datetime.max) == []
+        assert repository.find_page(after=None, limit=10) == []
+
+    def test_finds_overlapping_events_like_a_scan(self):
+        """
+        Tests the schedule of a user finds the same overlapping events as scanning all of them.
+        """
+        # Given
+        randomness = random.Random(5)
+        alice = User("alice", "alice@mail.com", "pw")
+        origin = datetime.datetime(2023, 5, 1)
+        events = [_closed(f"event{i}", origin + datetime.timedelta(minutes=randomness.randrange(0, 7 * 24 * 60, 15)),
+                          randomness.choice((15, 30, 60, 240)), alice) for i in range(300)]
+        repository = InMemoryMeetingEventRepository(events=events)
+
+        for _ in range(50):
+            # When
+            start = origin + datetime.timedelta(minutes=randomness.randrange(0, 7 * 24 * 60))
+            end = start + datetime.timedelta(minutes=randomness.randrange(1, 300))
+            found = repository.find_overlapping("alice", start, end)
+
+            # Then
+            assert {event.id for event in found} == {event.id for event in events
+                                                     if event.voted_date < end and event.end_date > start}
+
+    def test_records_conflicts_as_events_are_closed_and_removed(self):
+        """
+        Tests conflicts are recorded for the attendees of overlapping events, and dropped with the events.
+        """
+        # Given
+        alice, bob = User("alice", "alice@mail.com", "pw"), User("bob", "bob@mail.com", "pw")
+        morning = _closed("morning", datetime.datetime(2023, 5, 1, 9), 120, alice, bob)
+        brunch = _closed("brunch", datetime.datetime(2023, 5, 1, 10), 60, alice)
+        lunch = _closed("lunch", datetime.datetime(2023, 5, 1, 11), 60, alice, bob)
+        repository = InMemoryMeetingEventRepository(events=[morning, lunch])
+
+        # When
+        repository.save(brunch)
+        conflicts = repository.find_conflicts("alice")
+        repository.delete(brunch)
+
+        # Then
+        assert [(event.name, [other.name for other in others]) for event, others in conflicts] == [
+            ("morning", ["brunch"]),
+            ("brunch", ["morning"]),
+        ]
+        assert repository.find_conflicts("alice") == []
+        assert repository.find_conflicts("bob") == []
+
+    def test_updating_a_stale_event_is_rejected(self):
+        """
+        Tests an event read before another update was stored cannot overwrite it.
+        """
+        # Given
+        event = _event("event")
+        repository = InMemoryMeetingEventRepository(events=[event])
+        stale_copy = MeetingEvent(name="stale", options=[], event_id=event.id, version=event.version)
+
+        # When
+        repository.update(event)
+
+        # Then
+        assert event.version == 1
+
+        with pytest.raises(StaleEntityError):
+            repository.update(stale_copy)
@@ -0,0 +1,90 @@
+"""
+Metrics Test
+"""
+import pytest
+
+from pymeet.adapters.metrics import Histogram, MetricsRegistry, Timed, timed
+from pymeet.adapters.repository import InMemoryUserRepository
+from pymeet.domain.models import User
+
+
+class TestMetricsRegistry:
+    """
+    Unit test suite for the in-process metrics.
+    """
+
+    def test_renders_cumulative_buckets(self):
+        """
+        Tests histograms render cumulative buckets, an infinite bucket, the sum and the count of each label set.
+        """
+        # Given
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",), buckets=(0.1, 1.0))
+
+        # When
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value, "/events")
+
+        # Then
+        assert registry.render().splitlines() == [
+            "# HELP latency_seconds Latency.",
+            "# TYPE latency_seconds histogram",
+            'latency_seconds_bucket{route="/events",le="0.1"} 2',
+            'latency_seconds_bucket{route="/events",le="1.0"} 3',
+            'latency_seconds_bucket{route="/events",le="+Inf"} 4',
+            'latency_seconds_sum{route="/events"} 2.65',
+            'latency_seconds_count{route="/events"} 4',
+        ]
+
+    def test_reads_gauges_when_rendered(self):
+        """
+        Tests gauges report the value of their callbacks at render time, with escaped label values.
+        """
+        # Given
+        registry = MetricsRegistry()
+        queue = []
+        gauge = registry.gauge("queue_depth", "Queue depth.", ("queue",))
+        gauge.set_function(lambda: len(queue), 'say "hi"')
+
+        # When
+        queue.extend(range(3))
+
+        # Then
+        assert 'queue_depth{queue="say \\"hi\\""} 3' in registry.render().splitlines()
+
+    def test_registers_a_name_once(self):
+        """
+        Tests registering a name again returns the same metric, unless its type or labels differ.
+        """
+        # Given
+        registry = MetricsRegistry()
+        histogram = registry.histogram("latency_seconds", "Latency.", ("route",))
+
+        # When
+        again = registry.histogram("latency_seconds", "Latency.", ("route",))
+
+        # Then
+        assert again is histogram
+        with pytest.raises(ValueError):
+            registry.gauge("latency_seconds", "Latency.", ("route",))
+
+
+def test_timed_proxy_observes_each_method():
+    """
+    Tests the timed proxy forwards calls and attributes, observing the latency of each method under its name.
+    """
+    # Given
+    histogram = Histogram("repository_seconds", "Repository latency.", ("repository", "method"))
+    repository = timed(InMemoryUserRepository(), histogram, name="users")
+
+    # When
+    repository.save(User("user1", "user1@mail.com", "password"))
+    found = [repository.find_by_username("user1"), repository.find_by_username("user2")]
+
+    # Then
+    assert found[0].username == "user1" and found[1] is None
+    assert len(repository) == 1
+    assert repository.blocking is False
+    assert histogram.labels("users", "save").count == 1
+    assert histogram.labels("users", "find_by_username").count == 2
+    assert isinstance(repository, Timed)
@@ -0,0 +1,33 @@
+"""
+Stack Sampler Test
+"""
+import time
+
+from pymeet.adapters.profiling import StackSampler
+
+
+def _busy_wait(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_samples_collapsed_stacks(tmp_path):
+    """
+    Tests the stacks of the running thread are sampled, rooted at its name, and written as collapsed stacks.
+    """
+    # Given
+    sampler = StackSampler(interval=0.001)
+
+    # When
+    sampler.start()
+    _busy_wait(0.1)
+    sampler.stop()
+    sampler.write(tmp_path / "profiles" / "busy.collapsed")
+
+    # Then
+    lines = (tmp_path / "profiles" / "busy.collapsed").read_text().splitlines()
+    busy = [line for line in lines if "_busy_wait (test_profiling.py:" in line]
+    assert busy and all(line.startswith("MainThread;") for line in busy)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+    assert "stack-sampler" not in sampler.collapsed()
@@ -0,0 +1,85 @@
+"""
+In-Memory User Repository Test
+"""
+from pymeet.adapters.repository import InMemoryUserRepository
+from pymeet.domain.models import User
+
+
+class TestInMemoryUserRepository:
+    """
+    Unit test suite for the in-memory user repository.
+    """
+
+    def test_can_find_user_by_username(self):
+        """
+        Tests a saved user can be found by its username.
+        """
+        # Given
+        user = User(username="user1", email="user@mail.com", password="password1")
+        repository = InMemoryUserRepository()
+
+        # When
+        repository.save(user)
+
+        # Then
+        assert repository.find_by_username("user1") is user
+        assert repository.find_by(username="user1") is user
+        assert repository.find_by_username("user2") is None
+
+    def test_email_lookup_ignores_case(self):
+        """
+        Tests emails are matched regardless of their case.
+        """
+        # Given
+        user = User(username="user1", email="User@Mail.com", password="password1")
+        repository = InMemoryUserRepository(users=[user])
+
+        # When / Then
+        assert repository.find_by_email("user@mail.COM") is user
+        assert repository.find_by(email="USER@mail.com") is user
+
+    def test_find_by_checks_every_attribute(self):
+        """
+        Tests an indexed lookup still matches the remaining attributes.
+        """
+        # Given
+        user = User(username="user1", email="user@mail.com", password="password1")
+        repository = InMemoryUserRepository(users=[user])
+
+        # When / Then
+        assert repository.find_by(username="user1", email="other@mail.com") is None
+        assert repository.find_by(password="password1") is user
+
+    def test_deleted_user_is_removed_from_every_index(self):
+        """
+        Tests a deleted user can no longer be found.
+        """
+        # Given
+        user = User(username="user1", email="user@mail.com", password="password1")
+        repository = InMemoryUserRepository(users=[user])
+
+        # When
+        repository.delete(user)
+
+        # Then
+        assert repository.find_by_username("user1") is None
+        assert repository.find_by_email("user@mail.com") is None
+        assert len(repository) == 0
+
+    def test_can_find_pages_after_a_username(self):
+        """
+        Tests pages are ordered by username and start after the given cursor.
+        """
+        # Given
+        users = [User(username=f"user{i}", email=f"user{i}@mail.com", password="password1") for i in (3, 1, 2, 4)]
+        repository = InMemoryUserRepository(users=users)
+
+        # When
+        first = repository.find_page(limit=2)
+        second = repository.find_page(after=first[-1].username, limit=2)
+        last = repository.find_page(after="user4", limit=2)
+
+        # Then
+        assert [user.username for user in first] == ["user1", "user2"]
+        assert [user.username for user in second] == ["user3", "user4"]
+        assert last == []
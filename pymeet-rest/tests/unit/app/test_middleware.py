@@ -0,0 +1,104 @@
+"""
+Middleware Test
+"""
+import asyncio
+import time
+
+from fastapi import FastAPI
+from starlette.responses import StreamingResponse
+from starlette.testclient import TestClient
+
+from pymeet.app.middleware import ProfilingMiddleware
+from pymeet.services.tokens import TokenService
+
+
+def _client(directory, **kwargs) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/events/{event_id}")
+    def get_event(event_id: str):
+        deadline = time.perf_counter() + 0.05
+        while time.perf_counter() < deadline:
+            pass
+        return {"id": event_id}
+
+    @app.get("/events/{event_id}/updates")
+    async def get_updates(event_id: str):
+        async def updates():
+            yield b"profiles: "
+            await asyncio.sleep(0.2)
+            yield str(len(list(directory.glob("*.collapsed")))).encode()
+
+        return StreamingResponse(updates())
+
+    app.add_middleware(ProfilingMiddleware, directory=directory, **kwargs)
+    return TestClient(app)
+
+
+class TestProfilingMiddleware:
+    """
+    Unit test suite for the profiling middleware.
+    """
+
+    def test_profiles_requests_with_a_signed_token(self, tmp_path):
+        """
+        Tests only a request carrying a valid profiling token is profiled, named after its route and status.
+        """
+        # Given
+        token_service = TokenService("profiling secret")
+        token, _ = token_service.issue("operator")
+        client = _client(tmp_path, token_service=token_service)
+
+        # When
+        client.get("/events/1")
+        client.get("/events/2", headers={"X-Profile": TokenService("another secret").issue("operator")[0]})
+        response = client.get("/events/3", headers={"X-Profile": token})
+
+        # Then
+        assert response.json() == {"id": "3"}
+        profiles = list(tmp_path.iterdir())
+        assert len(profiles) == 1
+        assert profiles[0].name.endswith("-GET-events_event_id-200.collapsed")
+        assert "get_event (test_middleware.py:" in profiles[0].read_text()
+
+    def test_profiles_a_sample_of_requests(self, tmp_path):
+        """
+        Tests requests are profiled without a token when sampled.
+        """
+        # Given
+        client = _client(tmp_path, sample_rate=1.0)
+
+        # When
+        for event_id in range(3):
+            client.get(f"/events/{event_id}")
+
+        # Then
+        assert len(list(tmp_path.glob("*.collapsed"))) == 3
+
+    def test_does_not_profile_requests_with_a_malformed_token(self, tmp_path):
+        """
+        Tests a request whose profiling header is not even ASCII is served without being profiled.
+        """
+        # Given
+        client = _client(tmp_path, token_service=TokenService("profiling secret"))
+
+        # When
+        response = client.get("/events/1", headers={"X-Profile": b"\xe9\xff.\x80"})
+
+        # Then
+        assert response.json() == {"id": "1"}
+        assert not list(tmp_path.iterdir())
+
+    def test_stops_profiling_a_streamed_response_at_the_deadline(self, tmp_path):
+        """
+        Tests a streamed response outliving the maximum duration has its profile written while it is still streamed.
+        """
+        # Given
+        client = _client(tmp_path, sample_rate=1.0, max_duration=0.05)
+
+        # When
+        response = client.get("/events/1/updates")
+
+        # Then
+        assert response.text == "profiles: 1"
+        assert len(list(tmp_path.glob("*-GET-events_event_id_updates-200.collapsed"))) == 1
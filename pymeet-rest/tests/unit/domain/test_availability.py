@@ -0,0 +1,99 @@
+"""Availability
+
+Test cases for the option suggestions.
+"""
+import datetime
+import random
+
+import pytest
+
+from pymeet.domain import availability
+from pymeet.domain.availability import merge_windows, suggest_options
+
+START = datetime.datetime(2023, 5, 1)
+
+
+def _at(hours: float) -> datetime.datetime:
+    return START + datetime.timedelta(hours=hours)
+
+
+class TestSuggestOptions:
+    """
+    Option Suggestions Test Suite
+    """
+
+    def test_overlapping_windows_are_merged(self):
+        """
+        Tests overlapping and touching windows of an attendee are merged.
+        """
+        # Given
+        windows = [(_at(5), _at(6)), (_at(1), _at(3)), (_at(2), _at(4)), (_at(4), _at(4.5))]
+
+        # When
+        merged = merge_windows(windows)
+
+        # Then
+        assert merged == [(_at(1), _at(4.5)), (_at(5), _at(6))]
+
+    def test_suggests_hours_most_attendees_cover_whole(self):
+        """
+        Tests attendees count once per hour, only for the hours their windows cover whole, and ties go to earlier hours.
+        """
+        # Given
+        windows = [
+            [(_at(9), _at(12)), (_at(10), _at(11))],
+            [(_at(10.5), _at(13))],
+            [(_at(11), _at(12)), (_at(15), _at(16))],
+        ]
+
+        # When
+        suggestions = suggest_options(windows, START, hours=24, k=3)
+
+        # Then
+        assert [(option.date, option.hour, attendees) for option, attendees in suggestions] == [
+            (datetime.date(2023, 5, 1), 11, 3),
+            (datetime.date(2023, 5, 1), 9, 1),
+            (datetime.date(2023, 5, 1), 10, 1),
+        ]
+
+    def test_python_fallback_matches_numpy(self, monkeypatch):
+        """
+        Tests the suggestions are the same with and without NumPy.
+        """
+        # Given
+        randomness = random.Random(3)
+        windows = [[(_at(start), _at(start + randomness.uniform(0.5, 12)))
+                    for start in (randomness.uniform(-24, 24 * 14) for _ in range(4))]
+                   for _ in range(100)]
+        vectorized = suggest_options(windows, START, hours=24 * 14, k=10)
+
+        # When
+        monkeypatch.setattr(availability, "np", None)
+        fallback = suggest_options(windows, START, hours=24 * 14, k=10)
+
+        # Then
+        assert [(o.date, o.hour, n) for o, n in fallback] == [(o.date, o.hour, n) for o, n in vectorized]
+
+    @pytest.mark.parametrize("numpy", [True, False])
+    def test_hours_nobody_covers_are_not_suggested(self, monkeypatch, numpy):
+        """
+        Tests only covered hours are suggested, even when fewer than asked for, with and without NumPy.
+        """
+        # Given
+        if not numpy:
+            monkeypatch.setattr(availability, "np", None)
+
+        # When
+        suggestions = suggest_options([[(_at(10), _at(11))]], START, hours=24, k=5)
+
+        # Then
+        assert [(option.date, option.hour, attendees) for option, attendees in suggestions] == [
+            (datetime.date(2023, 5, 1), 10, 1),
+        ]
+
+    @pytest.mark.parametrize("hours, k", [(0, 3), (24, 0)])
+    def test_empty_horizon_suggests_nothing(self, hours, k):
+        """
+        Tests there is nothing to suggest without hours or without room for suggestions.
+        """
+        assert suggest_options([[(_at(0), _at(5))]], START, hours=hours, k=k) == []
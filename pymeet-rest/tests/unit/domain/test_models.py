@@ -150,3 +150,84 @@ class TestMeetingEventDomain:
 
         # Then
         assert user in event.attendees
+
+    def test_user_can_change_vote(self):
+        """
+        Tests a second vote replaces the first one, and repeating a vote is rejected.
+        """
+        # Given
+        option_a = MeetingEventOption(date=datetime.date(2021, 1, 1), hour=10)
+        option_b = MeetingEventOption(date=datetime.date(2021, 1, 2), hour=10)
+        user = User(username="Me", email="me@mail", password="a_fake_password")
+        event = MeetingEvent(name="Test Event", options=[option_a, option_b], attendees={user})
+        event.vote(voter=user, option=option_a)
+
+        # When
+        event.vote(voter=user, option=MeetingEventOption(date=datetime.date(2021, 1, 2), hour=10))
+
+        # Then
+        assert user not in option_a.votes
+        assert user in option_b.votes
+        assert event.current_leader() is option_b
+
+        with pytest.raises(IllegalVoteError):
+            event.vote(voter=user, option=option_b)
+
+    def test_leader_is_first_option_to_reach_the_most_votes(self):
+        """
+        Tests ties are won by the option which reached the count first, and the leader follows changed votes.
+        """
+        # Given
+        option_a = MeetingEventOption(date=datetime.date(2021, 1, 1), hour=10)
+        option_b = MeetingEventOption(date=datetime.date(2021, 1, 2), hour=10)
+        user_a = User(username="Me", email="an@email.com", password="a_fake_password")
+        user_b = User(username="You", email="another@email.com", password="a_fake_password")
+        event = MeetingEvent(name="Test Event", options=[option_a, option_b], attendees={user_a, user_b})
+
+        # When
+        event.vote(voter=user_a, option=option_b)
+        event.vote(voter=user_b, option=option_a)
+        tied_leader = event.current_leader()
+        event.vote(voter=user_a, option=option_a)
+
+        # Then
+        assert tied_leader is option_b
+        assert event.current_leader() is option_a
+        assert event.close_voting() == datetime.datetime(2021, 1, 1, 10)
+
+    def test_identity_is_stable_while_the_event_changes(self):
+        """
+        Tests events are equal and hashed by id, whatever else changes.
+        """
+        # Given
+        user = User(username="Me", email="an@email.com", password="a_fake_password")
+        event = MeetingEvent(name="Test Event", options=list(), event_id="event")
+        events = {event}
+
+        # When
+        event.add_attendee(user)
+        event.name = "Renamed Event"
+
+        # Then
+        assert event in events
+        assert event == MeetingEvent(name="Another Event", options=list(), event_id="event")
+        assert event != MeetingEvent(name="Renamed Event", options=list())
+
+    def test_events_are_ordered_by_voted_date(self):
+        """
+        Tests events are ordered by voted date, with the ones without a voted date last.
+        """
+        # Given
+        early = MeetingEvent(name="Early", options=list(), voted_date=datetime.datetime(2021, 1, 1, 10))
+        late = MeetingEvent(name="Late", options=list(), voted_date=datetime.datetime(2021, 1, 2, 10))
+        undecided = MeetingEvent(name="Undecided", options=list())
+
+        # When / Then
+        assert sorted([undecided, late, early]) == [early, late, undecided]
+        assert early <= late and late >= early and early <= early
+
+    def test_option_date_defaults_to_today(self):
+        """
+        Tests options without a date are proposed for the day they are created.
+        """
+        assert MeetingEventOption(hour=10).date == datetime.date.today()
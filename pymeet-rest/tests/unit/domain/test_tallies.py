@@ -0,0 +1,150 @@
+"""Tallies
+
+Test cases for the vote tallies.
+"""
+import datetime
+import random
+
+import pytest
+
+from pymeet.domain.errors import IllegalVoteError
+from pymeet.domain.models import MeetingEvent, MeetingEventOption, User
+from pymeet.domain.tallies import BucketVoteTally, PackedVoteTally
+
+
+def _event(tally, attendees: int, options: int) -> MeetingEvent:
+    users = {User(username=f"user{i}", email=f"user{i}@mail.com", password="password") for i in range(attendees)}
+    return MeetingEvent(name="Test Event",
+                        options=[MeetingEventOption(date=datetime.date(2021, 1, 1 + i), hour=10)
+                                 for i in range(options)],
+                        attendees=users,
+                        tally=tally)
+
+
+class TestPackedVoteTally:
+    """
+    Packed Vote Tally Test Suite
+    """
+
+    def test_counts_like_the_bucket_tally(self):
+        """
+        Tests both tallies agree on counts, participation and leader after random votes and revotes.
+        """
+        # Given
+        randomness = random.Random(7)
+        bucket_event, packed_event = _event(BucketVoteTally, 50, 8), _event(PackedVoteTally, 50, 8)
+        users = sorted(bucket_event.attendees, key=lambda user: user.username)
+        options = list(bucket_event.options)
+
+        for _ in range(300):
+            # When
+            voter, option = randomness.choice(users), randomness.choice(options)
+
+            try:
+                bucket_event.vote(voter, option)
+            except IllegalVoteError:
+                with pytest.raises(IllegalVoteError):
+                    packed_event.vote(voter, option)
+            else:
+                packed_event.vote(voter, option)
+
+            # Then
+            assert bucket_event.tallies() == packed_event.tallies()
+            assert bucket_event.tally.participation() == packed_event.tally.participation()
+            assert bucket_event.current_leader() == packed_event.current_leader()
+
+        assert bucket_event.close_voting() == packed_event.close_voting()
+
+    def test_keeps_preloaded_votes(self):
+        """
+        Tests votes already in the options are counted, and taken out of the options.
+        """
+        # Given
+        user = User(username="Me", email="me@mail", password="a_fake_password")
+        option = MeetingEventOption(date=datetime.date(2021, 1, 1), hour=10, votes=[user])
+        other = MeetingEventOption(date=datetime.date(2021, 1, 2), hour=10)
+
+        # When
+        event = MeetingEvent(name="Test Event", options=[other, option], attendees={user}, tally=PackedVoteTally)
+
+        # Then
+        assert event.votes_for(option) == 1
+        assert event.current_leader() is option
+        assert not option.votes
+
+    def test_grows_from_zero_capacity(self):
+        """
+        Tests a tally created without room for any voter grows to count every vote.
+        """
+        # Given
+        event = _event(lambda options: PackedVoteTally(options, initial_capacity=0), 3, 2)
+        users = sorted(event.attendees, key=lambda user: user.username)
+        options = list(event.options)
+
+        # When
+        for user in users:
+            event.vote(user, options[0])
+        event.vote(users[0], options[1])
+
+        # Then
+        assert event.tallies() == {options[0]: 2, options[1]: 1}
+        assert event.tally.participation() == 3
+
+
+class TestVoteTallyBallots:
+    """
+    Vote Tally Ballots Test Suite
+    """
+
+    @pytest.mark.parametrize("tally", [BucketVoteTally, PackedVoteTally])
+    def test_voting_the_ballots_again_ranks_the_options_the_same(self, tally):
+        """
+        Tests voting the ballots of a tally into a fresh one gives the same counts and leader.
+        """
+        # Given
+        randomness = random.Random(11)
+        event, replayed = _event(tally, 40, 6), _event(tally, 40, 6)
+        users = sorted(event.attendees, key=lambda user: user.username)
+        options = list(event.options)
+
+        for _ in range(200):
+            try:
+                event.vote(randomness.choice(users), randomness.choice(options))
+            except IllegalVoteError:
+                pass
+
+        # When
+        for voter, option in event.tally.ballots():
+            replayed.vote(voter, replayed.options[option])
+
+        # Then
+        assert replayed.tallies() == event.tallies()
+        assert replayed.tally.participation() == event.tally.participation()
+        assert replayed.current_leader() == event.current_leader()
+
+
+class TestVoteTallyChoices:
+    """
+    Vote Tally Choices Test Suite
+    """
+
+    @pytest.mark.parametrize("tally", [BucketVoteTally, PackedVoteTally])
+    def test_tells_the_option_each_voter_picked(self, tally):
+        """
+        Tests the choice of a voter follows their votes, and is None for a voter who did not vote.
+        """
+        # Given
+        event = _event(tally, 3, 3)
+        users = sorted(event.attendees, key=lambda user: user.username)
+        options = list(event.options)
+
+        # When
+        event.vote(users[0], options[1])
+        event.vote(users[1], options[2])
+        event.vote(users[0], options[0])
+
+        # Then
+        assert event.tally.choice(users[0]) == options[0]
+        assert event.tally.choice(users[1]) == options[2]
+        assert event.tally.choice(users[2]) is None
+        assert event.tally.choice(User(username="stranger", email="stranger@mail.com", password="password")) is None
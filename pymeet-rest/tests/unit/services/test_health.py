@@ -0,0 +1,54 @@
+"""
+Health Service Test
+"""
+import pytest
+from anyio import CapacityLimiter, create_task_group, sleep
+
+from pymeet.services.health import Saturation, encoder_saturation, limiter_saturation
+from pymeet.services.password_encoder import EncoderStats
+
+
+@pytest.mark.anyio
+class TestSaturation:
+    """
+    Unit test suite for the pool saturation measures.
+    """
+
+    async def test_counts_borrowed_and_waiting_tokens(self):
+        """
+        Tests a limiter is saturated once its borrowed and waited for tokens reach the threshold.
+        """
+        # Given
+        limiter = CapacityLimiter(2)
+
+        async def hold():
+            async with limiter:
+                await sleep(0.05)
+
+        # When
+        async with create_task_group() as group:
+            for _ in range(3):
+                group.start_soon(hold)
+            await sleep(0.01)
+            busy = limiter_saturation(limiter, threshold=0.9)
+
+        idle = limiter_saturation(limiter, threshold=0.9)
+
+        # Then
+        assert (busy.used, busy.capacity, busy.ratio, busy.saturated) == (3, 2, 1.5, True)
+        assert (idle.used, idle.saturated) == (0, False)
+
+    async def test_measures_the_hashing_queue(self):
+        """
+        Tests an encoder queue is saturated from the threshold share of its size, and always when it has no room.
+        """
+        # Given
+        stats = EncoderStats(queue_depth=9, max_queue_size=10, completed=0, rejected=0, mean_latency=0.0,
+                             max_latency=0.0)
+
+        # When
+        saturations = [encoder_saturation(stats, threshold) for threshold in (0.9, 0.95)]
+
+        # Then
+        assert [saturation.saturated for saturation in saturations] == [True, False]
+        assert Saturation(used=0, capacity=0, threshold=0.9).saturated
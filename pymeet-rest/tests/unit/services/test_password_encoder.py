@@ -0,0 +1,187 @@
+"""
+Password Encoder Test
+"""
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pymeet.adapters.metrics import Histogram
+from pymeet.services.password_encoder import (
+    BcryptPasswordEncoder,
+    EncoderOverloadedException,
+    InvalidPasswordException,
+    PasswordEncoder,
+    PlainPasswordEncoder,
+    PooledPasswordEncoder,
+    calibrate_bcrypt_rounds,
+)
+
+
+class ReversingPasswordEncoder(PasswordEncoder):
+    """
+    A cheap, deterministic password encoder.
+    """
+
+    def encode(self, password: str) -> str:
+        return password[::-1]
+
+    def verify(self, password: str, encoded_password: str):
+        pass
+
+
+@pytest.mark.anyio
+class TestPooledPasswordEncoder:
+    """
+    Unit test suite for the pooled password encoder.
+    """
+
+    async def test_encodes_in_executor(self):
+        """
+        Tests passwords are encoded by the wrapped encoder inside the executor.
+        """
+        # Given
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            encoder = PooledPasswordEncoder(ReversingPasswordEncoder(), executor=executor)
+
+            # When
+            encoded = await encoder.encode("password1")
+
+        # Then
+        assert encoded == "1drowssap"
+        assert encoder.stats.completed == 1
+        assert encoder.stats.queue_depth == 0
+
+    async def test_rejects_when_queue_is_full(self):
+        """
+        Tests calls are rejected once the queue is full.
+        """
+        # Given
+        encoder = PooledPasswordEncoder(ReversingPasswordEncoder(), max_queue_size=0, retry_after=5)
+
+        # When
+        with pytest.raises(EncoderOverloadedException) as error:
+            await encoder.encode("password1")
+
+        # Then
+        assert error.value.retry_after == 5
+        assert encoder.stats.rejected == 1
+        assert encoder.stats.completed == 0
+
+    async def test_batch_takes_a_slot_per_chunk(self):
+        """
+        Tests a batch is admitted against the chunks it encodes rather than its passwords, one per worker, and keeps
+        their slots while it is encoded.
+        """
+        # Given
+        encoder = PooledPasswordEncoder(ReversingPasswordEncoder(), max_queue_size=2, parallelism=2)
+        depths = []
+        encoder.encoder.encode = lambda password: depths.append(encoder.stats.queue_depth) or password[::-1]
+
+        # When
+        encoded = await encoder.encode_many([f"password{i}" for i in range(5)])
+        encoder.parallelism = 3
+
+        with pytest.raises(EncoderOverloadedException):
+            await encoder.encode_many([f"password{i}" for i in range(5)])
+
+        # Then
+        assert encoded == [f"{i}drowssap" for i in range(5)]
+        assert depths[0] == 2
+        assert encoder.stats.queue_depth == 0
+        assert encoder.stats.rejected == 1
+
+    async def test_observes_latency_by_operation(self):
+        """
+        Tests the latency of each call is observed under its operation.
+        """
+        # Given
+        latency = Histogram("encoder_seconds", "Encoder latency.", ("operation",))
+        encoder = PooledPasswordEncoder(ReversingPasswordEncoder(), parallelism=2, latency=latency)
+
+        # When
+        await encoder.encode("password1")
+        await encoder.verify("password1", "1drowssap")
+        await encoder.encode_many(["password1", "password2", "password3"])
+
+        # Then
+        assert latency.labels("encode").count == 1
+        assert latency.labels("verify").count == 1
+        assert latency.labels("encode_many").count == 2
+
+
+class TestBcryptPasswordEncoder:
+    """
+    Unit test suite for the bcrypt password encoder.
+    """
+
+    def test_rehashes_passwords_encoded_with_another_cost(self):
+        """
+        Tests a password encoded with an outdated cost is encoded again on verification.
+        """
+        # Given
+        password = "password1"
+        old_encoding = BcryptPasswordEncoder(rounds=4).encode(password)
+        encoder = BcryptPasswordEncoder(rounds=5)
+
+        # When
+        new_encoding = encoder.verify(password, old_encoding)
+
+        # Then
+        assert new_encoding.startswith("$2b$05$")
+        assert encoder.verify(password, new_encoding) is None
+
+    def test_rejects_wrong_password(self):
+        """
+        Tests a password which does not match its encoding is rejected.
+        """
+        # Given
+        encoder = BcryptPasswordEncoder(rounds=4)
+
+        # When / Then
+        with pytest.raises(InvalidPasswordException):
+            encoder.verify("wrong_password", encoder.encode("password1"))
+
+    def test_survives_pickling_with_its_cost(self):
+        """
+        Tests the cost is kept when the encoder is sent to a worker process.
+        """
+        # Given
+        encoder = BcryptPasswordEncoder(rounds=5)
+
+        # When
+        copy = pickle.loads(pickle.dumps(encoder))
+
+        # Then
+        assert copy.encode("password1").startswith("$2b$05$")
+
+
+class TestPlainPasswordEncoder:
+    """
+    Unit test suite for the plain password encoder.
+    """
+
+    def test_verifies_only_the_same_password(self):
+        """
+        Tests a password is kept as it is and only verifies against itself.
+        """
+        # Given
+        encoder = PlainPasswordEncoder()
+
+        # When
+        encoded = encoder.encode("password1")
+
+        # Then
+        assert encoded == "password1"
+        assert encoder.verify("password1", encoded) is None
+
+        with pytest.raises(InvalidPasswordException):
+            encoder.verify("password2", encoded)
+
+
+def test_calibration_stays_within_bounds():
+    """
+    Tests the calibrated cost never leaves the configured bounds.
+    """
+    assert calibrate_bcrypt_rounds(target_latency=1e-6, min_rounds=4, max_rounds=6) == 4
+    assert calibrate_bcrypt_rounds(target_latency=60.0, min_rounds=4, max_rounds=6) == 6
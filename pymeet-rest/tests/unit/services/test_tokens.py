@@ -0,0 +1,64 @@
+"""
+Token Service Test
+"""
+import pytest
+
+from pymeet.services.tokens import InvalidTokenException, TokenService
+
+
+class TestTokenService:
+    """
+    Unit test suite for the session token service.
+    """
+
+    def test_issued_token_is_valid(self):
+        """
+        Tests a token issued by the service is accepted by it.
+        """
+        # Given
+        service = TokenService(secret_key="secret", ttl=60)
+
+        # When
+        token, claims = service.issue("user1")
+
+        # Then
+        assert service.validate(token) == claims
+        assert claims.subject == "user1"
+
+    def test_token_signed_with_another_key_is_rejected(self):
+        """
+        Tests a token is only valid for the key which signed it.
+        """
+        # Given
+        token, _ = TokenService(secret_key="another secret").issue("user1")
+
+        # When / Then
+        with pytest.raises(InvalidTokenException):
+            TokenService(secret_key="secret").validate(token)
+
+    def test_expired_token_is_rejected(self):
+        """
+        Tests a token cannot be used once expired.
+        """
+        # Given
+        service = TokenService(secret_key="secret", ttl=-1)
+        token, _ = service.issue("user1")
+
+        # When / Then
+        with pytest.raises(InvalidTokenException):
+            service.validate(token)
+
+    def test_malformed_token_is_rejected(self):
+        """
+        Tests garbage is rejected rather than crashing the validation.
+        """
+        with pytest.raises(InvalidTokenException):
+            TokenService(secret_key="secret").validate("not a token")
+
+    @pytest.mark.parametrize("token", ["\xe9.abc", "abc.\xe9", "\udce9.abc"])
+    def test_non_ascii_token_is_rejected(self, token):
+        """
+        Tests a token with characters outside ASCII is rejected rather than crashing the validation.
+        """
+        with pytest.raises(InvalidTokenException):
+            TokenService(secret_key="secret").validate(token)